@@ -1,4 +1,4 @@
-from lightning.app.components.database.client import DatabaseClient
+from lightning.app.components.database.client import AsyncDatabaseClient, DatabaseClient
 from lightning.app.components.database.server import Database
 from lightning.app.components.multi_node import (
     FabricMultiNode,
@@ -12,6 +12,12 @@ from lightning.app.components.serve.auto_scaler import AutoScaler
 from lightning.app.components.serve.cold_start_proxy import ColdStartProxy
 from lightning.app.components.serve.gradio_server import ServeGradio
 from lightning.app.components.serve.python_server import Category, Image, Number, PythonServer, Text
+from lightning.app.components.serve.scheduling import (
+    LatencyWeighted,
+    LeastOutstandingRequests,
+    PowerOfTwoChoices,
+    SchedulingPolicy,
+)
 from lightning.app.components.serve.serve import ModelInferenceAPI
 from lightning.app.components.serve.streamlit import ServeStreamlit
 from lightning.app.components.training import LightningTrainerScript, PyTorchLightningScriptRunner
@@ -19,6 +25,11 @@ from lightning.app.components.training import LightningTrainerScript, PyTorchLig
 __all__ = [
     "AutoScaler",
     "ColdStartProxy",
+    "SchedulingPolicy",
+    "LeastOutstandingRequests",
+    "PowerOfTwoChoices",
+    "LatencyWeighted",
+    "AsyncDatabaseClient",
     "DatabaseClient",
     "Database",
     "PopenPythonScript",
@@ -1,4 +1,4 @@
-from lightning.app.components.database.client import DatabaseClient
+from lightning.app.components.database.client import AsyncDatabaseClient, DatabaseClient
 from lightning.app.components.database.server import Database
 
-__all__ = ["Database", "DatabaseClient"]
+__all__ = ["AsyncDatabaseClient", "Database", "DatabaseClient"]
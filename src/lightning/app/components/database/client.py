@@ -12,17 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Union
 
 import requests
+from fastapi.encoders import jsonable_encoder
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from lightning.app.components.database.utilities import _GeneralModel
+from lightning.app.utilities.imports import _is_aiohttp_available, requires
+
+if _is_aiohttp_available():
+    import aiohttp
 
 _CONNECTION_RETRY_TOTAL = 5
 _CONNECTION_RETRY_BACKOFF_FACTOR = 1
+# Number of rows sent with each request of the bulk operations
+_BULK_BATCH_SIZE = 1000
+_HEADERS = {"Content-Type": "application/json"}
 
 
 def _configure_session() -> Session:
@@ -61,6 +70,51 @@ class DatabaseClient:
         assert resp.status_code == 200
         return [cls(**data) for data in resp.json()]
 
+    def select(
+        self,
+        model: Optional[Type[T]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ) -> List[T]:
+        """Returns the rows matching the filters.
+
+        Arguments:
+            model: The model of the rows, by default the model of the client.
+            where: A mapping from the fields to their value, or to a list of the values they can take.
+            limit: The maximum number of rows returned.
+            offset: The number of rows skipped.
+            order_by: The fields the rows are ordered by, prefixed with ``-`` for a descending order.
+        """
+        cls = model if model else self.model
+        resp = self.session.post(
+            self.db_url + "/select/",
+            data=_query(cls, self.token, where, limit, offset, order_by).json(),
+        )
+        assert resp.status_code == 200, resp.text
+        return [cls(**data) for data in resp.json()]
+
+    def select_iter(
+        self,
+        model: Optional[Type[T]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ) -> Iterator[T]:
+        """Same as :meth:`select`, but the rows are streamed by the server and yielded as they are received."""
+        cls = model if model else self.model
+        with self.session.post(
+            self.db_url + "/select_stream/",
+            data=_query(cls, self.token, where, limit, offset, order_by).json(),
+            stream=True,
+        ) as resp:
+            assert resp.status_code == 200, resp.text
+            for line in resp.iter_lines():
+                if line:
+                    yield cls(**json.loads(line))
+
     def insert(self, model: T) -> None:
         resp = self.session.post(
             self.db_url + "/insert/",
@@ -82,6 +136,26 @@ class DatabaseClient:
         )
         assert resp.status_code == 200
 
+    def insert_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        """Inserts the models with one request and one transaction per batch."""
+        self._post_many("/insert_many/", models, batch_size)
+
+    def update_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        """Updates the models with one request and one transaction per batch."""
+        self._post_many("/update_many/", models, batch_size)
+
+    def delete_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        """Deletes the models with one request and one transaction per batch."""
+        self._post_many("/delete_many/", models, batch_size)
+
+    def _post_many(self, endpoint: str, models: Sequence[T], batch_size: int) -> None:
+        for start in range(0, len(models), batch_size):
+            resp = self.session.post(
+                self.db_url + endpoint,
+                data=_GeneralModel.from_objs(models[start : start + batch_size], token=self.token).json(),
+            )
+            assert resp.status_code == 200, resp.text
+
     @property
     def session(self):
         if self._session is None:
@@ -90,3 +164,127 @@ class DatabaseClient:
 
     def to_dict(self) -> Dict[str, Any]:
         return {"db_url": self.db_url, "model": self.model.__name__ if self.model else None}
+
+
+class AsyncDatabaseClient:
+    """The asyncio counterpart of the :class:`DatabaseClient`, which sends the requests through a pool of keep-alive
+    connections to the database. Many requests can be in flight concurrently, e.g., with :func:`asyncio.gather`.
+
+    Arguments:
+        db_url: The URL of the :class:`~lightning.app.components.database.server.Database`.
+        token: The token protecting the access to the database.
+        model: The model used when none is passed.
+        max_connections: The maximum number of connections opened to the database.
+
+    Example::
+
+        async with AsyncDatabaseClient(db_url, token=token, model=TrialModel) as client:
+            await asyncio.gather(*(client.insert(trial) for trial in trials))
+            best = await client.select(order_by="-score", limit=10)
+    """
+
+    @requires(["aiohttp"])
+    def __init__(
+        self, db_url: str, token: Optional[str] = None, model: Optional[T] = None, max_connections: int = 10
+    ) -> None:
+        self.db_url = db_url
+        self.model = model
+        self.token = token or ""
+        self.max_connections = max_connections
+        self._session = None
+
+    async def select_all(self, model: Optional[Type[T]] = None) -> List[T]:
+        cls = model if model else self.model
+        return [cls(**data) for data in await self._post("/select_all/", _GeneralModel.from_cls(cls, self.token))]
+
+    async def select(
+        self,
+        model: Optional[Type[T]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ) -> List[T]:
+        """Returns the rows matching the filters, see :meth:`DatabaseClient.select`."""
+        cls = model if model else self.model
+        rows = await self._post("/select/", _query(cls, self.token, where, limit, offset, order_by))
+        return [cls(**data) for data in rows]
+
+    async def select_iter(
+        self,
+        model: Optional[Type[T]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+    ) -> AsyncIterator[T]:
+        """Same as :meth:`select`, but the rows are streamed by the server and yielded as they are received."""
+        cls = model if model else self.model
+        data = _query(cls, self.token, where, limit, offset, order_by).json()
+        async with self._get_session().post(self.db_url + "/select_stream/", data=data, headers=_HEADERS) as resp:
+            assert resp.status == 200, await resp.text()
+            async for line in resp.content:
+                if line.strip():
+                    yield cls(**json.loads(line))
+
+    async def insert(self, model: T) -> None:
+        await self._post("/insert/", _GeneralModel.from_obj(model, token=self.token))
+
+    async def update(self, model: T) -> None:
+        await self._post("/update/", _GeneralModel.from_obj(model, token=self.token))
+
+    async def delete(self, model: T) -> None:
+        await self._post("/delete/", _GeneralModel.from_obj(model, token=self.token))
+
+    async def insert_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        await self._post_many("/insert_many/", models, batch_size)
+
+    async def update_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        await self._post_many("/update_many/", models, batch_size)
+
+    async def delete_many(self, models: Sequence[T], batch_size: int = _BULK_BATCH_SIZE) -> None:
+        await self._post_many("/delete_many/", models, batch_size)
+
+    async def close(self) -> None:
+        """Closes the connections kept open to the database."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncDatabaseClient":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def _post_many(self, endpoint: str, models: Sequence[T], batch_size: int) -> None:
+        for start in range(0, len(models), batch_size):
+            await self._post(endpoint, _GeneralModel.from_objs(models[start : start + batch_size], token=self.token))
+
+    async def _post(self, endpoint: str, data: _GeneralModel) -> Any:
+        async with self._get_session().post(self.db_url + endpoint, data=data.json(), headers=_HEADERS) as resp:
+            assert resp.status == 200, await resp.text()
+            return await resp.json()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # the session is created lazily so that it is bound to the running event loop
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"db_url": self.db_url, "model": self.model.__name__ if self.model else None}
+
+
+def _query(
+    cls: Type[T],
+    token: str,
+    where: Optional[Dict[str, Any]],
+    limit: Optional[int],
+    offset: Optional[int],
+    order_by: Optional[Union[str, List[str]]],
+) -> _GeneralModel:
+    return _GeneralModel.from_query(
+        cls, token, where=jsonable_encoder(where), limit=limit, offset=offset, order_by=order_by
+    )
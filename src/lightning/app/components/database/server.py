@@ -25,7 +25,19 @@ import uvicorn
 from fastapi import FastAPI
 from uvicorn import run
 
-from lightning.app.components.database.utilities import _create_database, _Delete, _Insert, _SelectAll, _Update
+from lightning.app.components.database.utilities import (
+    _create_database,
+    _Delete,
+    _DeleteMany,
+    _Insert,
+    _InsertMany,
+    _Select,
+    _SelectAll,
+    _SelectStream,
+    _Update,
+    _UpdateMany,
+)
+from lightning.app.components.database.wal import _IncrementalStore
 from lightning.app.core.work import LightningWork
 from lightning.app.storage import Drive
 from lightning.app.utilities.app_helpers import Logger
@@ -66,6 +78,7 @@ class Database(LightningWork):
         db_filename: str = "database.db",
         store_interval: int = 10,
         debug: bool = False,
+        incremental_store: bool = False,
     ) -> None:
         """The Database Component enables to interact with an SQLite database to store some structured information
         about your application.
@@ -78,6 +91,9 @@ class Database(LightningWork):
             store_interval: Time interval (in seconds) at which the database is periodically synchronized to the Drive.
                             Note that the database is also always synchronized on exit.
             debug: Whether to run the database in debug mode.
+            incremental_store: Whether to run the database in WAL journal mode and to only synchronize the changes
+                            of its write-ahead log to the Drive, instead of a full copy of the database each time.
+                            The reads and the writes aren't blocked while the database is synchronized.
 
         Example::
 
@@ -164,11 +180,20 @@ class Database(LightningWork):
         self._root_folder = os.path.dirname(db_filename)
         self.debug = debug
         self.store_interval = store_interval
+        self.incremental_store = incremental_store
         self._models = models if isinstance(models, list) else [models]
         self._store_thread = None
         self._exit_event = None
+        self._incremental_store = None
 
     def store_database(self):
+        if self._incremental_store is not None:
+            try:
+                self._incremental_store.store()
+            except Exception:
+                print(traceback.print_exc())
+            return
+
         try:
             with tempfile.TemporaryDirectory() as tmpdir:
                 tmp_db_filename = os.path.join(tmpdir, os.path.basename(self.db_filename))
@@ -199,20 +224,30 @@ class Database(LightningWork):
         Arguments:
             token: Token used to protect the database access. Ensure you don't expose it through the App State.
         """
-        drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
-        filenames = drive.list(component_name=self.name)
-        if self.db_filename in filenames:
-            drive.get(self.db_filename)
+        if self.incremental_store and _IncrementalStore.restore(self.db_filename, self.name):
             print("Retrieved the database from Drive.")
+        else:
+            drive = Drive("lit://database", component_name=self.name, root_folder=self._root_folder)
+            filenames = drive.list(component_name=self.name)
+            if self.db_filename in filenames:
+                drive.get(self.db_filename)
+                print("Retrieved the database from Drive.")
 
         app = FastAPI()
 
-        _create_database(self.db_filename, self._models, self.debug)
+        _create_database(self.db_filename, self._models, self.debug, wal=self.incremental_store)
+        if self.incremental_store:
+            self._incremental_store = _IncrementalStore(self.db_filename, self.name)
         models = {m.__name__: m for m in self._models}
         app.post("/select_all/")(_SelectAll(models, token))
         app.post("/insert/")(_Insert(models, token))
         app.post("/update/")(_Update(models, token))
         app.post("/delete/")(_Delete(models, token))
+        app.post("/select/")(_Select(models, token))
+        app.post("/select_stream/")(_SelectStream(models, token))
+        app.post("/insert_many/")(_InsertMany(models, token))
+        app.post("/update_many/")(_UpdateMany(models, token))
+        app.post("/delete_many/")(_DeleteMany(models, token))
 
         sys.modules["uvicorn.main"].Server = _DatabaseUvicornServer
 
@@ -239,3 +274,5 @@ class Database(LightningWork):
         self._exit_event.set()
         with _lock:
             self.store_database()
+        if self._incremental_store is not None:
+            self._incremental_store.close()
@@ -19,6 +19,7 @@ from typing import Any, Dict, Generic, List, Type, TypeVar
 
 from fastapi import Response, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, parse_obj_as
 from pydantic.main import ModelMetaclass
 
@@ -26,12 +27,16 @@ from lightning.app.utilities.app_helpers import Logger
 from lightning.app.utilities.imports import _is_sqlmodel_available
 
 if _is_sqlmodel_available():
+    from sqlalchemy import delete
     from sqlalchemy.inspection import inspect as sqlalchemy_inspect
     from sqlmodel import JSON, select, Session, SQLModel, TypeDecorator
 
 logger = Logger(__name__)
 engine = None
 
+_STREAM_BATCH_SIZE = 1000
+_DELETE_BATCH_SIZE = 500
+
 T = TypeVar("T")
 
 
@@ -153,6 +158,26 @@ class _GeneralModel(BaseModel):
             }
         )
 
+    @classmethod
+    def from_objs(cls, objs, token):
+        return cls(
+            **{
+                "cls_name": objs[0].__class__.__name__,
+                "data": "[" + ",".join(obj.json() for obj in objs) + "]",
+                "token": token,
+            }
+        )
+
+    @classmethod
+    def from_query(cls, obj_cls, token, **query):
+        return cls(
+            **{
+                "cls_name": obj_cls.__name__,
+                "data": json.dumps(query),
+                "token": token,
+            }
+        )
+
     @classmethod
     def from_cls(cls, obj_cls, token):
         return cls(
@@ -212,17 +237,7 @@ class _Update:
 
         with Session(engine) as session:
             update_data = self.models[data["cls_name"]].parse_raw(data["data"])
-            primary_key = _get_primary_key(update_data.__class__)
-            identifier = getattr(update_data.__class__, primary_key, None)
-            statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
-            results = session.exec(statement)
-            result = results.one()
-            for k, v in vars(update_data).items():
-                if k in ("id", "_sa_instance_state"):
-                    continue
-                if getattr(result, k) != v:
-                    setattr(result, k, v)
-            session.add(result)
+            result = _update_row(session, update_data)
             session.commit()
             session.refresh(result)
 
@@ -248,13 +263,174 @@ class _Delete:
             session.commit()
 
 
-def _create_database(db_filename: str, models: List[Type["SQLModel"]], echo: bool = False):
+class _Select:
+    """Selects the rows matching the ``where`` filters of the query, ordered and paginated."""
+
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        try:
+            statement = _select_statement(cls, json.loads(data["data"] or "{}"))
+        except ValueError as e:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"status": "failure", "reason": str(e)}
+
+        with Session(engine) as session:
+            return session.exec(statement).all()
+
+
+class _SelectStream:
+    """Streams the rows matching the query as newline-delimited JSON, without loading all of them in memory."""
+
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        try:
+            statement = _select_statement(cls, json.loads(data["data"] or "{}"))
+        except ValueError as e:
+            response.status_code = status.HTTP_400_BAD_REQUEST
+            return {"status": "failure", "reason": str(e)}
+
+        def rows():
+            with Session(engine) as session:
+                results = session.exec(statement.execution_options(yield_per=_STREAM_BATCH_SIZE))
+                for partition in results.partitions():
+                    yield "".join(json.dumps(jsonable_encoder(row)) + "\n" for row in partition)
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+class _InsertMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        # all the rows are written in a single transaction
+        with Session(engine) as session:
+            session.add_all(_parse_models(self.models, data))
+            session.commit()
+
+
+class _UpdateMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        with Session(engine) as session:
+            for update_data in _parse_models(self.models, data):
+                _update_row(session, update_data)
+            session.commit()
+
+
+class _DeleteMany:
+    def __init__(self, models, token):
+        self.models = models
+        self.token = token
+
+    def __call__(self, data: Dict, response: Response):
+        if self.token and data["token"] != self.token:
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            return {"status": "failure", "reason": "Unauthorized request to the database."}
+
+        cls: Type["SQLModel"] = self.models[data["cls_name"]]
+        primary_key = _get_primary_key(cls)
+        identifier = getattr(cls, primary_key)
+        keys = [getattr(obj, primary_key) for obj in _parse_models(self.models, data)]
+        with Session(engine) as session:
+            # bounded by the maximum number of variables of an SQLite statement
+            for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+                session.execute(delete(cls).where(identifier.in_(keys[start : start + _DELETE_BATCH_SIZE])))
+            session.commit()
+
+
+def _parse_models(models: Dict[str, Type["SQLModel"]], data: Dict) -> List["SQLModel"]:
+    cls = models[data["cls_name"]]
+    return [cls.parse_obj(obj) for obj in json.loads(data["data"])]
+
+
+def _update_row(session: "Session", update_data: "SQLModel") -> "SQLModel":
+    primary_key = _get_primary_key(update_data.__class__)
+    identifier = getattr(update_data.__class__, primary_key, None)
+    statement = select(update_data.__class__).where(identifier == getattr(update_data, primary_key))
+    results = session.exec(statement)
+    result = results.one()
+    for k, v in vars(update_data).items():
+        if k in ("id", "_sa_instance_state"):
+            continue
+        if getattr(result, k) != v:
+            setattr(result, k, v)
+    session.add(result)
+    return result
+
+
+def _select_statement(cls: Type["SQLModel"], query: Dict[str, Any]) -> Any:
+    """Converts the query sent by the client into a statement.
+
+    The ``where`` filters map a field to its value, or to a list of the values it can take. The ``order_by`` fields are
+    prefixed with ``-`` for a descending order.
+    """
+    statement = select(cls)
+    for name, value in (query.get("where") or {}).items():
+        column = _get_column(cls, name)
+        statement = statement.where(column.in_(value) if isinstance(value, list) else column == value)
+    order_by = query.get("order_by") or []
+    for name in [order_by] if isinstance(order_by, str) else order_by:
+        column = _get_column(cls, name.lstrip("-"))
+        statement = statement.order_by(column.desc() if name.startswith("-") else column)
+    if query.get("limit") is not None:
+        statement = statement.limit(query["limit"])
+    if query.get("offset"):
+        statement = statement.offset(query["offset"])
+    return statement
+
+
+def _get_column(cls: Type["SQLModel"], name: str) -> Any:
+    if name not in cls.__fields__:
+        raise ValueError(f"The model {cls.__name__} doesn't have a field named `{name}`.")
+    return getattr(cls, name)
+
+
+def _create_database(db_filename: str, models: List[Type["SQLModel"]], echo: bool = False, wal: bool = False):
     global engine
 
+    from sqlalchemy import event
     from sqlmodel import create_engine
 
     engine = create_engine(f"sqlite:///{pathlib.Path(db_filename).resolve()}", echo=echo)
 
+    if wal:
+        # the readers don't block the writers, and the log is only checkpointed by the `_IncrementalStore`
+        @event.listens_for(engine, "connect")
+        def _set_journal_mode(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA wal_autocheckpoint=0")
+            cursor.close()
+
     logger.debug(f"Creating the following tables {models}")
     try:
         SQLModel.metadata.create_all(engine)
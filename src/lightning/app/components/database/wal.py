@@ -0,0 +1,240 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental storage of an SQLite database in WAL journal mode to a :class:`~lightning.app.storage.drive.Drive`.
+
+The database is stored as generations. Each generation starts with a base, a copy of the database, followed by the
+segments of its write-ahead log which were committed since, in order. The database is restored by placing the
+concatenated segments of the latest generation as the write-ahead log of its base, which SQLite replays when opening
+it. Once enough segments were stored, the log is checkpointed into the database and a new generation is started.
+
+Drive layout, for the database ``database.db``::
+
+    database.db.0.base
+    database.db.0.wal.0
+    database.db.0.wal.1
+    ...
+"""
+
+import os
+import re
+import sqlite3
+import struct
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from lightning.app.core.constants import DATABASE_COMPACTION_SIZE
+from lightning.app.storage import Drive
+from lightning.app.utilities.app_helpers import Logger
+
+logger = Logger(__name__)
+
+_WAL_HEADER_SIZE = 32
+_WAL_FRAME_HEADER_SIZE = 24
+
+
+class _IncrementalStore:
+    """Stores the database to the Drive of the given component, shipping only the new frames of its write-ahead log.
+
+    Arguments:
+        db_filename: The path of the SQLite database, which needs to be in WAL journal mode.
+        component_name: The name of the component owning the files in the Drive.
+        compaction_size: The number of bytes of write-ahead log stored after which a new base is stored.
+    """
+
+    def __init__(self, db_filename: str, component_name: str, compaction_size: int = DATABASE_COMPACTION_SIZE) -> None:
+        self.db_filename = db_filename
+        self.component_name = component_name
+        self.compaction_size = compaction_size
+        self._name = os.path.basename(db_filename)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._generation = -1
+        self._num_segments = 0
+        # the position in the write-ahead log up to which the frames were stored
+        self._offset = 0
+        # identifies the write-ahead log the segments are read from, as SQLite changes them when it restarts the log
+        self._salts: Optional[bytes] = None
+        self._stored_bytes = 0
+
+    @property
+    def wal_filename(self) -> str:
+        return f"{self.db_filename}-wal"
+
+    def store(self) -> None:
+        """Stores the frames committed since the previous call, or a new base when needed."""
+        if self._connection is None:
+            # an open connection prevents SQLite from removing the write-ahead log when the server closes its own
+            self._connection = sqlite3.connect(self.db_filename, check_same_thread=False)
+            self._connection.execute("PRAGMA wal_autocheckpoint=0")
+
+        if self._generation < 0 or self._stored_bytes >= self.compaction_size:
+            self._store_base()
+            return
+
+        header = _read_wal_header(self.wal_filename)
+        if header is not None:
+            page_size, salts = header
+            if self._salts is None:
+                self._salts = salts
+            elif salts != self._salts or os.path.getsize(self.wal_filename) < self._offset:
+                # the log was restarted, the frames which weren't stored were moved into the database
+                logger.debug("The write-ahead log of the database was restarted, storing a new base.")
+                self._store_base()
+                return
+            with open(self.wal_filename, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+            end = _committed_end(data, self._offset, page_size, salts)
+            if end > self._offset:
+                self._put(f"{self._name}.{self._generation}.wal.{self._num_segments}", data[: end - self._offset])
+                self._num_segments += 1
+                self._stored_bytes += end - self._offset
+                self._offset = end
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def restore(db_filename: str, component_name: str) -> bool:
+        """Restores the latest generation of the database stored in the Drive and returns whether one was found."""
+        name = os.path.basename(db_filename)
+        drive = Drive("lit://database", component_name=component_name)
+        generations = _list_generations(drive, name, component_name)
+        if not generations:
+            return False
+        generation = max(generations)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drive = Drive("lit://database", component_name=component_name, root_folder=tmpdir)
+            drive.get(f"{name}.{generation}.base", component_name=component_name)
+            wal_filename = os.path.join(tmpdir, f"{name}-wal")
+            with open(wal_filename, "wb") as wal:
+                for segment in generations[generation]:
+                    drive.get(segment, component_name=component_name)
+                    with open(os.path.join(tmpdir, segment), "rb") as f:
+                        wal.write(f.read())
+
+            db_tmp_filename = os.path.join(tmpdir, name)
+            os.replace(os.path.join(tmpdir, f"{name}.{generation}.base"), db_tmp_filename)
+            # SQLite replays the committed frames of the log when opening the database, they are then moved into it
+            connection = sqlite3.connect(db_tmp_filename)
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            connection.close()
+
+            os.makedirs(os.path.dirname(os.path.abspath(db_filename)), exist_ok=True)
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(f"{db_filename}{suffix}"):
+                    os.remove(f"{db_filename}{suffix}")
+            os.replace(db_tmp_filename, db_filename)
+        logger.debug(f"Restored the database from the base and the {len(generations[generation])} segments stored.")
+        return True
+
+    def _store_base(self) -> None:
+        # moves the log into the database, so that the next generation starts with an empty one. Writers are blocked
+        # while the log is copied, when other connections are still reading it the log is kept and stored again below
+        busy, _, _ = self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        if busy:
+            logger.debug("The write-ahead log of the database couldn't be truncated.")
+        # read before the copy, so that a restart of the log during the copy is detected by the next store
+        header = _read_wal_header(self.wal_filename)
+        if self._generation < 0:
+            # continues after the generations stored by a previous run, which are kept until the new base is stored
+            drive = Drive("lit://database", component_name=self.component_name)
+            self._generation = max(_list_generations(drive, self._name, self.component_name), default=-1)
+        generation = self._generation + 1
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_filename = os.path.join(tmpdir, f"{self._name}.{generation}.base")
+            # in WAL journal mode, the copy reads a snapshot of the database without blocking the writers
+            dest = sqlite3.connect(base_filename)
+            self._connection.backup(dest)
+            dest.close()
+            self._put_file(tmpdir, os.path.basename(base_filename))
+
+        self._generation = generation
+        self._num_segments = 0
+        self._offset = 0
+        self._salts = header[1] if header else None
+        self._stored_bytes = 0
+        logger.debug(f"Stored the base of the generation {generation} of the database to the Drive.")
+        self._remove_previous_generations()
+
+    def _remove_previous_generations(self) -> None:
+        drive = Drive("lit://database", component_name=self.component_name)
+        for generation, segments in _list_generations(drive, self._name, self.component_name).items():
+            if generation < self._generation:
+                for filename in [f"{self._name}.{generation}.base"] + segments:
+                    drive.delete(filename)
+
+    def _put(self, filename: str, data: bytes) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, filename), "wb") as f:
+                f.write(data)
+            self._put_file(tmpdir, filename)
+
+    def _put_file(self, root_folder: str, filename: str) -> None:
+        drive = Drive("lit://database", component_name=self.component_name, root_folder=root_folder)
+        drive.put(filename)
+
+
+def _read_wal_header(wal_filename: str) -> Optional[Tuple[int, bytes]]:
+    """Returns the page size and the salts of the write-ahead log, if it has a header."""
+    if not os.path.exists(wal_filename):
+        return None
+    with open(wal_filename, "rb") as f:
+        header = f.read(_WAL_HEADER_SIZE)
+    if len(header) < _WAL_HEADER_SIZE:
+        return None
+    (page_size,) = struct.unpack(">I", header[8:12])
+    return page_size, header[16:24]
+
+
+def _committed_end(data: bytes, offset: int, page_size: int, salts: bytes) -> int:
+    """Returns the position in the log after the last commit frame found in the data read from the offset.
+
+    The frames after it belong to a transaction in progress, or to a previous log when they don't have its salts.
+    """
+    frame_size = _WAL_FRAME_HEADER_SIZE + page_size
+    end = offset
+    position = max(offset, _WAL_HEADER_SIZE)
+    while position + frame_size <= offset + len(data):
+        frame_header = data[position - offset : position - offset + _WAL_FRAME_HEADER_SIZE]
+        if frame_header[8:16] != salts:
+            break
+        (db_size,) = struct.unpack(">I", frame_header[4:8])
+        position += frame_size
+        # the size of the database is only set in the last frame of a transaction
+        if db_size:
+            end = position
+    return end
+
+
+def _list_generations(drive: Drive, name: str, component_name: str) -> Dict[int, List[str]]:
+    """Returns the generations which have a base in the Drive, along with their segments in order."""
+    pattern = re.compile(rf"^{re.escape(name)}\.(\d+)\.(base|wal\.(\d+))$")
+    bases, segments = set(), []
+    for filename in drive.list(component_name=component_name):
+        match = pattern.match(os.path.basename(filename))
+        if not match:
+            continue
+        if match.group(2) == "base":
+            bases.add(int(match.group(1)))
+        else:
+            segments.append((int(match.group(1)), int(match.group(3)), match.group(0)))
+    generations = {generation: [] for generation in bases}
+    for generation, _, segment in sorted(segments):
+        if generation in generations:
+            generations[generation].append(segment)
+    return generations
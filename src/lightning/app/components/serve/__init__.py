@@ -2,6 +2,12 @@ from lightning.app.components.serve.auto_scaler import AutoScaler
 from lightning.app.components.serve.cold_start_proxy import ColdStartProxy
 from lightning.app.components.serve.gradio_server import ServeGradio
 from lightning.app.components.serve.python_server import Category, Image, Number, PythonServer, Text
+from lightning.app.components.serve.scheduling import (
+    LatencyWeighted,
+    LeastOutstandingRequests,
+    PowerOfTwoChoices,
+    SchedulingPolicy,
+)
 from lightning.app.components.serve.streamlit import ServeStreamlit
 
 __all__ = [
@@ -14,4 +20,8 @@ __all__ = [
     "Text",
     "AutoScaler",
     "ColdStartProxy",
+    "SchedulingPolicy",
+    "LeastOutstandingRequests",
+    "PowerOfTwoChoices",
+    "LatencyWeighted",
 ]
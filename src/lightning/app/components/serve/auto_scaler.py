@@ -19,17 +19,20 @@ import uuid
 from itertools import cycle
 from typing import Any, Dict, List, Optional
 from typing import SupportsFloat as Numeric
-from typing import Tuple, Type, Union
+from typing import Set, Tuple, Type, Union
 
 import requests
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 from pydantic import BaseModel
 from starlette.staticfiles import StaticFiles
 
 from lightning.app.components.serve.cold_start_proxy import ColdStartProxy
+from lightning.app.components.serve.metrics import _format_prometheus_metrics, _RollingSummary
+from lightning.app.components.serve.scheduling import _get_scheduling_policy, ReplicaStatus, SchedulingPolicy
+from lightning.app.components.serve.wire_format import _BINARY_CONTENT_TYPE, _decode_batch, _encode_batch, _WIRE_FORMATS
 from lightning.app.core.flow import LightningFlow
 from lightning.app.core.work import LightningWork
 from lightning.app.utilities.app_helpers import Logger
@@ -92,6 +95,84 @@ class _BatchRequestModel(BaseModel):
     inputs: List[Any]
 
 
+class _LoadBalancerMetrics(BaseModel):
+    pending_requests: int
+    queue_depth: int
+    queue_wait: Dict[str, float]
+    inference_latency: Dict[str, float]
+    utilization: float
+    replica_utilization: Dict[str, float]
+
+
+class _ConnectionPoolStats(BaseModel):
+    limit: int
+    num_requests: int
+    num_errors: int
+    num_in_flight: int
+
+
+class _ReplicaConnectionPool:
+    """A long-lived ``aiohttp`` session holding a pool of keep-alive connections to a single replica.
+
+    Args:
+        url: The base url of the replica.
+        limit: The maximum number of simultaneous connections to the replica.
+        keepalive_timeout: The number of seconds an idle connection is kept open for reuse.
+    """
+
+    def __init__(self, url: str, limit: int = 100, keepalive_timeout: float = 15) -> None:
+        self.url = url
+        self.limit = limit
+        self.num_requests = 0
+        self.num_errors = 0
+        self.num_in_flight = 0
+        # set once no request is in flight while the pool is closing
+        self._drained: Optional[asyncio.Event] = None
+        connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=keepalive_timeout)
+        self.session = aiohttp.ClientSession(connector=connector)
+
+    async def post(self, path: str, **kwargs: Any) -> Any:
+        """Sends a POST request to the replica and returns the decoded JSON or binary response."""
+        self.num_requests += 1
+        self.num_in_flight += 1
+        try:
+            async with self.session.post(f"{self.url}{path}", **kwargs) as response:
+                if response.status == 408:
+                    raise HTTPException(408, "Request timed out")
+                response.raise_for_status()
+                if response.content_type == _BINARY_CONTENT_TYPE:
+                    return _decode_batch(await response.read())
+                return await response.json()
+        except Exception:
+            self.num_errors += 1
+            raise
+        finally:
+            self.num_in_flight -= 1
+            if self.num_in_flight == 0 and self._drained is not None:
+                self._drained.set()
+
+    def stats(self) -> _ConnectionPoolStats:
+        return _ConnectionPoolStats(
+            limit=self.limit,
+            num_requests=self.num_requests,
+            num_errors=self.num_errors,
+            num_in_flight=self.num_in_flight,
+        )
+
+    async def close(self, drain_timeout: Optional[float] = None) -> None:
+        """Closes the session, after waiting up to ``drain_timeout`` seconds for the requests in flight to
+        complete."""
+        try:
+            if drain_timeout and self.num_in_flight:
+                self._drained = asyncio.Event()
+                try:
+                    await asyncio.wait_for(self._drained.wait(), drain_timeout)
+                except asyncio.TimeoutError:
+                    logger.info(f"Closing the connections to {self.url} with {self.num_in_flight} requests in flight.")
+        finally:
+            await self.session.close()
+
+
 def _create_fastapi(title: str) -> _TrackableFastAPI:
     fastapi_app = _TrackableFastAPI(title=title)
 
@@ -116,7 +197,7 @@ def _create_fastapi(title: str) -> _TrackableFastAPI:
 
 class _LoadBalancer(LightningWork):
     r"""The LoadBalancer is a LightningWork component that collects the requests and sends them to the prediciton
-    API asynchronously using RoundRobin scheduling. It also performs auto batching of the incoming requests.
+    API asynchronously using the given scheduling policy. It also performs auto batching of the incoming requests.
 
     After enabling you will require to send username and password from the request header for the private endpoints.
 
@@ -131,9 +212,20 @@ class _LoadBalancer(LightningWork):
         timeout_inference_request: The number of seconds to wait for inference.
         api_name: The name to be displayed on the UI. Normally, it is the name of the work class
         cold_start_proxy: The proxy service to use while the work is cold starting.
+        connection_pool_limit: The maximum number of simultaneous connections kept open to each replica.
+        connection_keep_alive: The number of seconds an idle connection to a replica is kept open for reuse.
+        scheduling_policy: The policy choosing the replica each batch is sent to. Either a
+            :class:`~lightning.app.components.serve.scheduling.SchedulingPolicy` or one of ``"least_outstanding"``,
+            ``"power_of_two"`` and ``"latency_ewma"``.
+        max_batches_per_replica: The number of batches a single replica processes concurrently.
+        wire_format: The format of the batches sent to the replicas, either ``"json"`` or ``"binary"``. The binary
+            format sends large strings and bytes as raw buffers. Replicas that don't support it fall back to JSON.
         **kwargs: Arguments passed to :func:`LightningWork.init` like ``CloudCompute``, ``BuildConfig``, etc.
     """
 
+    # the weight of the latest batch latency in the per-replica moving average
+    _LATENCY_EWMA_ALPHA = 0.3
+
     @requires(["aiohttp"])
     def __init__(
         self,
@@ -147,9 +239,18 @@ class _LoadBalancer(LightningWork):
         timeout_inference_request: int = 60,
         api_name: Optional[str] = "API",  # used for displaying the name in the UI
         cold_start_proxy: Union[ColdStartProxy, str, None] = None,
+        connection_pool_limit: int = 100,
+        connection_keep_alive: float = 15,
+        scheduling_policy: Union[SchedulingPolicy, str] = "least_outstanding",
+        max_batches_per_replica: int = 1,
+        wire_format: str = "json",
         **kwargs: Any,
     ) -> None:
         super().__init__(cloud_compute=CloudCompute("default"), **kwargs)
+        if wire_format not in _WIRE_FORMATS:
+            raise ValueError(f"`wire_format` must be one of {_WIRE_FORMATS}, got {wire_format!r}.")
+        if max_batches_per_replica < 1:
+            raise ValueError(f"`max_batches_per_replica` must be at least 1, got {max_batches_per_replica}.")
         self._input_type = input_type
         self._output_type = output_type
         self._timeout_keep_alive = timeout_keep_alive
@@ -158,10 +259,23 @@ class _LoadBalancer(LightningWork):
         self.max_batch_size = max_batch_size
         self.timeout_batching = timeout_batching
         self._iter = None
-        self._batch = []
-        self._responses = {}  # {request_id: response}
-        self._last_batch_sent = None
-        self._server_status = {}
+        # the asyncio primitives are bound to the event loop of the uvicorn server and are created lazily from there
+        self._request_queue: Optional[asyncio.Queue] = None
+        self._server_available: Optional[asyncio.Event] = None
+        self._responses: Dict[str, asyncio.Future] = {}  # {request_id: future resolved with the response}
+        self._enqueued_at: Dict[str, float] = {}  # {request_id: time the request entered the queue}
+        self._queue_wait = _RollingSummary()
+        self._inference_latency = _RollingSummary()
+        self._server_status: Dict[str, ReplicaStatus] = {}
+        self._scheduling_policy = _get_scheduling_policy(scheduling_policy)
+        self.max_batches_per_replica = max_batches_per_replica
+        self._wire_format = wire_format
+        self._json_only_servers = set()
+        self._connection_pool_limit = connection_pool_limit
+        self._connection_keep_alive = connection_keep_alive
+        self._connection_pools: Dict[str, _ReplicaConnectionPool] = {}
+        # the tasks closing the pools of the de-registered replicas once their batches in flight complete
+        self._draining_pools: Set[asyncio.Task] = set()
         self._api_name = api_name
         self.ready = False
 
@@ -185,82 +299,174 @@ class _LoadBalancer(LightningWork):
             raise ValueError("Internal IP not set")
         return f"http://{self._internal_ip}:{self._port}"
 
+    def _setup_async_primitives(self) -> None:
+        if self._request_queue is None:
+            self._request_queue = asyncio.Queue()
+        if self._server_available is None:
+            self._server_available = asyncio.Event()
+
+    def _set_response(self, request_id: str, response: Any) -> None:
+        future = self._responses.pop(request_id, None)
+        # the future is already done if the client went away while the batch was processed
+        if future is None or future.done():
+            return
+        if isinstance(response, Exception):
+            future.set_exception(response)
+        else:
+            future.set_result(response)
+
+    def _notify_server_available(self) -> None:
+        if self._server_available is not None:
+            self._server_available.set()
+
+    def _get_connection_pool(self, server_url: str) -> _ReplicaConnectionPool:
+        """Returns the connection pool of the given replica, creating it if it doesn't exist yet."""
+        pool = self._connection_pools.get(server_url)
+        if pool is None:
+            pool = _ReplicaConnectionPool(
+                server_url, limit=self._connection_pool_limit, keepalive_timeout=self._connection_keep_alive
+            )
+            self._connection_pools[server_url] = pool
+        return pool
+
+    async def _close_connection_pool(self, server_url: str) -> None:
+        pool = self._connection_pools.pop(server_url, None)
+        if pool is not None:
+            await pool.close()
+
+    def _drain_connection_pool(self, server_url: str) -> None:
+        """Closes the connection pool of a de-registered replica in the background once the batches in flight
+        complete, or after the inference request timeout."""
+        pool = self._connection_pools.pop(server_url, None)
+        if pool is None:
+            return
+        task = asyncio.create_task(pool.close(drain_timeout=self._timeout_inference_request))
+        self._draining_pools.add(task)
+        task.add_done_callback(self._draining_pools.discard)
+
+    async def _post_batch(self, batch_request_data: _BatchRequestModel, server_url: str) -> Any:
+        pool = self._get_connection_pool(server_url)
+        if self._wire_format == "binary" and server_url not in self._json_only_servers:
+            headers = {"accept": _BINARY_CONTENT_TYPE, "Content-Type": _BINARY_CONTENT_TYPE}
+            try:
+                return await pool.post(
+                    self.endpoint,
+                    data=_encode_batch(batch_request_data.dict()),
+                    timeout=self._timeout_inference_request,
+                    headers=headers,
+                )
+            except aiohttp.client_exceptions.ClientResponseError as ex:
+                # servers which don't understand the binary format reject it as an invalid JSON body
+                if ex.status not in (415, 422):
+                    raise
+                logger.info(f"Server {server_url} doesn't support the binary wire format, falling back to JSON.")
+                self._json_only_servers.add(server_url)
+
+        headers = {
+            "accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        return await pool.post(
+            self.endpoint,
+            json=batch_request_data.dict(),
+            timeout=self._timeout_inference_request,
+            headers=headers,
+        )
+
     async def send_batch(self, batch: List[Tuple[str, _BatchRequestModel]], server_url: str):
         request_data: List[_LoadBalancer._input_type] = [b[1] for b in batch]
         batch_request_data = _BatchRequestModel(inputs=request_data)
 
+        start_time = time.monotonic()
         try:
-            self._server_status[server_url] = False
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/json",
-                }
-                async with session.post(
-                    f"{server_url}{self.endpoint}",
-                    json=batch_request_data.dict(),
-                    timeout=self._timeout_inference_request,
-                    headers=headers,
-                ) as response:
-                    if response.status == 408:
-                        raise HTTPException(408, "Request timed out")
-                    response.raise_for_status()
-                    response = await response.json()
-                    outputs = response["outputs"]
-                    if len(batch) != len(outputs):
-                        raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
-                    result = {request[0]: r for request, r in zip(batch, outputs)}
-                    self._responses.update(result)
+            response = await self._post_batch(batch_request_data, server_url)
+            outputs = response["outputs"]
+            if len(batch) != len(outputs):
+                raise RuntimeError(f"result has {len(outputs)} items but batch is {len(batch)}")
+            for request, output in zip(batch, outputs):
+                self._set_response(request[0], output)
+            latency = time.monotonic() - start_time
+            self._inference_latency.observe(latency)
+            self._record_replica_latency(server_url, latency)
         except Exception as ex:
-            result = {request[0]: ex for request in batch}
-            self._responses.update(result)
+            for request in batch:
+                self._set_response(request[0], ex)
+            # a failed batch counts as one which took the whole request timeout, so that the scheduling policies don't
+            # keep picking a replica failing fast over the healthy ones
+            latency = max(time.monotonic() - start_time, self._timeout_inference_request)
+            self._record_replica_latency(server_url, latency)
         finally:
-            # resetting the server status so other requests can be
+            # releasing the slot so other requests can be
             # scheduled on this node
-            if server_url in self._server_status:
-                # TODO - if the server returns an error, track that so
-                #  we don't send more requests to it
-                self._server_status[server_url] = True
+            status = self._server_status.get(server_url)
+            if status is not None:
+                status.num_in_flight = max(status.num_in_flight - 1, 0)
+                self._notify_server_available()
+
+    def _record_replica_latency(self, server_url: str, latency: float) -> None:
+        status = self._server_status.get(server_url)
+        if status is not None:
+            status.record_latency(latency, alpha=self._LATENCY_EWMA_ALPHA)
 
     def _find_free_server(self) -> Optional[str]:
-        existing = set(self._server_status.keys())
-        for server in existing:
-            status = self._server_status.get(server, None)
-            if status is None:
-                logger.error("Server is not found in the status list. This should not happen.")
-            if status:
-                return server
+        """Returns the server chosen by the scheduling policy among those with capacity for one more batch."""
+        candidates = [
+            status for status in self._server_status.values() if status.num_in_flight < self.max_batches_per_replica
+        ]
+        if not candidates:
+            return None
+        return self._scheduling_policy.select(candidates).url
+
+    async def _wait_for_free_server(self) -> str:
+        """Waits until a server is able to accept a new batch without polling."""
+        while True:
+            server_url = self._find_free_server()
+            if server_url is not None:
+                return server_url
+            self._server_available.clear()
+            await self._server_available.wait()
+
+    async def _collect_batch(self) -> List[Tuple[str, Any]]:
+        """Waits for the first request and collects the following ones until either ``max_batch_size`` requests
+        are gathered or ``timeout_batching`` seconds have elapsed since the first request arrived."""
+        batch = [await self._request_queue.get()]
+        deadline = time.monotonic() + self.timeout_batching
+        while len(batch) < self.max_batch_size:
+            try:
+                # drain whatever is already queued without yielding to the event loop
+                batch.append(self._request_queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._request_queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
 
     async def consumer(self):
-        """The consumer process that continuously checks for new requests and sends them to the API.
+        """The consumer process that waits for new requests and sends them to the API.
 
-        Two instances of this function should not be running with shared `_state_server` as that would create race
-        conditions
+        Requests are received through an :class:`asyncio.Queue` and a batch is sent as soon as it is full or its
+        batching timeout expires. Two instances of this function should not be running with shared `_server_status`
+        as that would create race conditions.
         """
+        self._setup_async_primitives()
         while True:
-            await asyncio.sleep(0.05)
-            batch = self._batch[: self.max_batch_size]
-            is_batch_ready = len(batch) == self.max_batch_size
-            if len(batch) > 0 and self._last_batch_sent is None:
-                self._last_batch_sent = time.time()
-
-            if self._last_batch_sent:
-                is_batch_timeout = time.time() - self._last_batch_sent > self.timeout_batching
-            else:
-                is_batch_timeout = False
-
-            server_url = self._find_free_server()
-            # setting the server status to be busy! This will be reset by
+            batch = await self._collect_batch()
+            server_url = await self._wait_for_free_server()
+            now = time.monotonic()
+            for request_id, _ in batch:
+                enqueued_at = self._enqueued_at.pop(request_id, None)
+                if enqueued_at is not None:
+                    self._queue_wait.observe(now - enqueued_at, now=now)
+            # reserving a slot on the server! This will be released by
             # the send_batch function after the server responds
-            if server_url is None:
-                continue
-            if batch and (is_batch_ready or is_batch_timeout):
-                self._server_status[server_url] = False
-                # find server with capacity
-                asyncio.create_task(self.send_batch(batch, server_url))
-                # resetting the batch array, TODO - not locking the array
-                self._batch = self._batch[len(batch) :]
-                self._last_batch_sent = time.time()
+            self._server_status[server_url].num_in_flight += 1
+            asyncio.create_task(self.send_batch(batch, server_url))
 
     async def process_request(self, data: BaseModel, request_id=None):
         if request_id is None:
@@ -278,14 +484,67 @@ class _LoadBalancer(LightningWork):
             return await self._cold_start_proxy.handle_request(data)
 
         # if we have capacity, process the request
-        self._batch.append((request_id, data))
-        while True:
-            await asyncio.sleep(0.05)
-            if request_id in self._responses:
-                result = self._responses[request_id]
-                del self._responses[request_id]
-                _maybe_raise_granular_exception(result)
-                return result
+        self._setup_async_primitives()
+        future = asyncio.get_running_loop().create_future()
+        self._responses[request_id] = future
+        self._enqueued_at[request_id] = time.monotonic()
+        self._request_queue.put_nowait((request_id, data))
+        try:
+            return await future
+        except Exception as ex:
+            _maybe_raise_granular_exception(ex)
+        finally:
+            self._responses.pop(request_id, None)
+            self._enqueued_at.pop(request_id, None)
+
+    def _replica_utilization(self) -> Dict[str, float]:
+        """The fraction of the batch slots of each replica that are in use."""
+        return {url: status.num_in_flight / self.max_batches_per_replica for url, status in self._server_status.items()}
+
+    def _get_metrics(self) -> _LoadBalancerMetrics:
+        replica_utilization = self._replica_utilization()
+        return _LoadBalancerMetrics(
+            pending_requests=self._fastapi_app.num_current_requests if self._fastapi_app else 0,
+            queue_depth=self._request_queue.qsize() if self._request_queue is not None else 0,
+            queue_wait=self._queue_wait.quantiles(),
+            inference_latency=self._inference_latency.quantiles(),
+            utilization=sum(replica_utilization.values()) / len(replica_utilization) if replica_utilization else 0.0,
+            replica_utilization=replica_utilization,
+        )
+
+    def _get_prometheus_metrics(self) -> str:
+        metrics = self._get_metrics()
+        return _format_prometheus_metrics(
+            gauges=[
+                (
+                    "lightning_load_balancer_pending_requests",
+                    "The number of requests being processed by the load balancer.",
+                    {(): metrics.pending_requests},
+                ),
+                (
+                    "lightning_load_balancer_queue_depth",
+                    "The number of requests waiting to be batched.",
+                    {(): metrics.queue_depth},
+                ),
+                (
+                    "lightning_load_balancer_replica_utilization",
+                    "The fraction of the batch slots of the replica that are in use.",
+                    {(("replica", url),): value for url, value in metrics.replica_utilization.items()},
+                ),
+            ],
+            summaries=[
+                (
+                    "lightning_load_balancer_queue_wait_seconds",
+                    "The time requests wait before their batch is sent to a replica.",
+                    self._queue_wait,
+                ),
+                (
+                    "lightning_load_balancer_inference_latency_seconds",
+                    "The time replicas take to process a batch.",
+                    self._inference_latency,
+                ),
+            ],
+        )
 
     def _has_processing_capacity(self):
         """This function checks if we have processing capacity for one more request or not.
@@ -295,7 +554,7 @@ class _LoadBalancer(LightningWork):
         if not self._fastapi_app:
             return False
         active_server_count = len(self.servers)
-        max_processable = self.max_batch_size * active_server_count
+        max_processable = self.max_batch_size * self.max_batches_per_replica * active_server_count
         current_req_count = self._fastapi_app.num_current_requests
         return current_req_count < max_processable
 
@@ -325,11 +584,20 @@ class _LoadBalancer(LightningWork):
 
         @fastapi_app.on_event("startup")
         async def startup_event():
+            for server in self.servers:
+                self._get_connection_pool(server)
             fastapi_app.SEND_TASK = asyncio.create_task(self.consumer())
 
         @fastapi_app.on_event("shutdown")
-        def shutdown_event():
+        async def shutdown_event():
             fastapi_app.SEND_TASK.cancel()
+            for task in list(self._draining_pools):
+                task.cancel()
+            await asyncio.gather(*self._draining_pools, return_exceptions=True)
+            for server in list(self._connection_pools):
+                await self._close_connection_pool(server)
+            if self._cold_start_proxy:
+                await self._cold_start_proxy.close()
 
         @fastapi_app.get("/system/info", response_model=_SysInfo)
         async def sys_info():
@@ -341,6 +609,18 @@ class _LoadBalancer(LightningWork):
                 global_request_count=fastapi_app.global_request_count,
             )
 
+        @fastapi_app.get("/system/metrics", response_model=_LoadBalancerMetrics)
+        async def metrics():
+            return self._get_metrics()
+
+        @fastapi_app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+        async def prometheus_metrics():
+            return PlainTextResponse(self._get_prometheus_metrics(), media_type="text/plain; version=0.0.4")
+
+        @fastapi_app.get("/system/connection-pools", response_model=Dict[str, _ConnectionPoolStats])
+        async def connection_pools():
+            return {url: pool.stats() for url, pool in self._connection_pools.items()}
+
         @fastapi_app.put("/system/update-servers")
         async def update_servers(servers: List[str]):
             self.servers = servers
@@ -351,12 +631,16 @@ class _LoadBalancer(LightningWork):
             for server in servers:
                 updated_servers.add(server)
                 if server not in existing_servers:
-                    self._server_status[server] = True
+                    self._server_status[server] = ReplicaStatus(url=server)
+                    self._get_connection_pool(server)
                     logger.info(f"Registering server {server}", self._server_status)
             for existing in existing_servers:
                 if existing not in updated_servers:
                     logger.info(f"De-Registering server {existing}", self._server_status)
                     del self._server_status[existing]
+                    self._drain_connection_pool(existing)
+                    self._json_only_servers.discard(existing)
+            self._notify_server_available()
 
         @fastapi_app.post(self.endpoint, response_model=self._output_type)
         async def balance_api(inputs: input_type):
@@ -496,6 +780,15 @@ class AutoScaler(LightningFlow):
         input_type: Input type.
         output_type: Output type.
         cold_start_proxy: If provided, the proxy will be used while the worker machines are warming up.
+        connection_pool_limit: The maximum number of simultaneous connections the load balancer keeps open to each
+            replica.
+        connection_keep_alive: The number of seconds an idle connection to a replica is kept open for reuse.
+        scheduling_policy: The policy choosing the replica each batch is sent to. Either a
+            :class:`~lightning.app.components.serve.scheduling.SchedulingPolicy` or one of ``"least_outstanding"``,
+            ``"power_of_two"`` and ``"latency_ewma"``.
+        max_batches_per_replica: The number of batches a single replica processes concurrently.
+        wire_format: The format of the batches sent to the replicas, either ``"json"`` or ``"binary"``. The binary
+            format sends large strings and bytes as raw buffers. Replicas that don't support it fall back to JSON.
 
     .. testcode::
 
@@ -560,6 +853,11 @@ class AutoScaler(LightningFlow):
         output_type: Type[BaseModel] = Dict,
         cold_start_proxy: Union[ColdStartProxy, str, None] = None,
         *work_args: Any,
+        connection_pool_limit: int = 100,
+        connection_keep_alive: float = 15,
+        scheduling_policy: Union[SchedulingPolicy, str] = "least_outstanding",
+        max_batches_per_replica: int = 1,
+        wire_format: str = "json",
         **work_kwargs: Any,
     ) -> None:
         super().__init__()
@@ -575,6 +873,7 @@ class AutoScaler(LightningFlow):
         self.scale_out_interval = scale_out_interval
         self.scale_in_interval = scale_in_interval
         self.max_batch_size = max_batch_size
+        self.max_batches_per_replica = max_batches_per_replica
 
         if max_replicas < min_replicas:
             raise ValueError(
@@ -595,6 +894,11 @@ class AutoScaler(LightningFlow):
             parallel=True,
             api_name=self._work_cls.__name__,
             cold_start_proxy=cold_start_proxy,
+            connection_pool_limit=connection_pool_limit,
+            connection_keep_alive=connection_keep_alive,
+            scheduling_policy=scheduling_policy,
+            max_batches_per_replica=max_batches_per_replica,
+            wire_format=wire_format,
         )
 
     @property
@@ -660,6 +964,10 @@ class AutoScaler(LightningFlow):
             replicas: The number of running works.
             metrics: ``metrics['pending_requests']`` is the total number of requests that are currently pending.
                 ``metrics['pending_works']`` is the number of pending works.
+                When the load balancer is reachable, ``metrics['queue_wait']`` and ``metrics['inference_latency']``
+                hold the ``p50``, ``p95`` and ``p99`` quantiles in seconds over the last minute,
+                ``metrics['queue_depth']`` the number of requests waiting to be batched and
+                ``metrics['utilization']`` the average fraction of busy batch slots across replicas.
 
         Returns:
             The target number of running works. The value will be adjusted after this method runs
@@ -673,8 +981,8 @@ class AutoScaler(LightningFlow):
 
         pending_requests_per_running_or_pending_work = pending_requests / active_or_pending_works
 
-        # scale out if the number of pending requests exceeds max batch size.
-        max_requests_per_work = self.max_batch_size
+        # scale out if the number of pending requests exceeds what a work processes at once.
+        max_requests_per_work = self.max_batch_size * self.max_batches_per_replica
         if pending_requests_per_running_or_pending_work >= max_requests_per_work:
             return replicas + 1
 
@@ -695,6 +1003,24 @@ class AutoScaler(LightningFlow):
             return 0
         return int(requests.get(f"{load_balancer_url}/num-requests").json())
 
+    @property
+    def load_balancer_metrics(self) -> Dict[str, Any]:
+        """Fetches the latency, queue and utilization metrics of the load balancer.
+
+        Returns an empty dictionary if the load balancer can't be reached.
+        """
+        try:
+            load_balancer_url = self.load_balancer.get_internal_url()
+        except ValueError:
+            return {}
+        try:
+            response = requests.get(f"{load_balancer_url}/system/metrics", timeout=5)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as ex:
+            logger.warn(f"Failed to fetch the load balancer metrics: {ex}")
+            return {}
+        return response.json()
+
     @property
     def num_pending_works(self) -> int:
         """The number of pending works."""
@@ -702,10 +1028,15 @@ class AutoScaler(LightningFlow):
 
     def autoscale(self) -> None:
         """Adjust the number of works based on the target number returned by ``self.scale``."""
-        metrics = {
-            "pending_requests": self.num_pending_requests,
-            "pending_works": self.num_pending_works,
-        }
+        if time.time() - self._last_autoscale <= min(self.scale_out_interval, self.scale_in_interval):
+            # no scaling can happen yet, skip collecting the metrics
+            self.load_balancer.update_servers(self.workers)
+            return
+
+        metrics = dict(self.load_balancer_metrics)
+        if "pending_requests" not in metrics:
+            metrics["pending_requests"] = self.num_pending_requests
+        metrics["pending_works"] = self.num_pending_works
 
         # ensure min_replicas <= num_replicas <= max_replicas
         num_target_workers = max(
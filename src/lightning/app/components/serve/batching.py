@@ -0,0 +1,147 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from lightning.app.utilities.app_helpers import Logger
+
+logger = Logger(__name__)
+
+
+class _AdaptiveBatcher:
+    """Groups concurrent requests into batches processed by a single ``predict_batch`` call.
+
+    When ``target_latency`` is set, the batch size grows by one as long as full batches complete within the target
+    and is halved as soon as a batch exceeds it. Requests whose deadline has passed before their batch is processed
+    are rejected instead of being sent to the model.
+
+    Args:
+        predict_batch: The function processing a list of requests and returning the list of their responses.
+        max_batch_size: The maximum number of requests processed at once.
+        timeout_batching: The number of seconds to wait for a batch to fill up after its first request arrived.
+        target_latency: The number of seconds a batch should take to be processed. If ``None``, batches are always
+            allowed to reach ``max_batch_size``.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        timeout_batching: float,
+        target_latency: Optional[float] = None,
+    ) -> None:
+        self._predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.timeout_batching = timeout_batching
+        self.target_latency = target_latency
+        self.batch_size = max_batch_size if target_latency is None else 1
+        self.num_expired = 0
+        self._queue: Optional[asyncio.Queue] = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        # created lazily so that the queue is bound to the event loop of the server
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def submit(self, request: Any, timeout: Optional[float] = None) -> Any:
+        """Queues the request and waits for its response.
+
+        Args:
+            request: The request to process.
+            timeout: The number of seconds after which the request is dropped if it hasn't been processed yet.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        future = asyncio.get_running_loop().create_future()
+        self._get_queue().put_nowait((request, deadline, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[Any, Optional[float], asyncio.Future]]:
+        queue = self._get_queue()
+        batch = [await queue.get()]
+        batch_deadline = time.monotonic() + self.timeout_batching
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = batch_deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _shed_expired(
+        self, batch: List[Tuple[Any, Optional[float], asyncio.Future]]
+    ) -> List[Tuple[Any, Optional[float], asyncio.Future]]:
+        now = time.monotonic()
+        alive = []
+        for item in batch:
+            _, deadline, future = item
+            if future.done():
+                # the client went away
+                continue
+            if deadline is not None and deadline < now:
+                self.num_expired += 1
+                future.set_exception(HTTPException(408, "Request deadline exceeded before it was processed"))
+                continue
+            alive.append(item)
+        return alive
+
+    def _adapt(self, num_requests: int, latency: float) -> None:
+        if self.target_latency is None:
+            return
+        if latency > self.target_latency:
+            self.batch_size = max(1, self.batch_size // 2)
+        elif num_requests >= self.batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size + 1)
+
+    async def process_batch(self) -> None:
+        """Waits for the next batch and processes it."""
+        batch = self._shed_expired(await self._collect_batch())
+        if not batch:
+            return
+        requests = [request for request, _, _ in batch]
+        start_time = time.monotonic()
+        try:
+            if asyncio.iscoroutinefunction(self._predict_batch):
+                outputs = await self._predict_batch(requests)
+            else:
+                outputs = await run_in_threadpool(self._predict_batch, requests)
+            if len(outputs) != len(requests):
+                raise RuntimeError(f"predict_batch returned {len(outputs)} items but the batch is {len(requests)}")
+        except Exception as ex:
+            logger.error(f"Failed to process a batch of {len(requests)} requests: {ex}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+        self._adapt(len(requests), time.monotonic() - start_time)
+        for (_, _, future), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    async def run(self) -> None:
+        """Processes batches until cancelled."""
+        while True:
+            await self.process_batch()
@@ -41,6 +41,7 @@ class ColdStartProxy:
     def __init__(self, proxy_url: str):
         self.proxy_url = proxy_url
         self.proxy_timeout = 50
+        self._session = None
         if not asyncio.iscoroutinefunction(self.handle_request):
             raise TypeError("handle_request must be an `async` function")
 
@@ -54,17 +55,28 @@ class ColdStartProxy:
             forwarded by load balancer which is a FastAPI service
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/json",
-                }
-                async with session.post(
-                    self.proxy_url,
-                    json=request.dict(),
-                    timeout=self.proxy_timeout,
-                    headers=headers,
-                ) as response:
-                    return await response.json()
+            headers = {
+                "accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            async with self._get_session().post(
+                self.proxy_url,
+                json=request.dict(),
+                timeout=self.proxy_timeout,
+                headers=headers,
+            ) as response:
+                return await response.json()
         except Exception as ex:
             raise HTTPException(status_code=500, detail=f"Error in proxy: {ex}")
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # the session is created lazily so that it is bound to the event loop of the load balancer
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the connections kept open to the proxy service."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
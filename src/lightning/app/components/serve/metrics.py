@@ -0,0 +1,93 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class _RollingSummary:
+    """Keeps the observations of the last ``window`` seconds to compute quantiles, along with the total sum and
+    count of all the observations as Prometheus summaries do.
+
+    Args:
+        window: The number of seconds the quantiles are computed over.
+        max_samples: The maximum number of observations kept in the window.
+    """
+
+    def __init__(self, window: float = 60, max_samples: int = 10_000) -> None:
+        self.window = window
+        self.sum = 0.0
+        self.count = 0
+        self._samples: deque = deque(maxlen=max_samples)
+
+    def observe(self, value: float, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._samples.append((now, value))
+        self.sum += value
+        self.count += 1
+
+    def _evict(self, now: float) -> None:
+        while self._samples and self._samples[0][0] < now - self.window:
+            self._samples.popleft()
+
+    def quantiles(self, quantiles: Iterable[float] = _QUANTILES, now: Optional[float] = None) -> Dict[str, float]:
+        """Returns the quantiles of the observations in the window keyed as ``"p50"``, ``"p95"``, etc.
+
+        All quantiles are ``0.0`` when there are no observations in the window.
+        """
+        self._evict(time.monotonic() if now is None else now)
+        values = sorted(value for _, value in self._samples)
+        out = {}
+        for quantile in quantiles:
+            key = f"p{quantile * 100:g}"
+            if not values:
+                out[key] = 0.0
+                continue
+            index = min(len(values) - 1, max(0, math.ceil(quantile * len(values)) - 1))
+            out[key] = values[index]
+        return out
+
+
+def _format_prometheus_metrics(
+    gauges: List[Tuple[str, str, Dict[Tuple[Tuple[str, str], ...], float]]],
+    summaries: List[Tuple[str, str, _RollingSummary]],
+) -> str:
+    """Renders the metrics in the Prometheus text exposition format.
+
+    Args:
+        gauges: Tuples of name, help text and values keyed by their labels.
+        summaries: Tuples of name, help text and summary.
+    """
+    lines = []
+    for name, help_text, values in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for labels, value in values.items():
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+    for name, help_text, summary in summaries:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+        for quantile, value in zip(_QUANTILES, summary.quantiles().values()):
+            lines.append(f"{name}{_format_labels((('quantile', str(quantile)),))} {value}")
+        lines += [f"{name}_sum {summary.sum}", f"{name}_count {summary.count}"]
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"') for _, value in labels)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
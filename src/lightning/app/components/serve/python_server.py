@@ -17,14 +17,18 @@ import asyncio
 import base64
 import os
 import platform
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 import requests
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from lightning_utilities.core.imports import compare_version, module_available
 from pydantic import BaseModel
 
+from lightning.app.components.serve.batching import _AdaptiveBatcher
+from lightning.app.components.serve.wire_format import _BINARY_CONTENT_TYPE, _decode_batch, _encode_batch
 from lightning.app.core.work import LightningWork
 from lightning.app.utilities.app_helpers import Logger
 from lightning.app.utilities.imports import _is_torch_available, requires
@@ -169,6 +173,10 @@ class PythonServer(LightningWork, abc.ABC):
         self,
         input_type: type = _DefaultInputData,
         output_type: type = _DefaultOutputData,
+        max_batch_size: int = 1,
+        timeout_batching: float = 0.01,
+        target_latency: Optional[float] = None,
+        request_timeout: Optional[float] = None,
         **kwargs,
     ):
         """The PythonServer Class enables to easily get your machine learning server up and running.
@@ -202,6 +210,14 @@ class PythonServer(LightningWork, abc.ABC):
                 and this can be accessed as `response.json()["prediction"]` in the client if
                 you are using requests library
 
+            max_batch_size: The maximum number of concurrent requests grouped into a single
+                :meth:`predict_batch` call. Batching is disabled with the default value of 1.
+            timeout_batching: The number of seconds to wait for a batch to fill up after its first request arrived.
+            target_latency: The number of seconds a batch should take to be processed. If provided, the batch size
+                adapts between 1 and ``max_batch_size`` to stay within this target.
+            request_timeout: The number of seconds after which a request waiting to be batched is rejected.
+                Clients can override it per request with the ``X-Request-Timeout`` header.
+
         Example:
 
             >>> from lightning.app.components.serve.python_server import PythonServer
@@ -222,8 +238,14 @@ class PythonServer(LightningWork, abc.ABC):
             raise TypeError("input_type must be a pydantic BaseModel class")
         if not issubclass(output_type, BaseModel):
             raise TypeError("output_type must be a pydantic BaseModel class")
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
         self._input_type = input_type
         self._output_type = output_type
+        self._max_batch_size = max_batch_size
+        self._timeout_batching = timeout_batching
+        self._target_latency = target_latency
+        self._request_timeout = request_timeout
 
         self.ready = False
 
@@ -251,6 +273,15 @@ class PythonServer(LightningWork, abc.ABC):
         """
         pass
 
+    def predict_batch(self, inputs: List[Any]) -> List[Any]:
+        """This method is called with a batch of requests when batching is enabled with ``max_batch_size > 1``.
+
+        Override this to run the model once on the whole batch. It must return one response per request, in the same
+        order. The default implementation calls :meth:`predict` on each request, concurrently when :meth:`predict` is
+        a coroutine.
+        """
+        return [self.predict(request) for request in inputs]
+
     @staticmethod
     def _get_sample_dict_from_datatype(datatype: Any) -> dict:
         if hasattr(datatype, "get_sample_data"):
@@ -281,11 +312,66 @@ class PythonServer(LightningWork, abc.ABC):
         async def async_predict_fn(request: input_type):  # type: ignore
             return await self.predict(request)
 
-        if asyncio.iscoroutinefunction(self.predict):
+        batcher = None
+        if self._max_batch_size > 1:
+            predict_batch = self.predict_batch
+            if asyncio.iscoroutinefunction(self.predict) and type(self).predict_batch is PythonServer.predict_batch:
+                # the default implementation would return the coroutines without awaiting them
+                async def predict_batch(inputs: List[Any]) -> List[Any]:
+                    return list(await asyncio.gather(*(self.predict(request) for request in inputs)))
+
+            batcher = _AdaptiveBatcher(
+                predict_batch,
+                max_batch_size=self._max_batch_size,
+                timeout_batching=self._timeout_batching,
+                target_latency=self._target_latency,
+            )
+
+            async def batched_predict_fn(
+                request: input_type, x_request_timeout: Optional[float] = Header(None)  # type: ignore
+            ):
+                timeout = x_request_timeout if x_request_timeout is not None else self._request_timeout
+                return await batcher.submit(request, timeout=timeout)
+
+            @fastapi_app.on_event("startup")
+            async def start_batcher():
+                fastapi_app.state.batcher_task = asyncio.create_task(batcher.run())
+
+            @fastapi_app.on_event("shutdown")
+            def stop_batcher():
+                fastapi_app.state.batcher_task.cancel()
+
+            fastapi_app.post("/predict", response_model=output_type)(batched_predict_fn)
+        elif asyncio.iscoroutinefunction(self.predict):
             fastapi_app.post("/predict", response_model=output_type)(async_predict_fn)
         else:
             fastapi_app.post("/predict", response_model=output_type)(predict_fn_sync)
 
+        @fastapi_app.middleware("http")
+        async def binary_predict_fn(request: Request, call_next):
+            """Serves the requests sent to ``/predict`` with the binary wire format of the load balancer."""
+            if request.url.path != "/predict" or request.headers.get("content-type") != _BINARY_CONTENT_TYPE:
+                return await call_next(request)
+            try:
+                data = input_type(**_decode_batch(await request.body()))
+                x_request_timeout = request.headers.get("x-request-timeout")
+                timeout = float(x_request_timeout) if x_request_timeout is not None else self._request_timeout
+            except (ValueError, TypeError) as ex:
+                return JSONResponse(status_code=400, content={"detail": str(ex)})
+
+            if batcher is not None:
+                try:
+                    output = await batcher.submit(data, timeout=timeout)
+                except HTTPException as ex:
+                    return JSONResponse(status_code=ex.status_code, content={"detail": ex.detail})
+            elif asyncio.iscoroutinefunction(self.predict):
+                output = await self.predict(data)
+            else:
+                output = await run_in_threadpool(self.predict, data)
+            if not isinstance(output, BaseModel):
+                output = output_type(**output)
+            return Response(content=_encode_batch(output.dict()), media_type=_BINARY_CONTENT_TYPE)
+
     def get_code_sample(self, url: str) -> Optional[str]:
         input_type: Any = self.configure_input_type()
         output_type: Any = self.configure_output_type()
@@ -0,0 +1,104 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+
+@dataclass
+class ReplicaStatus:
+    """The load of a single replica as tracked by the load balancer.
+
+    Args:
+        url: The url of the replica.
+        num_in_flight: The number of batches sent to the replica that haven't been answered yet.
+        latency_ewma: The exponentially weighted moving average of the batch latency in seconds, ``None`` until the
+            first batch completes.
+    """
+
+    url: str
+    num_in_flight: int = 0
+    latency_ewma: Optional[float] = None
+
+    def record_latency(self, latency: float, alpha: float) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = alpha * latency + (1 - alpha) * self.latency_ewma
+
+
+class SchedulingPolicy(ABC):
+    """A SchedulingPolicy decides which replica the load balancer sends the next batch to.
+
+    Subclasses implement :meth:`select`, which only receives the replicas that have room for one more batch.
+    """
+
+    @abstractmethod
+    def select(self, replicas: List[ReplicaStatus]) -> ReplicaStatus:
+        """Returns the replica to send the next batch to.
+
+        Args:
+            replicas: The non-empty list of replicas with capacity for one more batch.
+        """
+
+
+class LeastOutstandingRequests(SchedulingPolicy):
+    """Sends the batch to the replica with the fewest batches in flight."""
+
+    def select(self, replicas: List[ReplicaStatus]) -> ReplicaStatus:
+        return min(replicas, key=lambda replica: replica.num_in_flight)
+
+
+class PowerOfTwoChoices(SchedulingPolicy):
+    """Samples two replicas at random and sends the batch to the one with the fewest batches in flight."""
+
+    def select(self, replicas: List[ReplicaStatus]) -> ReplicaStatus:
+        if len(replicas) < 2:
+            return replicas[0]
+        first, second = random.sample(replicas, 2)
+        return first if first.num_in_flight <= second.num_in_flight else second
+
+
+class LatencyWeighted(SchedulingPolicy):
+    """Sends the batch to the replica with the lowest expected completion time, estimated as its latency EWMA
+    times the number of batches it would have in flight.
+
+    Replicas without latency measurements yet are preferred so that every replica gets measured.
+    """
+
+    def select(self, replicas: List[ReplicaStatus]) -> ReplicaStatus:
+        unmeasured = [replica for replica in replicas if replica.latency_ewma is None]
+        if unmeasured:
+            return min(unmeasured, key=lambda replica: replica.num_in_flight)
+        return min(replicas, key=lambda replica: replica.latency_ewma * (replica.num_in_flight + 1))
+
+
+_SCHEDULING_POLICIES = {
+    "least_outstanding": LeastOutstandingRequests,
+    "power_of_two": PowerOfTwoChoices,
+    "latency_ewma": LatencyWeighted,
+}
+
+
+def _get_scheduling_policy(scheduling_policy: Union[SchedulingPolicy, str]) -> SchedulingPolicy:
+    if isinstance(scheduling_policy, SchedulingPolicy):
+        return scheduling_policy
+    if isinstance(scheduling_policy, str) and scheduling_policy in _SCHEDULING_POLICIES:
+        return _SCHEDULING_POLICIES[scheduling_policy]()
+    raise ValueError(
+        f"scheduling_policy must be of type SchedulingPolicy or one of {list(_SCHEDULING_POLICIES)},"
+        f" got {scheduling_policy!r}"
+    )
@@ -0,0 +1,96 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A length-prefixed binary framing for the batches exchanged between the load balancer and the servers.
+
+A frame is laid out as::
+
+    MAGIC | header length (uint32, big endian) | JSON header | buffer 0 | buffer 1 | ...
+
+The JSON header holds the payload in which every ``bytes`` value and every string longer than
+``_INLINE_THRESHOLD`` characters is replaced by a reference to one of the raw buffers that follow it. Large payloads,
+such as base64 encoded images, are therefore copied as-is instead of being escaped and parsed as JSON strings.
+"""
+
+import json
+import struct
+from typing import Any, List
+
+_BINARY_CONTENT_TYPE = "application/x-lightning-batch"
+_WIRE_FORMATS = ("json", "binary")
+
+_MAGIC = b"LTB1"
+_HEADER_LENGTH = struct.Struct(">I")
+_BUFFER_KEY = "__lightning_buffer__"
+_IS_STR_KEY = "__lightning_str__"
+_INLINE_THRESHOLD = 1024
+
+
+def _extract_buffers(obj: Any, buffers: List[bytes]) -> Any:
+    if isinstance(obj, dict):
+        return {key: _extract_buffers(value, buffers) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_extract_buffers(value, buffers) for value in obj]
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        buffers.append(obj)
+        return {_BUFFER_KEY: len(buffers) - 1}
+    if isinstance(obj, str) and len(obj) > _INLINE_THRESHOLD:
+        buffers.append(obj.encode("utf-8"))
+        return {_BUFFER_KEY: len(buffers) - 1, _IS_STR_KEY: True}
+    return obj
+
+
+def _restore_buffers(obj: Any, buffers: List[memoryview]) -> Any:
+    if isinstance(obj, dict):
+        if _BUFFER_KEY in obj:
+            buffer = buffers[obj[_BUFFER_KEY]]
+            return str(buffer, "utf-8") if obj.get(_IS_STR_KEY) else bytes(buffer)
+        return {key: _restore_buffers(value, buffers) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_restore_buffers(value, buffers) for value in obj]
+    return obj
+
+
+def _encode_batch(obj: Any) -> bytes:
+    """Encodes a JSON-like object, possibly holding ``bytes``, into a binary frame."""
+    buffers: List[bytes] = []
+    data = _extract_buffers(obj, buffers)
+    header = json.dumps({"buffers": [len(buffer) for buffer in buffers], "data": data}).encode("utf-8")
+    return b"".join([_MAGIC, _HEADER_LENGTH.pack(len(header)), header, *buffers])
+
+
+def _decode_batch(frame: bytes) -> Any:
+    """Decodes a binary frame produced by :func:`_encode_batch`."""
+    view = memoryview(frame)
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        raise ValueError("The payload isn't a binary batch frame.")
+    offset = len(_MAGIC)
+    try:
+        (header_length,) = _HEADER_LENGTH.unpack_from(view, offset)
+    except struct.error as ex:
+        raise ValueError("The binary batch frame is truncated before the length of its header.") from ex
+    offset += _HEADER_LENGTH.size
+    header = json.loads(str(view[offset : offset + header_length], "utf-8"))
+    offset += header_length
+
+    try:
+        buffers = []
+        for length in header["buffers"]:
+            buffers.append(view[offset : offset + length])
+            offset += length
+        if offset != len(view):
+            raise ValueError(f"The binary batch frame is corrupted, expected {offset} bytes but got {len(view)}.")
+        return _restore_buffers(header["data"], buffers)
+    except (KeyError, IndexError, TypeError) as ex:
+        raise ValueError(f"The header of the binary batch frame is invalid: {ex!r}") from ex
@@ -13,22 +13,25 @@
 # limitations under the License.
 
 import asyncio
+import functools
 import json
 import os
 import queue
 import sys
 import traceback
+import uuid
+from collections import deque
 from copy import deepcopy
 from multiprocessing import Queue
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from threading import Event, Lock, Thread
-from time import sleep
-from typing import Dict, List, Mapping, Optional, Union
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
 
 import uvicorn
 from deepdiff import DeepDiff, Delta
 from fastapi import FastAPI, File, HTTPException, Request, Response, status, UploadFile, WebSocket
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.params import Header
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -91,6 +94,131 @@ responses_store = {}
 
 logger = Logger(__name__)
 
+
+def _escape_pointer(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Returns the JSON patch operations (RFC 6902) transforming ``old`` into ``new``."""
+    if old == new and type(old) is type(new):
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{"op": "remove", "path": f"{path}/{_escape_pointer(key)}"} for key in old if key not in new]
+        for key, value in new.items():
+            key_path = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": key_path, "value": value})
+            else:
+                ops += _json_patch(old[key], value, key_path)
+        return ops
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        ops = []
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            ops += _json_patch(old_value, new_value, f"{path}/{index}")
+        # the extra items are removed from the end so that the indices of the ones before don't change
+        ops += [{"op": "remove", "path": f"{path}/{index}"} for index in reversed(range(len(new), len(old)))]
+        ops += [{"op": "add", "path": f"{path}/-", "value": value} for value in new[len(old) :]]
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class _StateBroadcaster:
+    """Versions the app state published by the :class:`UIRefresher` and keeps the JSON patches between the last
+    versions, so that they are computed and serialized once for all the websocket clients.
+
+    The versions are sent to the clients as tags prefixed with a random token of the process, so that the tags of a
+    previous API server process don't match the versions of this one.
+
+    Args:
+        max_patches: The number of patches kept. Clients lagging further behind receive the whole state.
+    """
+
+    def __init__(self, max_patches: int = 100) -> None:
+        self.version = 0
+        self.boot_id = uuid.uuid4().hex[:16]
+        self._state: Optional[Mapping] = None
+        self._state_message: Optional[Tuple[int, str]] = None
+        self._patch_messages: Deque[Tuple[int, str]] = deque(maxlen=max_patches)
+        self._lock = Lock()
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def publish(self, state: Mapping) -> None:
+        """Records a new version of the state and wakes up the websockets waiting for it.
+
+        This is called from the thread of the :class:`UIRefresher`.
+        """
+        patch = None if self._state is None else _json_patch(self._state, state)
+        with self._lock:
+            if patch == []:
+                return
+            self.version += 1
+            self._state = state
+            if patch is not None:
+                message = _dumps({"version": self.tag(self.version), "patch": patch})
+                self._patch_messages.append((self.version, message))
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._notify(), loop)
+
+    def state_message(self) -> Tuple[int, str]:
+        """Returns the current version and the message holding the whole state at this version."""
+        with self._lock:
+            if self._state_message is None or self._state_message[0] != self.version:
+                message = _dumps({"version": self.tag(self.version), "state": self._state or {}})
+                self._state_message = (self.version, message)
+            return self._state_message
+
+    def tag(self, version: int) -> str:
+        """Returns the tag identifying the given version of the state of this process."""
+        return f"{self.boot_id}-{version}"
+
+    def parse_tag(self, tag: str) -> Optional[int]:
+        """Returns the version identified by the tag, ``None`` if the tag comes from another process."""
+        boot_id, _, version = tag.rpartition("-")
+        if boot_id != self.boot_id or not version.isdigit() or int(version) > self.version:
+            return None
+        return int(version)
+
+    def messages_since(self, version: int) -> Tuple[int, List[str]]:
+        """Returns the current version and the messages a client at the given version needs to reach it."""
+        with self._lock:
+            if version == self.version:
+                return version, []
+            messages = [message for message_version, message in self._patch_messages if message_version > version]
+            if len(messages) == self.version - version:
+                return self.version, messages
+        version, message = self.state_message()
+        return version, [message]
+
+    def _get_condition(self) -> asyncio.Condition:
+        # created lazily so that the condition is bound to the event loop of the server
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    async def _notify(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    async def wait_for_version(self, version: int) -> int:
+        """Waits until the state is newer than the given version and returns its current version."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.version != version)
+        return self.version
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(jsonable_encoder(obj))
+
+
+state_broadcaster = _StateBroadcaster()
+
 # This can be replaced with a consumer that publishes states in a kv-store
 # in a serverless architecture
 
@@ -113,19 +241,22 @@ class UIRefresher(Thread):
         # TODO: Investigate the use of `parallel=True`
         try:
             while not self._exit_event.is_set():
-                self.run_once()
-                # Note: Sleep to reduce queue calls.
-                sleep(self.refresh_interval)
+                # Note: The state queue is waited on instead of sleeping so that new states are published right away.
+                self.run_once(timeout=self.refresh_interval)
         except Exception as e:
             logger.error(traceback.print_exc())
             raise e
 
-    def run_once(self):
+    def run_once(self, timeout: float = 0):
         try:
             global app_status
-            state, app_status = self.api_publish_state_queue.get(timeout=0)
+            state, app_status = self.api_publish_state_queue.get(timeout=timeout)
             with lock:
                 global_app_state_store.set_app_state(TEST_SESSION_UUID, state)
+                state = global_app_state_store.get_app_state(TEST_SESSION_UUID)
+                # the version is bumped along with the state, so that `get_state` never serves a state with the ETag
+                # of another version
+                state_broadcaster.publish(state)
         except queue.Empty:
             pass
 
@@ -199,6 +330,7 @@ async def get_state(
     x_lightning_type: Optional[str] = Header(None),
     x_lightning_session_uuid: Optional[str] = Header(None),
     x_lightning_session_id: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
 ) -> Mapping:
     if x_lightning_session_uuid is None:
         raise Exception("Missing X-Lightning-Session-UUID header")
@@ -210,9 +342,14 @@ async def get_state(
         return {"status": "failure", "reason": "This endpoint is disabled."}
 
     with lock:
+        # the `UIRefresher` replaces the state and bumps its version under the same lock
+        etag = f'"{state_broadcaster.tag(state_broadcaster.version)}"'
+        if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
         x_lightning_session_uuid = TEST_SESSION_UUID
         state = global_app_state_store.get_app_state(x_lightning_session_uuid)
         global_app_state_store.set_served_state(x_lightning_session_uuid, state)
+        response.headers["ETag"] = etag
         return state
 
 
@@ -392,22 +529,68 @@ async def healthz(response: Response):
 # Creates session websocket connection to notify client about any state changes
 # The websocket instance needs to be stored based on session id so it is accessible in the api layer
 @fastapi_service.websocket("/api/v1/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, deltas: bool = False, version: Optional[str] = None):
+    """Notifies the client of the state changes.
+
+    By default, only the version of the state is sent and the client needs to GET ``/api/v1/state``. With
+    ``?deltas=true``, the client first receives ``{"version": ..., "state": ...}`` and then
+    ``{"version": ..., "patch": ...}`` messages holding the JSON patches to apply to it. A client passing the
+    ``version`` it already has only receives the patches since then, unless the version comes from a previous API
+    server process, in which case the whole state is sent first.
+    """
+    # read before accepting so that the client is notified of any change made once it is connected
+    current_version = state_broadcaster.version
     await websocket.accept()
     if not ENABLE_STATE_WEBSOCKET:
         await websocket.close()
         return
+    # the updates are sent from another task as the state changes can't be waited on along with the disconnection
+    sender = asyncio.ensure_future(_send_state_updates(websocket, deltas, version, current_version))
+    sender.add_done_callback(functools.partial(_on_state_updates_done, websocket))
+    try:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        sender.cancel()
+
+
+async def _send_state_updates(websocket: WebSocket, deltas: bool, tag: Optional[str], current_version: int) -> None:
     try:
-        counter = global_app_state_store.counter
-        while True:
-            if global_app_state_store.counter != counter:
-                await websocket.send_text(f"{global_app_state_store.counter}")
-                counter = global_app_state_store.counter
+        if deltas:
+            version = None if tag is None else state_broadcaster.parse_tag(tag)
+            if version is None:
+                version, message = state_broadcaster.state_message()
+                await websocket.send_text(message)
+            while True:
+                version, messages = state_broadcaster.messages_since(version)
+                for message in messages:
+                    await websocket.send_text(message)
+                await state_broadcaster.wait_for_version(version)
+                logger.debug("Updated websocket.")
+        else:
+            version = current_version
+            while True:
+                version = await state_broadcaster.wait_for_version(version)
+                await websocket.send_text(f"{version}")
                 logger.debug("Updated websocket.")
-            await asyncio.sleep(0.01)
     except ConnectionClosed:
         logger.debug("Websocket connection closed")
-    await websocket.close()
+        await websocket.close()
+
+
+def _on_state_updates_done(websocket: WebSocket, sender: "asyncio.Future[None]") -> None:
+    if sender.cancelled() or sender.exception() is None:
+        return
+    # the client would otherwise stay connected without receiving the state changes
+    logger.error(f"Failed to send the state updates to the websocket: {sender.exception()!r}")
+    asyncio.ensure_future(_close_websocket(websocket))
+
+
+async def _close_websocket(websocket: WebSocket) -> None:
+    try:
+        await websocket.close(code=1011)
+    except Exception as ex:
+        logger.debug(f"Failed to close the websocket: {ex!r}")
 
 
 async def api_catch_all(request: Request, full_path: str):
@@ -29,10 +29,12 @@ import lightning.app
 from lightning.app import _console
 from lightning.app.api.request_types import _APIRequest, _CommandRequest, _DeltaRequest
 from lightning.app.core.constants import (
+    CHECKPOINT_INCREMENTAL,
     DEBUG_ENABLED,
     FLOW_DURATION_SAMPLES,
     FLOW_DURATION_THRESHOLD,
     FRONTEND_DIR,
+    STATE_ACCUMULATE_BATCH_SIZE,
     STATE_ACCUMULATE_WAIT,
 )
 from lightning.app.core.queues import BaseQueue
@@ -50,8 +52,9 @@ from lightning.app.utilities.app_helpers import (
     Logger,
 )
 from lightning.app.utilities.app_status import AppStatus
+from lightning.app.utilities.checkpoint_log import _CheckpointLog
 from lightning.app.utilities.commands.base import _process_requests
-from lightning.app.utilities.component import _convert_paths_after_init, _validate_root_flow
+from lightning.app.utilities.component import _ComponentSnapshot, _convert_paths_after_init, _validate_root_flow
 from lightning.app.utilities.enum import AppStage, CacheCallsKeys
 from lightning.app.utilities.exceptions import CacheMissException, ExitAppException
 from lightning.app.utilities.layout import _collect_layout
@@ -151,6 +154,7 @@ class LightningApp:
         self.stage = AppStage.RUNNING
         self._has_updated: bool = True
         self._schedules: Dict[str, Dict] = {}
+        self._scheduler_thread: Optional[SchedulerThread] = None
         self.threads: List[threading.Thread] = []
         self.exception = None
         self.collect_changes: bool = True
@@ -164,6 +168,9 @@ class LightningApp:
         # we will need to revisit the logic at _should_snapshot, since right now
         # we are writing checkpoints too often, and this is expensive.
         self.checkpointing: bool = False
+        # Whether the checkpoints only contain the components which changed since the previous one.
+        self.incremental_checkpointing: bool = CHECKPOINT_INCREMENTAL
+        self._checkpoint_log: Optional[_CheckpointLog] = None
 
         self._update_layout()
         self._update_status()
@@ -172,7 +179,12 @@ class LightningApp:
 
         self._original_state = None
         self._last_state = self.state
+        # copies of the components taken along the last state, used to only diff the components which changed
+        self._component_snapshots: Optional[Dict[str, _ComponentSnapshot]] = None
+        self._structure_versions: Dict[str, Tuple[int, int, int]] = {}
+        self._snapshot_stage: Optional[AppStage] = None
         self.state_accumulate_wait = STATE_ACCUMULATE_WAIT
+        self.state_accumulate_batch_size = STATE_ACCUMULATE_BATCH_SIZE
 
         self._last_run_time = 0.0
         self._run_times = []
@@ -259,6 +271,7 @@ class LightningApp:
         self.set_last_state(state)
         self.root.set_state(state)
         self.stage = AppStage(state["app_state"]["stage"])
+        self._component_snapshots = None
 
     @property
     def last_state(self):
@@ -317,6 +330,13 @@ class LightningApp:
         except queue.Empty:
             return None
 
+    @staticmethod
+    def get_states_changed_from_queue(q: BaseQueue, max_items: int, timeout: Optional[int] = None) -> List:
+        try:
+            return q.batch_get(max_items, timeout=timeout or q.default_timeout)
+        except queue.Empty:
+            return []
+
     def check_error_queue(self) -> None:
         exception: Exception = self.get_state_changed_from_queue(self.error_queue)
         if isinstance(exception, Exception):
@@ -350,11 +370,13 @@ class LightningApp:
 
         while (time() - t0) < self.state_accumulate_wait:
 
-            # TODO: Fetch all available deltas at once to reduce queue calls.
-            delta: Optional[
+            received: List[
                 Union[_DeltaRequest, _APIRequest, _CommandRequest, ComponentDelta]
-            ] = self.get_state_changed_from_queue(self.delta_queue)
-            if delta:
+            ] = self.get_states_changed_from_queue(self.delta_queue, self.state_accumulate_batch_size)
+            if not received:
+                break
+
+            for delta in received:
                 if isinstance(delta, _DeltaRequest):
                     deltas.append(delta.delta)
                 elif isinstance(delta, ComponentDelta):
@@ -368,10 +390,8 @@ class LightningApp:
                     if work:
                         delta = _delta_to_app_state_delta(self.root, work, deepcopy(delta.delta))
                         deltas.append(delta)
-                else:
+                elif delta:
                     api_or_command_request_deltas.append(delta)
-            else:
-                break
 
         if api_or_command_request_deltas:
             _process_requests(self, api_or_command_request_deltas)
@@ -387,10 +407,67 @@ class LightningApp:
             delta.raise_errors = False
         return deltas
 
+    def _get_structure_versions(self) -> Dict[str, Tuple[int, int, int]]:
+        return {
+            structure.name: (id(structure), structure._state_version, len(structure))
+            for flow in self.flows
+            for structure in (getattr(flow, name) for name in flow._structures)
+        }
+
+    def _snapshot_components(self) -> None:
+        self._component_snapshots = {
+            component.name: _ComponentSnapshot(component) for component in self.flows + self.works
+        }
+        self._structure_versions = self._get_structure_versions()
+        self._snapshot_stage = self.stage
+
+    def _find_changed_components(self) -> Optional[List[Union["LightningFlow", LightningWork]]]:
+        """Returns the components whose state changed since they were snapshotted, or ``None`` if the components
+        themselves changed and the whole state needs to be diffed."""
+        if self._component_snapshots is None or self._get_structure_versions() != self._structure_versions:
+            return None
+        components = self.flows + self.works
+        if len(components) != len(self._component_snapshots):
+            return None
+        changed_components = []
+        for component in components:
+            snapshot = self._component_snapshots.get(component.name)
+            if snapshot is None or snapshot.component is not component:
+                return None
+            if snapshot.has_changed():
+                changed_components.append(component)
+        return changed_components
+
+    def _has_state_changed(self) -> bool:
+        """Returns whether the state changed since the last state was set, updating the snapshots of the components
+        which changed."""
+        changed_components = self._find_changed_components()
+
+        if changed_components is not None:
+            for component in changed_components:
+                self._component_snapshots[component.name] = _ComponentSnapshot(component)
+            has_changed = bool(changed_components) or self.stage != self._snapshot_stage
+            self._snapshot_stage = self.stage
+            return has_changed
+
+        # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
+        last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
+        state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
+        deep_diff = DeepDiff(last_state, state, verbose_level=2)
+
+        if "unprocessed" in deep_diff:
+            # pop the unprocessed key.
+            unprocessed = deep_diff.pop("unprocessed")
+            logger.warn(f"It seems delta differentiation resulted in {unprocessed}. Open an issue on Github.")
+
+        self._snapshot_components()
+        return bool(deep_diff)
+
     def maybe_apply_changes(self) -> None:
         """Get the deltas from both the flow queue and the work queue, merge the two deltas and update the
         state."""
-        self._send_flow_to_work_deltas(self.state)
+        if self.flow_to_work_delta_queues:
+            self._send_flow_to_work_deltas(self.state)
 
         if not self.collect_changes:
             return None
@@ -398,19 +475,9 @@ class LightningApp:
         deltas = self._collect_deltas_from_ui_and_work_queues()
 
         if not deltas:
-            # Path and Drive aren't processed by DeepDiff, so we need to convert them to dict.
-            last_state = apply_to_collection(self.last_state, (Path, Drive), lambda x: x.to_dict())
-            state = apply_to_collection(self.state, (Path, Drive), lambda x: x.to_dict())
             # When no deltas are received from the Rest API or work queues,
             # we need to check if the flow modified the state and populate changes.
-            deep_diff = DeepDiff(last_state, state, verbose_level=2)
-
-            if "unprocessed" in deep_diff:
-                # pop the unprocessed key.
-                unprocessed = deep_diff.pop("unprocessed")
-                logger.warn(f"It seems delta differentiation resulted in {unprocessed}. Open an issue on Github.")
-
-            if deep_diff:
+            if self._has_state_changed():
                 # TODO: Resolve changes with ``CacheMissException``.
                 # new_state = self.populate_changes(self.last_state, self.state)
                 self.set_last_state(self.state)
@@ -610,6 +677,9 @@ class LightningApp:
         if not os.path.exists(checkpoints_dir):
             raise FileNotFoundError(f"The provided directory `{checkpoints_dir}` doesn't exist.")
         checkpoints = [f for f in os.listdir(checkpoints_dir) if f.startswith("v_") and f.endswith(".json")]
+        if (self.incremental_checkpointing or not checkpoints) and _CheckpointLog.generations(checkpoints_dir):
+            self.load_state_dict(_CheckpointLog(checkpoints_dir).load(version))
+            return
         if not checkpoints:
             raise Exception(f"No checkpoints where found in `{checkpoints_dir}`.")
 
@@ -633,6 +703,11 @@ class LightningApp:
             return None
         os.makedirs(checkpoints_dir, exist_ok=True)
 
+        if self.incremental_checkpointing:
+            if self._checkpoint_log is None or self._checkpoint_log.checkpoints_dir != checkpoints_dir:
+                self._checkpoint_log = _CheckpointLog(checkpoints_dir)
+            return self._checkpoint_log.append(self)
+
         # Get all current version within the provided folder and sort them
         checkpoint_versions = sorted(
             int(f.split("_")[1]) for f in os.listdir(checkpoints_dir) if f.startswith("v_") and f.endswith(".json")
@@ -660,12 +735,13 @@ class LightningApp:
 
     def _register_schedule(self, schedule_hash: str, schedule_metadata: Dict) -> None:
         # create a thread only if a user uses the flow's schedule method.
-        if not self._schedules:
-            scheduler_thread = SchedulerThread(self)
-            scheduler_thread.setDaemon(True)
-            self.threads.append(scheduler_thread)
+        if self._scheduler_thread is None:
+            self._scheduler_thread = SchedulerThread(self)
+            self._scheduler_thread.setDaemon(True)
+            self.threads.append(self._scheduler_thread)
             self.threads[-1].start()
         self._schedules[schedule_hash] = deepcopy(schedule_metadata)
+        self._scheduler_thread.add_schedule(schedule_hash, self._schedules[schedule_hash])
 
     def on_run_once_end(self) -> None:
         if not self._schedules:
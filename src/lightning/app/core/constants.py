@@ -27,6 +27,8 @@ def get_lightning_cloud_url() -> str:
 SUPPORTED_PRIMITIVE_TYPES = (type(None), str, int, float, bool)
 STATE_UPDATE_TIMEOUT = 0.001
 STATE_ACCUMULATE_WAIT = 0.15
+# Maximum number of deltas fetched from the delta queue with a single queue call
+STATE_ACCUMULATE_BATCH_SIZE = int(os.getenv("LIGHTNING_STATE_ACCUMULATE_BATCH_SIZE", "100"))
 # Duration in seconds of a moving average of a full flow execution
 # beyond which an exception is raised.
 FLOW_DURATION_THRESHOLD = 1.0
@@ -39,6 +41,8 @@ APP_SERVER_PORT = 7501
 APP_STATE_MAX_SIZE_BYTES = 1024 * 1024  # 1 MB
 
 WARNING_QUEUE_SIZE = 1000
+# Number of puts after which the length of an HTTP queue is checked against `WARNING_QUEUE_SIZE`
+HTTP_QUEUE_LENGTH_CHECK_INTERVAL = 100
 # different flag because queue debug can be very noisy, and almost always not useful unless debugging the queue itself.
 QUEUE_DEBUG_ENABLED = bool(int(os.getenv("LIGHTNING_QUEUE_DEBUG_ENABLED", "0")))
 
@@ -46,10 +50,19 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
 REDIS_QUEUES_READ_DEFAULT_TIMEOUT = 0.005
+# Items whose serialized size is larger than this number of bytes are compressed with zstd when `zstandard` is
+# installed. Compression is disabled when set to 0.
+REDIS_QUEUE_COMPRESSION_THRESHOLD = int(os.getenv("LIGHTNING_REDIS_QUEUE_COMPRESSION_THRESHOLD", "0"))
 
 HTTP_QUEUE_URL = os.getenv("LIGHTNING_HTTP_QUEUE_URL", "http://localhost:9801")
 HTTP_QUEUE_REFRESH_INTERVAL = float(os.getenv("LIGHTNING_HTTP_QUEUE_REFRESH_INTERVAL", "1"))
 HTTP_QUEUE_TOKEN = os.getenv("LIGHTNING_HTTP_QUEUE_TOKEN", None)
+# Maximum number of seconds the queue service is asked to hold a `pop` request until an item is available.
+# Long polling is disabled when set to 0.
+HTTP_QUEUE_LONG_POLL_TIMEOUT = float(os.getenv("LIGHTNING_HTTP_QUEUE_LONG_POLL_TIMEOUT", "20"))
+# Back the queues of the local multiprocess runtime with ring buffers of this size in shared memory instead of pipes
+MULTIPROCESS_SHARED_MEMORY_QUEUES = bool(int(os.getenv("LIGHTNING_MULTIPROCESS_SHARED_MEMORY_QUEUES", "0")))
+SHARED_MEMORY_QUEUE_SIZE = int(os.getenv("LIGHTNING_SHARED_MEMORY_QUEUE_SIZE", str(8 * 1024 * 1024)))
 
 USER_ID = os.getenv("USER_ID", "1234")
 FRONTEND_DIR = str(Path(__file__).parent.parent / "ui")
@@ -103,6 +116,20 @@ def get_cloud_queue_type() -> Optional[str]:
 
 # Number of seconds to wait between filesystem checks when waiting for files in remote storage
 REMOTE_STORAGE_WAIT = 0.5
+# Transfer the Paths as content-addressed chunks, so that the chunks already in the shared storage aren't copied again
+STORAGE_CONTENT_ADDRESSED = bool(int(os.getenv("LIGHTNING_STORAGE_CONTENT_ADDRESSED", "0")))
+STORAGE_CHUNK_SIZE = int(os.getenv("LIGHTNING_STORAGE_CHUNK_SIZE", str(8 * 1024 * 1024)))
+# Number of file transfer requests processed concurrently by the StorageOrchestrator and by the Copier of each work
+STORAGE_NUM_WORKERS = int(os.getenv("LIGHTNING_STORAGE_NUM_WORKERS", "4"))
+# The files larger than this are transferred by ranges of this size, read in parallel by the given number of threads
+STORAGE_TRANSFER_CHUNK_SIZE = int(os.getenv("LIGHTNING_STORAGE_TRANSFER_CHUNK_SIZE", str(16 * 1024 * 1024)))
+STORAGE_TRANSFER_NUM_WORKERS = int(os.getenv("LIGHTNING_STORAGE_TRANSFER_NUM_WORKERS", "8"))
+
+# Write the app checkpoints as a log of the changed components, folded into a new base after the given number of records
+CHECKPOINT_INCREMENTAL = bool(int(os.getenv("LIGHTNING_CHECKPOINT_INCREMENTAL", "0")))
+CHECKPOINT_COMPACTION_INTERVAL = int(os.getenv("LIGHTNING_CHECKPOINT_COMPACTION_INTERVAL", "100"))
+# Bytes of write-ahead log stored to the Drive by an incrementally stored Database after which a new base is stored
+DATABASE_COMPACTION_SIZE = int(os.getenv("LIGHTNING_DATABASE_COMPACTION_SIZE", str(64 * 1024 * 1024)))
 
 
 # interruptible support
@@ -109,6 +109,8 @@ class LightningFlow:
         from lightning.app.runners.backends.backend import Backend
 
         self._state = set()
+        # bumped every time a state attribute is set so that unchanged flows can be skipped when diffing the state
+        self._state_version = 0
         self._name = ""
         self._flows = set()
         self._works = set()
@@ -235,6 +237,8 @@ class LightningFlow:
                     "and therefore don't need to be JSON-serializable."
                 )
 
+            super().__setattr__("_state_version", self._state_version + 1)
+
         super().__setattr__(name, value)
 
     @staticmethod
@@ -15,18 +15,24 @@
 import multiprocessing
 import pickle
 import queue  # needed as import instead from/import for mocking in tests
+import struct
+import threading
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from enum import Enum
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
 
 from lightning.app.core.constants import (
+    HTTP_QUEUE_LENGTH_CHECK_INTERVAL,
+    HTTP_QUEUE_LONG_POLL_TIMEOUT,
     HTTP_QUEUE_REFRESH_INTERVAL,
     HTTP_QUEUE_TOKEN,
     HTTP_QUEUE_URL,
@@ -35,17 +41,22 @@ from lightning.app.core.constants import (
     REDIS_HOST,
     REDIS_PASSWORD,
     REDIS_PORT,
+    REDIS_QUEUE_COMPRESSION_THRESHOLD,
     REDIS_QUEUES_READ_DEFAULT_TIMEOUT,
+    SHARED_MEMORY_QUEUE_SIZE,
     STATE_UPDATE_TIMEOUT,
     WARNING_QUEUE_SIZE,
 )
 from lightning.app.utilities.app_helpers import Logger
-from lightning.app.utilities.imports import _is_redis_available, requires
+from lightning.app.utilities.imports import _is_redis_available, _is_zstandard_available, requires
 from lightning.app.utilities.network import HTTPClient
 
 if _is_redis_available():
     import redis
 
+if _is_zstandard_available():
+    import zstandard
+
 logger = Logger(__name__)
 
 
@@ -66,14 +77,33 @@ API_RESPONSE_QUEUE_CONSTANT = "API_RESPONSE_QUEUE"
 FLOW_TO_WORKS_DELTA_QUEUE_CONSTANT = "FLOW_TO_WORKS_DELTA_QUEUE"
 
 
+# status codes returned by queue services which don't implement the `popmany` and `pushmany` actions
+_UNSUPPORTED_ACTION_STATUS_CODES = (400, 404, 405, 422)
+
+
+class _BatchActionNotSupported(Exception):
+    pass
+
+
+# header set by the queue services holding the `pop` requests with a `wait` parameter until an item is available
+_LONG_POLL_HEADER = "X-Lightning-Long-Poll"
+
+
+class _QueueUnavailable(queue.Empty):
+    pass
+
+
 class QueuingSystem(Enum):
     MULTIPROCESS = "multiprocess"
+    SHARED_MEMORY = "shared_memory"
     REDIS = "redis"
     HTTP = "http"
 
     def get_queue(self, queue_name: str) -> "BaseQueue":
         if self == QueuingSystem.MULTIPROCESS:
             return MultiProcessQueue(queue_name, default_timeout=STATE_UPDATE_TIMEOUT)
+        elif self == QueuingSystem.SHARED_MEMORY:
+            return SharedMemoryQueue(queue_name, default_timeout=STATE_UPDATE_TIMEOUT)
         elif self == QueuingSystem.REDIS:
             return RedisQueue(queue_name, default_timeout=REDIS_QUEUES_READ_DEFAULT_TIMEOUT)
         else:
@@ -185,6 +215,38 @@ class BaseQueue(ABC):
         """
         pass
 
+    def batch_put(self, items: List[Any]) -> None:
+        """Appends all the items to the queue.
+
+        Child classes should override this method to push the items with as few calls as possible.
+        """
+        for item in items:
+            self.put(item)
+
+    def batch_get(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """Returns up to ``max_items`` elements from the left of the queue.
+
+        Waits for the first element like :meth:`get` does with the given ``timeout`` and raises ``queue.Empty`` if
+        none is available. Then, returns the elements that are already available, without waiting further.
+
+        Child classes should override this method to fetch the items with as few calls as possible.
+
+        Parameters
+        ----------
+        max_items:
+            The maximum number of elements to return.
+        timeout:
+            Read timeout in seconds for the first element, in case of input timeout is 0, the `self.default_timeout`
+            is used. A timeout of None can be used to block indefinitely.
+        """
+        items = [self.get(timeout=timeout)]
+        while len(items) < max_items:
+            try:
+                items.append(self.get(timeout=0))
+            except queue.Empty:
+                break
+        return items
+
     @property
     def is_running(self) -> bool:
         """Returns True if the queue is running, False otherwise.
@@ -209,6 +271,257 @@ class MultiProcessQueue(BaseQueue):
             timeout = self.default_timeout
         return self.queue.get(timeout=timeout, block=(timeout is None))
 
+    def batch_get(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        items = [self.get(timeout=timeout)]
+        # drain the items already received without waiting for more
+        while len(items) < max_items:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+
+class SharedMemoryQueue(MultiProcessQueue):
+    """A queue between the processes of the local runtime backed by a ring buffer in shared memory.
+
+    The items are pickled with protocol 5 and their large buffers, e.g. the ones of numpy arrays and payloads, are
+    copied straight into the shared memory and out of it, instead of going through a pipe. The items which don't fit
+    in half of the ring buffer are written into a dedicated shared memory segment, released by the process getting
+    them, and only its name goes through the ring buffer.
+
+    The ring buffer is released when the queue is collected in the process which created it.
+    """
+
+    def __init__(self, name: str, default_timeout: float, capacity: Optional[int] = None):
+        self.name = name
+        self.default_timeout = default_timeout
+        self.capacity = capacity or SHARED_MEMORY_QUEUE_SIZE
+        context = multiprocessing.get_context("spawn")
+        # the pages of the segment are only allocated once written to
+        self._shm = shared_memory.SharedMemory(create=True, size=_RING_HEADER.size + self.capacity)
+        _RING_HEADER.pack_into(self._shm.buf, 0, 0, 0)
+        self._lock = context.Lock()
+        self._not_empty = context.Condition(self._lock)
+        self._not_full = context.Condition(self._lock)
+        weakref.finalize(self, _release_shared_memory, self._shm)
+
+    def put(self, item: Any) -> None:
+        self.batch_put([item])
+
+    def batch_put(self, items: List[Any]) -> None:
+        # the items are pickled before taking the lock
+        records = [self._to_record(item) for item in items]
+        with self._not_full:
+            for kind, parts in records:
+                size = _RECORD_HEADER.size + sum(memoryview(part).nbytes for part in parts)
+                self._not_full.wait_for(lambda: self._free_bytes() >= size)
+                read_position, write_position = _RING_HEADER.unpack_from(self._shm.buf, 0)
+                position = self._write(write_position, _RECORD_HEADER.pack(size - _RECORD_HEADER.size, kind))
+                for part in parts:
+                    position = self._write(position, part)
+                _RING_HEADER.pack_into(self._shm.buf, 0, read_position, position)
+                self._not_empty.notify_all()
+
+    def get(self, timeout: int = None) -> Any:
+        return self.batch_get(1, timeout=timeout)[0]
+
+    def batch_get(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        if timeout == 0:
+            timeout = self.default_timeout
+        records = []
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise queue.Empty
+            # the items already available are read without waiting for more
+            while len(records) < max_items and self._has_items():
+                records.append(self._read_record())
+            self._not_full.notify_all()
+        return [self._from_record(kind, body) for kind, body in records]
+
+    def _to_record(self, item: Any) -> Tuple[int, List[Any]]:
+        data, raw_buffers = _dumps_out_of_band(item)
+        parts = _frame_parts(data, raw_buffers)
+        if not raw_buffers:
+            # the small items are written at once
+            parts = [b"".join(parts)]
+        size = sum(memoryview(part).nbytes for part in parts)
+        if _RECORD_HEADER.size + size <= self.capacity // 2:
+            return _RECORD_INLINE, parts
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        offset = 0
+        for part in parts:
+            part = memoryview(part).cast("B")
+            segment.buf[offset : offset + part.nbytes] = part
+            offset += part.nbytes
+        segment.close()
+        return _RECORD_SEGMENT, [segment.name.encode()]
+
+    @staticmethod
+    def _from_record(kind: int, body: bytearray) -> Any:
+        if kind == _RECORD_SEGMENT:
+            segment = shared_memory.SharedMemory(name=body.decode())
+            body = bytearray(segment.buf)
+            segment.close()
+            segment.unlink()
+        # the body is a copy owned by this process, the objects backed by the buffers are views into it
+        return _load_frame_body(memoryview(body), copy=False)
+
+    def _read_record(self) -> Tuple[int, bytearray]:
+        read_position, write_position = _RING_HEADER.unpack_from(self._shm.buf, 0)
+        header = self._read(read_position, _RECORD_HEADER.size)
+        size, kind = _RECORD_HEADER.unpack(header)
+        body = self._read(read_position + _RECORD_HEADER.size, size)
+        _RING_HEADER.pack_into(self._shm.buf, 0, read_position + _RECORD_HEADER.size + size, write_position)
+        return kind, body
+
+    def _write(self, position: int, data: Any) -> int:
+        data = memoryview(data).cast("B")
+        start = position % self.capacity
+        length = min(data.nbytes, self.capacity - start)
+        offset = _RING_HEADER.size
+        self._shm.buf[offset + start : offset + start + length] = data[:length]
+        # wraps around the end of the ring buffer
+        self._shm.buf[offset : offset + data.nbytes - length] = data[length:]
+        return position + data.nbytes
+
+    def _read(self, position: int, size: int) -> bytearray:
+        start = position % self.capacity
+        length = min(size, self.capacity - start)
+        offset = _RING_HEADER.size
+        data = bytearray(size)
+        data[:length] = self._shm.buf[offset + start : offset + start + length]
+        # wraps around the end of the ring buffer
+        data[length:] = self._shm.buf[offset : offset + size - length]
+        return data
+
+    def _free_bytes(self) -> int:
+        read_position, write_position = _RING_HEADER.unpack_from(self._shm.buf, 0)
+        return self.capacity - (write_position - read_position)
+
+    def _has_items(self) -> bool:
+        read_position, write_position = _RING_HEADER.unpack_from(self._shm.buf, 0)
+        return write_position != read_position
+
+
+def _release_shared_memory(shm: shared_memory.SharedMemory) -> None:
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+# The items holding out-of-band buffers or compressed are framed as:
+#   MAGIC | flags (1 byte) | body
+# where the body, compressed when the flag is set, is laid out as:
+#   number of buffers (uint32) | pickle length (uint64) | buffer lengths (uint64 each) | pickle | buffers
+# Other items are stored as plain pickles, which never start with MAGIC.
+_FRAME_MAGIC = b"LTQ1"
+_FRAME_COMPRESSED = 1
+_FRAME_HEADER = struct.Struct(">IQ")
+_FRAME_LENGTH = struct.Struct(">Q")
+# buffers smaller than this are kept inside the pickle
+_OUT_OF_BAND_THRESHOLD = 64 * 1024
+
+# The ring buffer of a SharedMemoryQueue starts with the positions up to which it was read and written, which only
+# increase. Each record is made of its length and kind, followed by the body of a frame or the name of the segment
+# holding it.
+_RING_HEADER = struct.Struct("<QQ")
+_RECORD_HEADER = struct.Struct("<QB")
+_RECORD_INLINE = 0
+_RECORD_SEGMENT = 1
+
+_REDIS_CONNECTION_POOLS: Dict[Tuple[str, int, Optional[str]], "redis.ConnectionPool"] = {}
+_REDIS_CONNECTION_POOLS_LOCK = threading.Lock()
+
+
+def _get_redis_connection_pool(host: str, port: int, password: Optional[str]) -> "redis.ConnectionPool":
+    """Returns the connection pool shared by all the queues connecting to the same redis server."""
+    key = (host, port, password)
+    with _REDIS_CONNECTION_POOLS_LOCK:
+        if key not in _REDIS_CONNECTION_POOLS:
+            _REDIS_CONNECTION_POOLS[key] = redis.ConnectionPool(host=host, port=port, password=password)
+        return _REDIS_CONNECTION_POOLS[key]
+
+
+def _dumps_out_of_band(item: Any) -> Tuple[bytes, List[memoryview]]:
+    """Pickles the item with protocol 5 and returns the pickle along with its large buffers, kept out-of-band."""
+    buffers: List[pickle.PickleBuffer] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        if buffer.raw().nbytes < _OUT_OF_BAND_THRESHOLD:
+            return True
+        buffers.append(buffer)
+        return False
+
+    data = pickle.dumps(item, protocol=5, buffer_callback=buffer_callback)
+    return data, [buffer.raw() for buffer in buffers]
+
+
+def _frame_parts(data: bytes, raw_buffers: List[memoryview]) -> List[Any]:
+    """Returns the parts of the body of a frame, in order, without joining them."""
+    return [
+        _FRAME_HEADER.pack(len(raw_buffers), len(data)),
+        *(_FRAME_LENGTH.pack(raw.nbytes) for raw in raw_buffers),
+        data,
+        *raw_buffers,
+    ]
+
+
+def _load_frame_body(body: memoryview, copy: bool = True) -> Any:
+    """Loads the item from the body of a frame.
+
+    The out-of-band buffers are copied unless ``copy`` is False, in which case they are views into the body, which
+    needs to be writable for the objects backed by the buffers, e.g. numpy arrays, to be.
+    """
+    num_buffers, data_length = _FRAME_HEADER.unpack_from(body)
+    offset = _FRAME_HEADER.size
+    lengths = []
+    for _ in range(num_buffers):
+        lengths.append(_FRAME_LENGTH.unpack_from(body, offset)[0])
+        offset += _FRAME_LENGTH.size
+    data = body[offset : offset + data_length]
+    offset += data_length
+    buffers = []
+    for length in lengths:
+        buffer = body[offset : offset + length]
+        buffers.append(bytearray(buffer) if copy else buffer)
+        offset += length
+    return pickle.loads(data, buffers=buffers)
+
+
+def _serialize(item: Any, compression_threshold: int = 0) -> bytes:
+    """Pickles the item with protocol 5, moving its large buffers out-of-band, and compresses the result with zstd
+    when it is larger than ``compression_threshold`` bytes."""
+    data, raw_buffers = _dumps_out_of_band(item)
+    size = len(data) + sum(raw.nbytes for raw in raw_buffers)
+    compress = 0 < compression_threshold < size and _is_zstandard_available()
+    if not raw_buffers and not compress:
+        return data
+
+    body = b"".join(_frame_parts(data, raw_buffers))
+    flags = 0
+    if compress:
+        body = zstandard.compress(body)
+        flags |= _FRAME_COMPRESSED
+    return b"".join([_FRAME_MAGIC, bytes([flags]), body])
+
+
+def _deserialize(value: bytes) -> Any:
+    """Loads an item serialized by :func:`_serialize`."""
+    if not value.startswith(_FRAME_MAGIC):
+        return pickle.loads(value)
+
+    flags = value[len(_FRAME_MAGIC)]
+    body = memoryview(value)[len(_FRAME_MAGIC) + 1 :]
+    if flags & _FRAME_COMPRESSED:
+        if not _is_zstandard_available():
+            raise ModuleNotFoundError("The queue item is compressed with zstd, please run `pip install zstandard`.")
+        body = memoryview(zstandard.decompress(body))
+    # copied so that the objects backed by the buffers, e.g. numpy arrays, are writable
+    return _load_frame_body(body)
+
 
 class RedisQueue(BaseQueue):
     @requires("redis")
@@ -219,6 +532,7 @@ class RedisQueue(BaseQueue):
         host: str = None,
         port: int = None,
         password: str = None,
+        compression_threshold: Optional[int] = None,
     ):
         """
         Parameters
@@ -233,6 +547,9 @@ class RedisQueue(BaseQueue):
             The port of the redis server
         password:
             Redis password
+        compression_threshold:
+            The size in bytes above which the items are compressed with zstd. Defaults to the
+            ``LIGHTNING_REDIS_QUEUE_COMPRESSION_THRESHOLD`` environment variable, 0 disables the compression.
         """
         if name is None:
             raise ValueError("You must specify a name for the queue")
@@ -241,9 +558,12 @@ class RedisQueue(BaseQueue):
         self.password = password or REDIS_PASSWORD
         self.name = name
         self.default_timeout = default_timeout
-        self.redis = redis.Redis(host=self.host, port=self.port, password=self.password)
+        self.compression_threshold = (
+            REDIS_QUEUE_COMPRESSION_THRESHOLD if compression_threshold is None else compression_threshold
+        )
+        self.redis = redis.Redis(connection_pool=_get_redis_connection_pool(self.host, self.port, self.password))
 
-    def put(self, item: Any) -> None:
+    def _dumps(self, item: Any) -> bytes:
         from lightning.app import LightningWork
 
         is_work = isinstance(item, LightningWork)
@@ -256,8 +576,14 @@ class RedisQueue(BaseQueue):
             backend = item._backend
             item._backend = None
 
-        value = pickle.dumps(item)
-        queue_len = self.length()
+        value = _serialize(item, self.compression_threshold)
+
+        # The backend isn't pickable.
+        if is_work:
+            item._backend = backend
+        return value
+
+    def _warn_if_too_long(self, queue_len: int) -> None:
         if queue_len >= WARNING_QUEUE_SIZE:
             warnings.warn(
                 f"The Redis Queue {self.name} length is larger than the "
@@ -265,18 +591,25 @@ class RedisQueue(BaseQueue):
                 f"Found {queue_len}. This might cause your application to crash, "
                 "please investigate this."
             )
+
+    def put(self, item: Any) -> None:
+        self.batch_put([item])
+
+    def batch_put(self, items: List[Any]) -> None:
+        if not items:
+            return
+        values = [self._dumps(item) for item in items]
         try:
-            self.redis.rpush(self.name, value)
+            # RPUSH returns the length of the list, so no extra round trip is needed to check it
+            queue_len = self.redis.rpush(self.name, *values)
         except redis.exceptions.ConnectionError:
             raise ConnectionError(
                 "Your app failed because it couldn't connect to Redis. "
                 "Please try running your app again. "
                 "If the issue persists, please contact support@lightning.ai"
             )
-
-        # The backend isn't pickable.
-        if is_work:
-            item._backend = backend
+        if isinstance(queue_len, int):
+            self._warn_if_too_long(queue_len)
 
     def get(self, timeout: int = None):
         """Returns the left most element of the redis queue.
@@ -305,7 +638,25 @@ class RedisQueue(BaseQueue):
 
         if out is None:
             raise queue.Empty
-        return pickle.loads(out[1])
+        return _deserialize(out[1])
+
+    def batch_get(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        items = [self.get(timeout=timeout)]
+        if max_items <= 1:
+            return items
+        try:
+            # read and remove the next items atomically in a single round trip
+            pipeline = self.redis.pipeline()
+            pipeline.lrange(self.name, 0, max_items - 2)
+            pipeline.ltrim(self.name, max_items - 1, -1)
+            values, _ = pipeline.execute()
+        except redis.exceptions.ConnectionError:
+            raise ConnectionError(
+                "Your app failed because it couldn't connect to Redis. "
+                "Please try running your app again. "
+                "If the issue persists, please contact support@lightning.ai"
+            )
+        return items + [_deserialize(value) for value in values]
 
     def clear(self) -> None:
         """Clear all elements in the queue."""
@@ -338,6 +689,7 @@ class RedisQueue(BaseQueue):
             "host": self.host,
             "port": self.port,
             "password": self.password,
+            "compression_threshold": self.compression_threshold,
         }
 
     @classmethod
@@ -363,6 +715,11 @@ class HTTPQueue(BaseQueue):
         self.name = name  # keeping the name for debugging
         self.default_timeout = default_timeout
         self.client = HTTPClient(base_url=HTTP_QUEUE_URL, auth_token=HTTP_QUEUE_TOKEN, log_callback=debug_log_callback)
+        self._num_puts = 0
+        # whether the queue service supports the `popmany` and `pushmany` actions, unknown until the first call
+        self._supports_batch_actions: Optional[bool] = None
+        # whether the queue service supports long polling, unknown until the first call
+        self._supports_long_poll: Optional[bool] = None if HTTP_QUEUE_LONG_POLL_TIMEOUT > 0 else False
 
     @property
     def is_running(self) -> bool:
@@ -383,58 +740,133 @@ class HTTPQueue(BaseQueue):
         if not self.app_id:
             raise ValueError(f"App ID couldn't be extracted from the queue name: {self.name}")
 
-        # it's a blocking call, we need to loop and call the backend to mimic this behavior
-        if timeout is None:
-            while True:
-                try:
-                    return self._get()
-                except queue.Empty:
-                    time.sleep(HTTP_QUEUE_REFRESH_INTERVAL)
-
         # make one request and return the result
         if timeout == 0:
             return self._get()
 
-        # timeout is some value - loop until the timeout is reached
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
+        # it's a blocking call when no timeout is provided, otherwise loop until the timeout is reached
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.time()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
             try:
-                return self._get()
+                if self._supports_long_poll is False:
+                    return self._get()
+                # the queue service holds the request until an item is available, so there is no need to sleep
+                return self._get(wait=min(remaining or HTTP_QUEUE_LONG_POLL_TIMEOUT, HTTP_QUEUE_LONG_POLL_TIMEOUT))
+            except _QueueUnavailable:
+                pass
             except queue.Empty:
+                if self._supports_long_poll:
+                    continue
+
+            if deadline is None:
+                time.sleep(HTTP_QUEUE_REFRESH_INTERVAL)
+            elif timeout > self.default_timeout:
                 # Note: In theory, there isn't a need for a sleep as the queue shouldn't
                 # block the flow if the queue is empty.
                 # However, as the Http Server can saturate,
                 # let's add a sleep here if a higher timeout is provided
                 # than the default timeout
-                if timeout > self.default_timeout:
-                    time.sleep(0.05)
-                pass
+                time.sleep(0.05)
 
-    def _get(self):
+    def _get(self, wait: Optional[float] = None):
+        query_params = {"action": "pop"}
+        if wait:
+            query_params["wait"] = f"{wait:.3f}"
         try:
-            resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", query_params={"action": "pop"})
-            if resp.status_code == 204:
-                raise queue.Empty
-            return pickle.loads(resp.content)
+            resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", query_params=query_params)
         except ConnectionError:
             # Note: If the Http Queue service isn't available,
             # we consider the queue is empty to avoid failing the app.
+            raise _QueueUnavailable
+        if wait and self._supports_long_poll is None:
+            self._supports_long_poll = _LONG_POLL_HEADER in resp.headers
+        if resp.status_code == 204:
             raise queue.Empty
+        return pickle.loads(resp.content)
 
-    def put(self, item: Any) -> None:
-        if not self.app_id:
-            raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
+    def batch_get(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        items = [self.get(timeout=timeout)]
+        if max_items <= 1:
+            return items
+        if self._supports_batch_actions is not False:
+            try:
+                return items + self._get_many(max_items - 1)
+            except _BatchActionNotSupported:
+                pass
+        # the queue service doesn't support batched actions, fall back to one item per call
+        while len(items) < max_items:
+            try:
+                items.append(self._get())
+            except queue.Empty:
+                break
+        return items
 
-        value = pickle.dumps(item)
+    def _get_many(self, count: int) -> List[Any]:
+        try:
+            resp = self.client.post(
+                f"v1/{self.app_id}/{self._name_suffix}", query_params={"action": "popmany", "count": str(count)}
+            )
+        except ConnectionError:
+            return []
+        except requests.exceptions.HTTPError as ex:
+            if ex.response is not None and ex.response.status_code in _UNSUPPORTED_ACTION_STATUS_CODES:
+                self._supports_batch_actions = False
+                raise _BatchActionNotSupported from ex
+            raise
+        self._supports_batch_actions = True
+        if resp.status_code == 204:
+            return []
+        return pickle.loads(resp.content)
+
+    def _maybe_warn_length(self, num_new_items: int) -> None:
+        # checking the length costs a round trip, so it is done only every few puts
+        previous_num_puts = self._num_puts
+        self._num_puts += num_new_items
+        if previous_num_puts // HTTP_QUEUE_LENGTH_CHECK_INTERVAL == self._num_puts // HTTP_QUEUE_LENGTH_CHECK_INTERVAL:
+            return
         queue_len = self.length()
         if queue_len >= WARNING_QUEUE_SIZE:
             warnings.warn(
                 f"The Queue {self._name_suffix} length is larger than the recommended length of {WARNING_QUEUE_SIZE}. "
                 f"Found {queue_len}. This might cause your application to crash, please investigate this."
             )
+
+    def put(self, item: Any) -> None:
+        if not self.app_id:
+            raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
+
+        value = pickle.dumps(item)
         resp = self.client.post(f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "push"})
         if resp.status_code != 201:
             raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+        self._maybe_warn_length(1)
+
+    def batch_put(self, items: List[Any]) -> None:
+        if not self.app_id:
+            raise ValueError(f"The Lightning App ID couldn't be extracted from the queue name: {self.name}")
+        if not items:
+            return
+        if self._supports_batch_actions is False:
+            return super().batch_put(items)
+
+        value = pickle.dumps(list(items))
+        try:
+            resp = self.client.post(
+                f"v1/{self.app_id}/{self._name_suffix}", data=value, query_params={"action": "pushmany"}
+            )
+        except requests.exceptions.HTTPError as ex:
+            if ex.response is None or ex.response.status_code not in _UNSUPPORTED_ACTION_STATUS_CODES:
+                raise
+            # the queue service doesn't support batched actions, fall back to one item per call
+            self._supports_batch_actions = False
+            return super().batch_put(items)
+        if resp.status_code != 201:
+            raise RuntimeError(f"Failed to push to queue: {self._name_suffix}")
+        self._supports_batch_actions = True
+        self._maybe_warn_length(len(items))
 
     def length(self):
         if not self.app_id:
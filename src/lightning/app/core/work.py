@@ -132,6 +132,8 @@ class LightningWork:
                 " in the next version. Use `cache_calls` instead."
             )
         self._cache_calls = run_once if run_once is not None else cache_calls
+        # bumped every time a state attribute is set so that unchanged works can be skipped when diffing the state
+        self._state_version = 0
         self._state = {
             "_host",
             "_port",
@@ -405,6 +407,8 @@ class LightningWork:
         else:
             setattr_fn = getattr(self, "_setattr_replacement", None) or self._default_setattr
             setattr_fn(name, value)
+            if self._is_state_attribute(name):
+                super().__setattr__("_state_version", self._state_version + 1)
 
     def _default_setattr(self, name: str, value: Any) -> None:
         from lightning.app.core.flow import LightningFlow
@@ -74,7 +74,10 @@ class MultiProcessWorkManager(WorkManager):
 
 class MultiProcessingBackend(Backend):
     def __init__(self, entrypoint_file: str):
-        super().__init__(entrypoint_file=entrypoint_file, queues=QueuingSystem.MULTIPROCESS, queue_id="0")
+        queues = (
+            QueuingSystem.SHARED_MEMORY if constants.MULTIPROCESS_SHARED_MEMORY_QUEUES else QueuingSystem.MULTIPROCESS
+        )
+        super().__init__(entrypoint_file=entrypoint_file, queues=queues, queue_id="0")
 
     def create_work(self, app, work) -> None:
         if constants.LIGHTNING_CLOUDSPACE_HOST is not None:
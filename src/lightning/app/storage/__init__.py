@@ -4,3 +4,4 @@ from lightning.app.storage.mount import Mount  # noqa: F401
 from lightning.app.storage.orchestrator import StorageOrchestrator  # noqa: F401
 from lightning.app.storage.path import Path  # noqa: F401
 from lightning.app.storage.payload import Payload  # noqa: F401
+from lightning.app.storage.transfer import TransferProgress  # noqa: F401
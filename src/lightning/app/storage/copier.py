@@ -15,23 +15,28 @@
 import concurrent.futures
 import pathlib
 import threading
+import traceback
+from contextlib import contextmanager
+from queue import Empty
 from threading import Thread
 from time import time
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Dict, Generator, Optional, Tuple, TYPE_CHECKING, Union
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
 
+from lightning.app.core.constants import STORAGE_NUM_WORKERS, STORAGE_TRANSFER_NUM_WORKERS
 from lightning.app.core.queues import BaseQueue
 from lightning.app.storage.path import _filesystem
 from lightning.app.storage.requests import _ExistsRequest, _GetRequest
+from lightning.app.storage.transfer import _put_file, TransferProgress
 from lightning.app.utilities.app_helpers import Logger
 
 _PathRequest = Union[_GetRequest, _ExistsRequest]
 
 _logger = Logger(__name__)
 
-num_workers = 8
+num_workers = STORAGE_TRANSFER_NUM_WORKERS
 if TYPE_CHECKING:
     import lightning.app
 
@@ -47,15 +52,23 @@ class _Copier(Thread):
     :func:`~lightning.app.storage.path.shared_storage_path`). Any errors raised during the copy will be added to the
     response and get re-raised within the corresponding LightningWork.
 
+    The requests are processed concurrently by a bounded pool of threads, except for the requests of the same file
+    which are processed one after the other.
+
     Args:
         copy_request_queue: A queue connecting the central StorageOrchestrator with the Copier. The orchestrator
             will send requests to this queue.
         copy_response_queue: A queue connecting the central StorageOrchestrator with the Copier. The Copier
             will send a response to this queue whenever a requested copy has finished.
+        num_workers: The maximum number of requests processed concurrently.
     """
 
     def __init__(
-        self, work: "lightning.app.LightningWork", copy_request_queue: "BaseQueue", copy_response_queue: "BaseQueue"
+        self,
+        work: "lightning.app.LightningWork",
+        copy_request_queue: "BaseQueue",
+        copy_response_queue: "BaseQueue",
+        num_workers: int = STORAGE_NUM_WORKERS,
     ) -> None:
         super().__init__(daemon=True)
         self._work = work
@@ -63,11 +76,21 @@ class _Copier(Thread):
         self.copy_response_queue = copy_response_queue
         self._exit_event = threading.Event()
         self._sleep_time = 0.1
+        self._num_workers = num_workers
+        # the lock of each file being copied and the number of requests holding or waiting for it
+        self._locks: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._locks_lock = threading.Lock()
 
     def run(self) -> None:
-        while not self._exit_event.is_set():
-            self._exit_event.wait(self._sleep_time)
-            self.run_once()
+        with concurrent.futures.ThreadPoolExecutor(self._num_workers) as executor:
+            while not self._exit_event.is_set():
+                try:
+                    request: _PathRequest = self.copy_request_queue.get()  # blocks until we get a request
+                except Empty:
+                    # some queues can't block
+                    self._exit_event.wait(self._sleep_time)
+                    continue
+                executor.submit(self._safe_process_request, request)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
@@ -75,27 +98,54 @@ class _Copier(Thread):
 
     def run_once(self):
         request: _PathRequest = self.copy_request_queue.get()  # blocks until we get a request
+        self._process_request(request)
 
-        t0 = time()
-
-        obj: Optional[lightning.app.storage.Path] = _find_matching_path(self._work, request)
-        if obj is None:
-            # If it's not a path, it must be a payload
-            obj: lightning.app.storage.Payload = getattr(self._work, request.name)
-
-        if isinstance(request, _ExistsRequest):
-            response = obj._handle_exists_request(self._work, request)
-        elif isinstance(request, _GetRequest):
-            response = obj._handle_get_request(self._work, request)
-        else:
-            raise TypeError(
-                f"The file copy request had an invalid type. Expected PathGetRequest or PathExistsRequest, got:"
-                f" {type(request)}"
-            )
-
-        response.timedelta = time() - t0
+    def _safe_process_request(self, request: _PathRequest) -> None:
+        try:
+            self._process_request(request)
+        except Exception:
+            _logger.error(traceback.format_exc())
+
+    def _process_request(self, request: _PathRequest) -> None:
+        # the requests of the same file would write to the same place in the shared storage
+        with self._file_lock(request.hash):
+            t0 = time()
+
+            obj: Optional[lightning.app.storage.Path] = _find_matching_path(self._work, request)
+            if obj is None:
+                # If it's not a path, it must be a payload
+                obj: lightning.app.storage.Payload = getattr(self._work, request.name)
+
+            if isinstance(request, _ExistsRequest):
+                response = obj._handle_exists_request(self._work, request)
+            elif isinstance(request, _GetRequest):
+                response = obj._handle_get_request(self._work, request)
+            else:
+                raise TypeError(
+                    f"The file copy request had an invalid type. Expected PathGetRequest or PathExistsRequest, got:"
+                    f" {type(request)}"
+                )
+
+            response.timedelta = time() - t0
         self.copy_response_queue.put(response)
 
+    @contextmanager
+    def _file_lock(self, hash: str) -> Generator[None, None, None]:
+        """Holds the lock of the file, which is removed once no request holds or waits for it."""
+        with self._locks_lock:
+            lock, count = self._locks.get(hash, (threading.Lock(), 0))
+            self._locks[hash] = (lock, count + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._locks_lock:
+                _, count = self._locks[hash]
+                if count == 1:
+                    del self._locks[hash]
+                else:
+                    self._locks[hash] = (lock, count - 1)
+
 
 def _find_matching_path(work, request: _GetRequest) -> Optional["lightning.app.storage.Path"]:
     for name in work._paths:
@@ -108,13 +158,16 @@ def _copy_files(
     source_path: pathlib.Path,
     destination_path: pathlib.Path,
     fs: Optional[AbstractFileSystem] = None,
+    progress: Optional[TransferProgress] = None,
 ) -> None:
     """Copy files from one path to another.
 
     The source path must either be an existing file or folder. If the source is a folder, the destination path is
     interpreted as a folder as well. If the source is a file, the destination path is interpreted as a file too.
 
-    Files in a folder are copied recursively and efficiently using multiple threads.
+    Files in a folder are copied recursively and efficiently using multiple threads. Large files are copied by
+    ranges in parallel when the destination filesystem is local, see
+    :class:`~lightning.app.storage.transfer.TransferProgress` for the counters updated along the way.
     """
     if fs is None:
         fs = _filesystem()
@@ -127,7 +180,7 @@ def _copy_files(
             if isinstance(fs, LocalFileSystem):
                 fs.makedirs(str(to_path.parent), exist_ok=True)
 
-            fs.put(str(from_path), str(to_path), recursive=False)
+            _put_file(fs, from_path, to_path, progress, recursive=False)
         except Exception as e:
             # Return the exception so that it can be handled in the main thread
             return e
@@ -149,4 +202,4 @@ def _copy_files(
         if isinstance(fs, LocalFileSystem):
             fs.makedirs(str(destination_path.parent), exist_ok=True)
 
-        fs.put(str(source_path), str(destination_path))
+        _put_file(fs, source_path, destination_path, progress)
@@ -17,10 +17,12 @@ import pathlib
 import shutil
 import sys
 from copy import deepcopy
+from functools import partial
 from time import sleep, time
 from typing import Dict, List, Optional, Union
 
 from lightning.app.storage.path import _filesystem, _shared_storage_path, LocalFileSystem
+from lightning.app.storage.transfer import _copy_local_file, _get_file, TransferProgress
 from lightning.app.utilities.component import _is_flow_context
 
 
@@ -92,11 +94,12 @@ class Drive:
         drive_root = _shared_storage_path() / "artifacts" / "drive" / self.id
         return drive_root
 
-    def put(self, path: str) -> None:
+    def put(self, path: str, progress: Optional[TransferProgress] = None) -> None:
         """This method enables to put a file to the Drive in a blocking fashion.
 
         Arguments:
             path: The relative path to your files to be added to the Drive.
+            progress: The counters to update with the bytes transferred.
         """
         if not self.component_name:
             raise Exception("The component name needs to be known to put a path to the Drive.")
@@ -113,7 +116,7 @@ class Drive:
         src = pathlib.Path(os.path.join(self.root_folder, path)).resolve()
         dst = self._to_shared_path(path, component_name=self.component_name)
 
-        _copy_files(src, dst)
+        _copy_files(src, dst, progress=progress)
 
     def list(self, path: Optional[str] = ".", component_name: Optional[str] = None) -> List[str]:
         """This method enables to list files under the provided path from the Drive in a blocking fashion.
@@ -157,6 +160,7 @@ class Drive:
         component_name: Optional[str] = None,
         timeout: Optional[float] = None,
         overwrite: bool = False,
+        progress: Optional[TransferProgress] = None,
     ) -> None:
         """This method enables to get files under the provided path from the Drive in a blocking fashion.
 
@@ -166,6 +170,7 @@ class Drive:
                 If you provide a component name, the matching is specific to this component.
             timeout: Whether to wait for the files to be available if not created yet.
             overwrite: Whether to override the provided path if it exists.
+            progress: The counters to update with the bytes transferred.
         """
         if _is_flow_context():
             raise Exception("The flow isn't allowed to get files from a Drive.")
@@ -188,6 +193,7 @@ class Drive:
                 shared_path,
                 pathlib.Path(os.path.join(self.root_folder, path)).resolve(),
                 overwrite=overwrite,
+                progress=progress,
             )
         else:
             if timeout:
@@ -205,7 +211,13 @@ class Drive:
                 if not match:
                     raise Exception(f"We didn't find any match for the associated {path}.")
 
-            self._get(self.fs, match, pathlib.Path(os.path.join(self.root_folder, path)).resolve(), overwrite=overwrite)
+            self._get(
+                self.fs,
+                match,
+                pathlib.Path(os.path.join(self.root_folder, path)).resolve(),
+                overwrite=overwrite,
+                progress=progress,
+            )
 
     def delete(self, path: str) -> None:
         """This method enables to delete files under the provided path from the Drive in a blocking fashion. Only
@@ -271,7 +283,14 @@ class Drive:
         shared_path /= path
         return shared_path
 
-    def _get(self, fs, src: pathlib.Path, dst: pathlib.Path, overwrite: bool):
+    def _get(
+        self,
+        fs,
+        src: pathlib.Path,
+        dst: pathlib.Path,
+        overwrite: bool,
+        progress: Optional[TransferProgress] = None,
+    ):
         if fs.isdir(src):
             if isinstance(fs, LocalFileSystem):
                 dst = dst.resolve()
@@ -281,12 +300,12 @@ class Drive:
                     else:
                         raise FileExistsError(f"The file {dst} was found. Add get(..., overwrite=True) to replace it.")
 
-                shutil.copytree(src, dst)
+                shutil.copytree(src, dst, copy_function=partial(_copy_local_file, progress=progress))
             else:
                 glob = f"{str(src)}/**"
                 fs.get(glob, str(dst.absolute()), recursive=False)
         else:
-            fs.get(str(src), str(dst.absolute()), recursive=False)
+            _get_file(fs, src, dst.absolute(), progress, recursive=False)
 
     def _find_match(self, path: str) -> Optional[pathlib.Path]:
         matches = []
@@ -1,15 +1,17 @@
 import os
 import shutil
+from functools import partial
 from pathlib import Path
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 from fsspec.implementations.local import LocalFileSystem
 
 from lightning.app.storage.copier import _copy_files
 from lightning.app.storage.path import _filesystem, _shared_storage_path
+from lightning.app.storage.transfer import _copy_local_file, _get_file, TransferProgress
 
 
-def _get_files(fs, src: Path, dst: Path, overwrite: bool = True):
+def _get_files(fs, src: Path, dst: Path, overwrite: bool = True, progress: Optional[TransferProgress] = None):
     dst = dst.resolve()
     if fs.isdir(src):
         if isinstance(fs, LocalFileSystem):
@@ -20,12 +22,12 @@ def _get_files(fs, src: Path, dst: Path, overwrite: bool = True):
                 else:
                     raise FileExistsError(f"The file {dst} was found. Add get(..., overwrite=True) to replace it.")
 
-            shutil.copytree(src, dst)
+            shutil.copytree(src, dst, copy_function=partial(_copy_local_file, progress=progress))
         else:
             glob = f"{str(src)}/**"
             fs.get(glob, str(dst), recursive=False)
     else:
-        fs.get(str(src), str(dst), recursive=False)
+        _get_file(fs, src, dst, progress, recursive=False)
 
 
 class FileSystem:
@@ -36,13 +38,20 @@ class FileSystem:
         self._fs = _filesystem()
         self._root = str(_shared_storage_path())
 
-    def put(self, src_path: str, dst_path: str, put_fn: Callable = _copy_files) -> None:
+    def put(
+        self,
+        src_path: str,
+        dst_path: str,
+        put_fn: Callable = _copy_files,
+        progress: Optional[TransferProgress] = None,
+    ) -> None:
         """This method enables to put a file to the shared storage in a blocking fashion.
 
         Arguments:
             src_path: The path to your files locally
             dst_path: The path to your files transfered in the shared storage.
             put_fn: The method to use to put files in the shared storage.
+            progress: The counters to update with the bytes transferred.
         """
         if not os.path.exists(Path(src_path).resolve()):
             raise FileExistsError(f"The provided path {src_path} doesn't exist")
@@ -58,15 +67,25 @@ class FileSystem:
         src = Path(src_path).resolve()
         dst = Path(dst_path).resolve()
 
+        if progress is not None:
+            return put_fn(src, dst, fs=self._fs, progress=progress)
         return put_fn(src, dst, fs=self._fs)
 
-    def get(self, src_path: str, dst_path: str, overwrite: bool = True, get_fn: Callable = _get_files) -> None:
+    def get(
+        self,
+        src_path: str,
+        dst_path: str,
+        overwrite: bool = True,
+        get_fn: Callable = _get_files,
+        progress: Optional[TransferProgress] = None,
+    ) -> None:
         """This method enables to get files from the shared storage in a blocking fashion.
 
         Arguments:
             src_path: The path to your files in the shared storage
             dst_path: The path to your files transfered locally
             get_fn: The method to use to put files in the shared storage.
+            progress: The counters to update with the bytes transferred.
         """
         if not src_path.startswith("/"):
             raise Exception(f"The provided destination {src_path} needs to start with `/`.")
@@ -74,6 +93,8 @@ class FileSystem:
         src = Path(os.path.join(self._root, src_path[1:])).resolve()
         dst = Path(dst_path).resolve()
 
+        if progress is not None:
+            return get_fn(fs=self._fs, src=src, dst=dst, overwrite=overwrite, progress=progress)
         return get_fn(fs=self._fs, src=src, dst=dst, overwrite=overwrite)
 
     def listdir(self, path: str) -> List[str]:
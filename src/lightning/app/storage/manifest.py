@@ -0,0 +1,256 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed transfers of the files exposed by a :class:`~lightning.app.storage.path.Path`.
+
+The files are split into chunks stored in the shared storage under the SHA-256 of their contents, so that a chunk
+is only uploaded once no matter how many files or transfers contain it. Each transfer writes a manifest listing the
+chunks of every file, from which the consumer rebuilds the files, only downloading the chunks it doesn't already have
+locally.
+
+When a manifest is replaced, the chunks which only the previous version of the manifest referenced are removed. A
+chunk is however not protected while a concurrent transfer of other files decides to reuse it, in which case that
+transfer fails and the chunk is uploaded again by the next one.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from lightning.app.core.constants import STORAGE_CHUNK_SIZE, STORAGE_TRANSFER_NUM_WORKERS
+from lightning.app.storage.path import _filesystem, _shared_storage_path
+from lightning.app.utilities.app_helpers import Logger
+
+_logger = Logger(__name__)
+
+num_workers = STORAGE_TRANSFER_NUM_WORKERS
+
+# the digests of the local files are cached until they are modified, the least recently used ones are evicted
+_digests_cache: "OrderedDict[Tuple[str, int], Tuple[int, int, List[str]]]" = OrderedDict()
+_digests_cache_size = 10_000
+_digests_cache_lock = threading.Lock()
+
+
+def _chunk_path(digest: str) -> pathlib.Path:
+    return _shared_storage_path() / "chunks" / digest[:2] / digest
+
+
+def _file_chunk_digests(path: pathlib.Path, chunk_size: int) -> List[str]:
+    """Returns the SHA-256 of each chunk of the file."""
+    stat = path.stat()
+    key = (str(path.absolute()), chunk_size)
+    with _digests_cache_lock:
+        cached = _digests_cache.get(key)
+        if cached is not None:
+            _digests_cache.move_to_end(key)
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+
+    digests = []
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digests.append(hashlib.sha256(chunk).hexdigest())
+    with _digests_cache_lock:
+        _digests_cache[key] = (stat.st_size, stat.st_mtime_ns, digests)
+        _digests_cache.move_to_end(key)
+        while len(_digests_cache) > _digests_cache_size:
+            _digests_cache.popitem(last=False)
+    return digests
+
+
+def _read_chunk(path: pathlib.Path, index: int, chunk_size: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(index * chunk_size)
+        return f.read(chunk_size)
+
+
+def _write(fs: AbstractFileSystem, path: pathlib.Path, data: bytes) -> None:
+    if isinstance(fs, LocalFileSystem):
+        # written under a temporary name first so that a partially written file is never seen as present
+        fs.makedirs(str(path.parent), exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    else:
+        fs.pipe_file(str(path), data)
+
+
+def _upload_content_addressed(
+    source_path: pathlib.Path,
+    manifest_path: pathlib.Path,
+    fs: Optional[AbstractFileSystem] = None,
+    chunk_size: int = STORAGE_CHUNK_SIZE,
+) -> int:
+    """Uploads the chunks of the file or folder that are missing from the shared storage and writes the manifest.
+
+    Returns:
+        The size of the manifest in bytes.
+    """
+    if fs is None:
+        fs = _filesystem()
+
+    is_dir = source_path.is_dir()
+    files = sorted(file for file in source_path.rglob("*") if file.is_file()) if is_dir else [source_path]
+
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        all_digests = list(executor.map(lambda file: _file_chunk_digests(file, chunk_size), files))
+
+        # the first occurrence of every chunk is the one uploaded
+        chunks: Dict[str, Tuple[pathlib.Path, int]] = {}
+        for file, digests in zip(files, all_digests):
+            for index, digest in enumerate(digests):
+                chunks.setdefault(digest, (file, index))
+
+        exists = executor.map(lambda digest: fs.exists(str(_chunk_path(digest))), chunks)
+        missing = [digest for digest, chunk_exists in zip(chunks, exists) if not chunk_exists]
+
+        def upload(digest: str) -> None:
+            file, index = chunks[digest]
+            data = _read_chunk(file, index, chunk_size)
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise RuntimeError(f"The file {file} was modified while it was being transferred.")
+            _write(fs, _chunk_path(digest), data)
+
+        # consume the results to raise the first exception
+        list(executor.map(upload, missing))
+
+    _logger.debug(f"Uploaded {len(missing)} of the {len(chunks)} chunks of {source_path}.")
+    previous_digests = _manifest_digests(fs, manifest_path)
+    manifest = {
+        "chunk_size": chunk_size,
+        "is_dir": is_dir,
+        "files": [
+            {
+                "path": str(file.relative_to(source_path)) if is_dir else "",
+                "size": file.stat().st_size,
+                "chunks": digests,
+            }
+            for file, digests in zip(files, all_digests)
+        ],
+    }
+    data = json.dumps(manifest).encode("utf-8")
+    _write(fs, manifest_path, data)
+    _remove_unreferenced_chunks(fs, manifest_path, previous_digests - set(chunks))
+    return len(data)
+
+
+def _manifest_digests(fs: AbstractFileSystem, manifest_path: pathlib.Path) -> Set[str]:
+    """Returns the digests of the chunks referenced by the manifest, none if it doesn't exist."""
+    try:
+        manifest: Dict[str, Any] = json.loads(fs.cat_file(str(manifest_path)))
+    except FileNotFoundError:
+        return set()
+    return {digest for entry in manifest["files"] for digest in entry["chunks"]}
+
+
+def _remove_unreferenced_chunks(fs: AbstractFileSystem, manifest_path: pathlib.Path, digests: Set[str]) -> None:
+    """Removes the chunks no longer referenced by the manifest which the other manifests don't reference
+    either."""
+    if not digests:
+        return
+    for other_path in fs.glob(str(manifest_path.parent / "*.manifest.json")):
+        if pathlib.PurePosixPath(other_path).name == manifest_path.name:
+            continue
+        digests = digests - _manifest_digests(fs, pathlib.Path(other_path))
+        if not digests:
+            return
+    for digest in digests:
+        try:
+            fs.rm(str(_chunk_path(digest)))
+        except FileNotFoundError:
+            pass
+    _logger.debug(f"Removed {len(digests)} chunks no longer referenced by {manifest_path}.")
+
+
+def _download_content_addressed(
+    manifest_path: pathlib.Path, destination_path: pathlib.Path, fs: Optional[AbstractFileSystem] = None
+) -> None:
+    """Rebuilds the file or folder described by the manifest, reusing the chunks of the local files and only
+    downloading the other ones."""
+    if fs is None:
+        fs = _filesystem()
+
+    manifest: Dict[str, Any] = json.loads(fs.cat_file(str(manifest_path)))
+    chunk_size = manifest["chunk_size"]
+
+    if manifest["is_dir"]:
+        if destination_path.is_file():
+            destination_path.unlink()
+        targets = [destination_path / entry["path"] for entry in manifest["files"]]
+    else:
+        if destination_path.is_dir():
+            shutil.rmtree(destination_path)
+        targets = [destination_path]
+
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        for target, entry in zip(targets, manifest["files"]):
+            _assemble_file(target, entry["chunks"], chunk_size, fs, executor)
+
+    if manifest["is_dir"]:
+        # the folder is replaced as a whole, as when copying it
+        expected = set(targets)
+        for file in [file for file in destination_path.rglob("*") if file.is_file()]:
+            if file not in expected:
+                file.unlink()
+        destination_path.mkdir(parents=True, exist_ok=True)
+
+
+def _assemble_file(
+    target: pathlib.Path,
+    digests: List[str],
+    chunk_size: int,
+    fs: AbstractFileSystem,
+    executor: concurrent.futures.Executor,
+) -> None:
+    local_chunks: Dict[str, int] = {}
+    if target.is_file():
+        local_digests = _file_chunk_digests(target, chunk_size)
+        if local_digests == digests:
+            return
+        local_chunks = {digest: index for index, digest in enumerate(local_digests)}
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+    num_downloaded = 0
+    try:
+        with open(tmp_path, "wb") as out:
+            # the chunks are downloaded in parallel by windows to bound the memory used
+            for start in range(0, len(digests), num_workers):
+                window = digests[start : start + num_workers]
+                downloads = {
+                    digest: executor.submit(fs.cat_file, str(_chunk_path(digest)))
+                    for digest in window
+                    if digest not in local_chunks
+                }
+                num_downloaded += len(downloads)
+                for digest in window:
+                    if digest in downloads:
+                        out.write(downloads[digest].result())
+                    else:
+                        out.write(_read_chunk(target, local_chunks[digest], chunk_size))
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    _logger.debug(f"Downloaded {num_downloaded} of the {len(digests)} chunks of {target}.")
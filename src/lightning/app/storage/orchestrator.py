@@ -12,14 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import os
 import threading
+import time
 import traceback
 from queue import Empty
 from threading import Thread
-from typing import Dict, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
 
-from lightning.app.core.queues import BaseQueue
+from lightning.app.core.constants import HTTP_QUEUE_LONG_POLL_TIMEOUT, STORAGE_NUM_WORKERS
+from lightning.app.core.queues import BaseQueue, HTTPQueue
 from lightning.app.storage.path import _filesystem, _path_to_work_artifact
 from lightning.app.storage.requests import _ExistsRequest, _ExistsResponse, _GetRequest, _GetResponse
 from lightning.app.utilities.app_helpers import Logger
@@ -37,6 +40,12 @@ _logger = Logger(__name__)
 class StorageOrchestrator(Thread):
     """The StorageOrchestrator processes file transfer requests from Work that need file(s) from other Work.
 
+    Each request- and copy response queue is read by a dedicated thread blocking on it, so that the requests are
+    processed as soon as they arrive rather than on the next scan of all the queues. The copy response queue of a Work
+    is only read while requests to this Work are pending, and the queues which can't block, e.g. when the queue service
+    doesn't support long polling, are polled at an interval. The requests are processed by a bounded pool of threads
+    and a Work can have several requests pending at the same time.
+
     Args:
         app: A reference to the ``LightningApp`` which holds the copy request- and response queues for storage.
         request_queues: A dictionary with Queues connected to consumer Work. The Queue will contain transfer requests
@@ -47,6 +56,7 @@ class StorageOrchestrator(Thread):
             put requests on this queue for the file-transfer thread to complete.
         copy_response_queues: A dictionary of Queues where each Queue connects to one Work. The queue is expected to
             contain the completion response from the file-transfer thread running in the Work process.
+        num_workers: The maximum number of requests processed concurrently.
     """
 
     def __init__(
@@ -56,6 +66,7 @@ class StorageOrchestrator(Thread):
         response_queues: Dict[str, BaseQueue],
         copy_request_queues: Dict[str, BaseQueue],
         copy_response_queues: Dict[str, BaseQueue],
+        num_workers: int = STORAGE_NUM_WORKERS,
     ) -> None:
         super().__init__(daemon=True)
         self.app = app
@@ -63,13 +74,25 @@ class StorageOrchestrator(Thread):
         self.response_queues = response_queues
         self.copy_request_queues = copy_request_queues
         self.copy_response_queues = copy_response_queues
-        self.waiting_for_response: Dict[str, str] = {}
+        # the names of the source works of the pending requests, by destination work
+        self.waiting_for_response: Dict[str, List[str]] = {}
         self._validate_queues()
         self._exit_event = threading.Event()
+        self._lock = threading.Lock()
+        self._readers: Dict[str, Thread] = {}
+        # set while requests to the source work are pending, so that its copy responses are read
+        self._pending_sources: Dict[str, threading.Event] = {}
+        self._num_workers = num_workers
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
-        # Note: Use different sleep time locally and in the cloud
-        # to reduce queue calls.
+        # Note: Use different sleep time locally and in the cloud. This sets how often new works are discovered and
+        # the queues which can't block are polled.
         self._sleep_time = 0.1 if "LIGHTNING_APP_STATE_URL" not in os.environ else 2
+        # the maximum number of items read from a queue at once
+        self._batch_size = 32
+        # how long the readers block on a local queue before checking whether the orchestrator exits. The queue service
+        # holds each request for as long as a long poll lasts instead, so that idle works cost one call per long poll
+        self._read_timeout = 1.0
         self.fs = _filesystem()
 
     def _validate_queues(self):
@@ -81,102 +104,96 @@ class StorageOrchestrator(Thread):
         )
 
     def run(self) -> None:
-        while not self._exit_event.is_set():
-            for work_name in list(self.request_queues.keys()):
-                try:
-                    self.run_once(work_name)
-                except Exception:
-                    _logger.error(traceback.format_exc())
-            self._exit_event.wait(self._sleep_time)
+        self._executor = concurrent.futures.ThreadPoolExecutor(self._num_workers)
+        try:
+            while not self._exit_event.is_set():
+                # works can be added while the app is running
+                for work_name in list(self.request_queues.keys()):
+                    self._start_readers(work_name)
+                self._exit_event.wait(self._sleep_time)
+        finally:
+            self._executor.shutdown(wait=False)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
         super().join(timeout)
 
-    def run_once(self, work_name: str) -> None:
-        if work_name not in self.waiting_for_response:
-            # check if there is a new request from this work for a file transfer
-            # there can only be one pending request per work
-            request_queue = self.request_queues[work_name]
+    def _start_readers(self, work_name: str) -> None:
+        readers = {
+            f"request_{work_name}": (self.request_queues[work_name], self._submit_request, None),
+            f"copy_response_{work_name}": (
+                self.copy_response_queues[work_name],
+                self._process_copy_response,
+                self._pending_event(work_name),
+            ),
+        }
+        for key, (queue, handler, pending) in readers.items():
+            if key not in self._readers:
+                self._readers[key] = Thread(target=self._read, args=(work_name, queue, handler, pending), daemon=True)
+                self._readers[key].start()
+
+    def _read(
+        self,
+        work_name: str,
+        queue: BaseQueue,
+        handler: Callable[[str, Any], None],
+        pending: Optional[threading.Event] = None,
+    ) -> None:
+        while not self._exit_event.is_set():
+            if pending is not None and not pending.wait(self._read_timeout):
+                # nothing to read until a request is sent to the work
+                continue
+            can_block = _can_block(queue)
+            timeout = self._blocking_timeout(queue) if can_block else 0
+            start = time.monotonic()
             try:
-                request: _PathRequest = request_queue.get(timeout=0)  # this should not block
+                # blocks until an item is available or the timeout expires
+                items = queue.batch_get(self._batch_size, timeout=timeout)
             except Empty:
-                pass
-            else:
-                request.destination = work_name
-                source_work = self.app.get_component_by_name(request.source)
-                maybe_artifact_path = str(_path_to_work_artifact(request.path, source_work))
-
-                if self.fs.exists(maybe_artifact_path):
-                    # First check if the shared filesystem has the requested file stored as an artifact
-                    # If so, we will let the destination Work access this file directly
-                    # NOTE: This is NOT the right thing to do, because the Work could still be running and producing
-                    # a newer version of the requested file, but we can't rely on the Work status to be accurate
-                    # (at the moment)
-                    if isinstance(request, _GetRequest):
-                        response = _GetResponse(
-                            source=request.source,
-                            name=request.name,
-                            path=maybe_artifact_path,
-                            hash=request.hash,
-                            size=self.fs.info(maybe_artifact_path)["size"],
-                            destination=request.destination,
-                        )
-                    if isinstance(request, _ExistsRequest):
-                        response = _ExistsResponse(
-                            source=request.source,
-                            path=maybe_artifact_path,
-                            name=request.name,
-                            hash=request.hash,
-                            destination=request.destination,
-                            exists=True,
-                        )
-                    response_queue = self.response_queues[response.destination]
-                    response_queue.put(response)
-                elif source_work.status.stage not in (
-                    WorkStageStatus.NOT_STARTED,
-                    WorkStageStatus.STOPPED,
-                    WorkStageStatus.FAILED,
-                ):
-                    _logger.debug(
-                        f"Request for File Transfer received from {work_name}: {request}. Sending request to"
-                        f" {request.source} to copy the file."
-                    )
-                    # The Work is running, and we can send a request to the copier for moving the file to the
-                    # shared storage
-                    self.copy_request_queues[request.source].put(request)
-                    # Store a destination to source mapping.
-                    self.waiting_for_response[work_name] = request.source
-                else:
-                    if isinstance(request, _GetRequest):
-                        response = _GetResponse(
-                            source=request.source,
-                            path=request.path,
-                            name=request.name,
-                            hash=request.hash,
-                            size=0,
-                            destination=request.destination,
-                        )
-                    if isinstance(request, _ExistsRequest):
-                        response = _ExistsResponse(
-                            source=request.source,
-                            path=request.path,
-                            hash=request.hash,
-                            destination=request.destination,
-                            exists=False,
-                            name=request.name,
-                        )
-                    response.exception = FileNotFoundError(
-                        "The work is not running and the requested object is not available in the artifact store."
-                    )
-                    response_queue = self.response_queues[response.destination]
-                    response_queue.put(response)
+                if not can_block or time.monotonic() - start < timeout:
+                    # the queue didn't wait for an item, so it is polled at an interval
+                    self._exit_event.wait(self._sleep_time)
+                continue
+            except Exception:
+                _logger.error(traceback.format_exc())
+                self._exit_event.wait(self._sleep_time)
+                continue
+            for item in items:
+                try:
+                    handler(work_name, item)
+                except Exception:
+                    _logger.error(traceback.format_exc())
+
+    def _blocking_timeout(self, queue: BaseQueue) -> float:
+        # the readers are daemon threads, so a reader blocking on the queue service doesn't delay the exit
+        if isinstance(queue, HTTPQueue):
+            return HTTP_QUEUE_LONG_POLL_TIMEOUT
+        return self._read_timeout
+
+    def _submit_request(self, work_name: str, request: _PathRequest) -> None:
+        self._executor.submit(self._safe_process_request, work_name, request)
+
+    def _safe_process_request(self, work_name: str, request: _PathRequest) -> None:
+        try:
+            self._process_request(work_name, request)
+        except Exception:
+            _logger.error(traceback.format_exc())
+
+    def run_once(self, work_name: str) -> None:
+        """Processes the request and the copy response of the work that are available, without blocking."""
+        # check if there is a new request from this work for a file transfer
+        request_queue = self.request_queues[work_name]
+        try:
+            request: _PathRequest = request_queue.get(timeout=0)  # this should not block
+        except Empty:
+            pass
+        else:
+            self._process_request(work_name, request)
 
         # Check the current work is within the sources.
         # It is possible to have multiple destination targeting
         # the same source concurrently.
-        if work_name in self.waiting_for_response.values():
-
+        if self._is_source_of_pending_request(work_name):
             # check if the current work has responses for file transfers to other works.
             copy_response_queue = self.copy_response_queues[work_name]
             try:
@@ -185,13 +202,108 @@ class StorageOrchestrator(Thread):
             except Empty:
                 pass
             else:
-                _logger.debug(
-                    f"Received confirmation of a completed file copy request from {work_name}:{response}."
-                    f" Sending the confirmation back to {response.destination}."
+                self._process_copy_response(work_name, response)
+
+    def _is_source_of_pending_request(self, work_name: str) -> bool:
+        with self._lock:
+            return any(work_name in sources for sources in self.waiting_for_response.values())
+
+    def _process_request(self, work_name: str, request: _PathRequest) -> None:
+        request.destination = work_name
+        source_work = self.app.get_component_by_name(request.source)
+        maybe_artifact_path = str(_path_to_work_artifact(request.path, source_work))
+
+        if self.fs.exists(maybe_artifact_path):
+            # First check if the shared filesystem has the requested file stored as an artifact
+            # If so, we will let the destination Work access this file directly
+            # NOTE: This is NOT the right thing to do, because the Work could still be running and producing
+            # a newer version of the requested file, but we can't rely on the Work status to be accurate
+            # (at the moment)
+            if isinstance(request, _GetRequest):
+                response = _GetResponse(
+                    source=request.source,
+                    name=request.name,
+                    path=maybe_artifact_path,
+                    hash=request.hash,
+                    size=self.fs.info(maybe_artifact_path)["size"],
+                    destination=request.destination,
                 )
-                destination = response.destination
-                assert response.source == work_name
-                response_queue = self.response_queues[destination]
-                response_queue.put(response)
-                # the request has been processed, allow new requests to come in for the destination work
-                del self.waiting_for_response[destination]
+            if isinstance(request, _ExistsRequest):
+                response = _ExistsResponse(
+                    source=request.source,
+                    path=maybe_artifact_path,
+                    name=request.name,
+                    hash=request.hash,
+                    destination=request.destination,
+                    exists=True,
+                )
+            response_queue = self.response_queues[response.destination]
+            response_queue.put(response)
+        elif source_work.status.stage not in (
+            WorkStageStatus.NOT_STARTED,
+            WorkStageStatus.STOPPED,
+            WorkStageStatus.FAILED,
+        ):
+            _logger.debug(
+                f"Request for File Transfer received from {work_name}: {request}. Sending request to"
+                f" {request.source} to copy the file."
+            )
+            # Store a destination to source mapping before sending the request, as the response can come back
+            # right away.
+            with self._lock:
+                self.waiting_for_response.setdefault(work_name, []).append(request.source)
+                self._pending_event(request.source).set()
+            # The Work is running, and we can send a request to the copier for moving the file to the
+            # shared storage
+            self.copy_request_queues[request.source].put(request)
+        else:
+            if isinstance(request, _GetRequest):
+                response = _GetResponse(
+                    source=request.source,
+                    path=request.path,
+                    name=request.name,
+                    hash=request.hash,
+                    size=0,
+                    destination=request.destination,
+                )
+            if isinstance(request, _ExistsRequest):
+                response = _ExistsResponse(
+                    source=request.source,
+                    path=request.path,
+                    hash=request.hash,
+                    destination=request.destination,
+                    exists=False,
+                    name=request.name,
+                )
+            response.exception = FileNotFoundError(
+                "The work is not running and the requested object is not available in the artifact store."
+            )
+            response_queue = self.response_queues[response.destination]
+            response_queue.put(response)
+
+    def _process_copy_response(self, work_name: str, response: _PathResponse) -> None:
+        _logger.debug(
+            f"Received confirmation of a completed file copy request from {work_name}:{response}."
+            f" Sending the confirmation back to {response.destination}."
+        )
+        destination = response.destination
+        assert response.source == work_name
+        response_queue = self.response_queues[destination]
+        response_queue.put(response)
+        # the request has been processed
+        with self._lock:
+            sources = self.waiting_for_response.get(destination, [])
+            if work_name in sources:
+                sources.remove(work_name)
+            if not sources:
+                self.waiting_for_response.pop(destination, None)
+            if not any(work_name in sources for sources in self.waiting_for_response.values()):
+                self._pending_event(work_name).clear()
+
+    def _pending_event(self, work_name: str) -> threading.Event:
+        return self._pending_sources.setdefault(work_name, threading.Event())
+
+
+def _can_block(queue: BaseQueue) -> bool:
+    """Whether reading the queue waits for an item, rather than polling the queue service."""
+    return not isinstance(queue, HTTPQueue) or queue._supports_long_poll is not False
@@ -23,7 +23,7 @@ from typing import Any, List, Optional, Sequence, TYPE_CHECKING, Union
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
 
-from lightning.app.core.constants import REMOTE_STORAGE_WAIT
+from lightning.app.core.constants import REMOTE_STORAGE_WAIT, STORAGE_CONTENT_ADDRESSED
 from lightning.app.core.queues import BaseQueue
 from lightning.app.storage.requests import _ExistsRequest, _ExistsResponse, _GetRequest, _GetResponse
 from lightning.app.utilities.app_helpers import Logger
@@ -216,6 +216,13 @@ class Path(PathlibPath):
         while not fs.exists(response.path) or fs.info(response.path)["size"] != response.size:
             sleep(REMOTE_STORAGE_WAIT)
 
+        if response.content_addressed:
+            from lightning.app.storage.manifest import _download_content_addressed
+
+            # only the chunks which differ from the local copy are downloaded
+            _download_content_addressed(pathlib.Path(response.path), pathlib.Path(self.absolute()), fs)
+            return
+
         if self.exists_local() and self.is_dir():
             # Delete the directory, otherwise we can't overwrite it
             shutil.rmtree(self)
@@ -350,6 +357,9 @@ class Path(PathlibPath):
         from lightning.app.storage.copier import _copy_files
 
         source_path = pathlib.Path(request.path)
+        if STORAGE_CONTENT_ADDRESSED:
+            return Path._handle_content_addressed_get_request(request, source_path)
+
         destination_path = _shared_storage_path() / request.hash
         response = _GetResponse(
             source=request.source,
@@ -367,6 +377,27 @@ class Path(PathlibPath):
             response.exception = e
         return response
 
+    @staticmethod
+    def _handle_content_addressed_get_request(request: _GetRequest, source_path: pathlib.Path) -> _GetResponse:
+        from lightning.app.storage.manifest import _upload_content_addressed
+
+        manifest_path = _shared_storage_path() / f"{request.hash}.manifest.json"
+        response = _GetResponse(
+            source=request.source,
+            name=request.name,
+            path=str(manifest_path),
+            hash=request.hash,
+            destination=request.destination,
+            content_addressed=True,
+        )
+
+        try:
+            response.size = _upload_content_addressed(source_path, manifest_path)
+            _logger.debug(f"The chunks of {request.path} were uploaded, with their manifest at {response.path}.")
+        except Exception as e:
+            response.exception = e
+        return response
+
 
 def _is_lit_path(path: Union[str, Path]) -> bool:
     path = Path(path)
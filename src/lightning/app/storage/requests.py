@@ -35,6 +35,8 @@ class _GetResponse:
     destination: str = ""
     exception: Optional[Exception] = None
     timedelta: Optional[float] = None
+    # whether ``path`` points to the manifest of a content-addressed transfer rather than to a copy of the files
+    content_addressed: bool = False
 
 
 @dataclass
@@ -0,0 +1,220 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import json
+import math
+import os
+import pathlib
+import threading
+from time import perf_counter
+from typing import Optional, Set, Union
+
+from fsspec import AbstractFileSystem
+from fsspec.implementations.local import LocalFileSystem
+
+from lightning.app.core.constants import STORAGE_TRANSFER_CHUNK_SIZE, STORAGE_TRANSFER_NUM_WORKERS
+from lightning.app.utilities.app_helpers import Logger
+
+_logger = Logger(__name__)
+
+
+class TransferProgress:
+    """Counters of the bytes moved by a transfer of the :class:`~lightning.app.storage.drive.Drive` or the
+    :class:`~lightning.app.storage.filesystem.FileSystem`, which can be read from another thread while the transfer is
+    running.
+
+    Example:
+
+        >>> from lightning.app.storage import Drive, TransferProgress
+        >>> progress = TransferProgress()
+        >>> drive = Drive("lit://drive")  # doctest: +SKIP
+        >>> drive.put("model.ckpt", progress=progress)  # doctest: +SKIP
+        >>> print(f"{progress.transferred_bytes} bytes at {progress.throughput / 1e6:.1f} MB/s")  # doctest: +SKIP
+    """
+
+    def __init__(self) -> None:
+        self.total_bytes = 0
+        self.transferred_bytes = 0
+        self.resumed_bytes = 0
+        self.num_files = 0
+        self._start_time: Optional[float] = None
+        # the time at which the last bytes were transferred
+        self._end_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed_time(self) -> float:
+        """The time spent transferring, in seconds."""
+        if self._start_time is None or self._end_time is None:
+            return 0.0
+        return self._end_time - self._start_time
+
+    @property
+    def throughput(self) -> float:
+        """The number of bytes transferred per second, without the bytes kept from an interrupted transfer."""
+        elapsed_time = self.elapsed_time
+        return self.transferred_bytes / elapsed_time if elapsed_time > 0 else 0.0
+
+    def _start(self, num_bytes: int) -> None:
+        with self._lock:
+            if self._start_time is None:
+                self._start_time = perf_counter()
+            self.total_bytes += num_bytes
+            self.num_files += 1
+
+    def _update(self, num_bytes: int) -> None:
+        with self._lock:
+            self.transferred_bytes += num_bytes
+            self._end_time = perf_counter()
+
+    def _resume(self, num_bytes: int) -> None:
+        with self._lock:
+            self.resumed_bytes += num_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_files={self.num_files}, total_bytes={self.total_bytes},"
+            f" transferred_bytes={self.transferred_bytes}, resumed_bytes={self.resumed_bytes},"
+            f" throughput={self.throughput:.0f})"
+        )
+
+
+def _put_file(
+    fs: AbstractFileSystem,
+    source: pathlib.Path,
+    destination: pathlib.Path,
+    progress: Optional[TransferProgress] = None,
+    **kwargs,
+) -> None:
+    """Copies a local file to the filesystem.
+
+    The large files are copied by ranges in parallel when the filesystem is local, e.g., a shared mount. Otherwise, the
+    filesystem is left to split the file in parts itself.
+    """
+    progress = progress or TransferProgress()
+    size = source.stat().st_size
+    progress._start(size)
+    if isinstance(fs, LocalFileSystem) and size > STORAGE_TRANSFER_CHUNK_SIZE:
+        _ranged_transfer(fs, source, destination, size, progress)
+    else:
+        fs.put(str(source), str(destination), **kwargs)
+        progress._update(size)
+
+
+def _get_file(
+    fs: AbstractFileSystem,
+    source: Union[str, pathlib.Path],
+    destination: pathlib.Path,
+    progress: Optional[TransferProgress] = None,
+    **kwargs,
+) -> None:
+    """Copies a file of the filesystem to the local filesystem, by ranges in parallel when it is large."""
+    progress = progress or TransferProgress()
+    size = fs.size(str(source))
+    progress._start(size)
+    if size > STORAGE_TRANSFER_CHUNK_SIZE:
+        _ranged_transfer(fs, source, destination, size, progress)
+    else:
+        fs.get(str(source), str(destination), **kwargs)
+        progress._update(size)
+
+
+def _copy_local_file(source: str, destination: str, progress: Optional[TransferProgress] = None) -> None:
+    """A ``copy_function`` for :func:`shutil.copytree` which copies the large files by ranges in parallel."""
+    _get_file(LocalFileSystem(), source, pathlib.Path(destination), progress)
+
+
+def _ranged_transfer(
+    fs: AbstractFileSystem,
+    source: Union[str, pathlib.Path],
+    destination: Union[str, pathlib.Path],
+    size: int,
+    progress: TransferProgress,
+    chunk_size: Optional[int] = None,
+    num_workers: Optional[int] = None,
+) -> None:
+    """Copies the file of the filesystem to the local destination by reading ranges of it in parallel.
+
+    The ranges are written into a hidden partial file next to the destination, which replaces it once complete. The
+    ranges already written are recorded alongside it, so that an interrupted transfer of the same file resumes
+    from where it stopped.
+    """
+    chunk_size = chunk_size or STORAGE_TRANSFER_CHUNK_SIZE
+    num_workers = num_workers or STORAGE_TRANSFER_NUM_WORKERS
+    destination = pathlib.Path(destination)
+    partial_path = destination.with_name(f".{destination.name}.partial")
+    state_path = destination.with_name(f".{destination.name}.partial.json")
+    # identifies the version of the file, so that the ranges of another version are never resumed
+    key = fs.ukey(str(source))
+
+    done = _load_done_ranges(state_path, partial_path, key, size, chunk_size)
+    if not done:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        with open(partial_path, "wb") as f:
+            f.truncate(size)
+    else:
+        resumed_bytes = sum(min(chunk_size, size - index * chunk_size) for index in done)
+        _logger.debug(f"Resuming the transfer of {source} with {resumed_bytes} bytes already transferred.")
+        progress._resume(resumed_bytes)
+
+    lock = threading.Lock()
+
+    def transfer_range(index: int) -> None:
+        start = index * chunk_size
+        end = min(start + chunk_size, size)
+        data = fs.cat_file(str(source), start=start, end=end)
+        if len(data) != end - start:
+            raise RuntimeError(f"The file {source} was modified while it was being transferred.")
+        with open(partial_path, "r+b") as f:
+            f.seek(start)
+            f.write(data)
+        progress._update(len(data))
+        with lock:
+            done.add(index)
+            _save_done_ranges(state_path, key, size, chunk_size, done)
+
+    missing = [index for index in range(math.ceil(size / chunk_size)) if index not in done]
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        futures = [executor.submit(transfer_range, index) for index in missing]
+        concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+        # stop at the first error, the ranges written so far are kept for the next attempt
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+
+    os.replace(partial_path, destination)
+    state_path.unlink(missing_ok=True)
+
+
+def _load_done_ranges(
+    state_path: pathlib.Path, partial_path: pathlib.Path, key: str, size: int, chunk_size: int
+) -> Set[int]:
+    if not state_path.exists() or not partial_path.exists():
+        return set()
+    try:
+        state = json.loads(state_path.read_text())
+    except ValueError:
+        return set()
+    if (state.get("key"), state.get("size"), state.get("chunk_size")) != (key, size, chunk_size):
+        return set()
+    return set(state["done"])
+
+
+def _save_done_ranges(state_path: pathlib.Path, key: str, size: int, chunk_size: int, done: Set[int]) -> None:
+    tmp_path = state_path.with_name(f"{state_path.name}.tmp")
+    tmp_path.write_text(json.dumps({"key": key, "size": size, "chunk_size": chunk_size, "done": sorted(done)}))
+    os.replace(tmp_path, state_path)
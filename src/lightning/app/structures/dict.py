@@ -64,6 +64,7 @@ class Dict(t.Dict[str, T]):
 
         self._name: t.Optional[str] = ""
         self._backend: t.Optional[Backend] = None
+        self._state_version = 0
         for k, v in kwargs.items():
             if "." in k:
                 raise Exception(f"The provided name {k} contains . which is forbidden.")
@@ -86,6 +87,7 @@ class Dict(t.Dict[str, T]):
                 self._backend._wrap_run_method(_LightningAppRef().get_current(), v)
         v._name = f"{self.name}.{k}"
         super().__setitem__(k, v)
+        self._state_version += 1
 
     @property
     def works(self):
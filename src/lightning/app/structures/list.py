@@ -65,6 +65,7 @@ class List(t.List[T]):
         self._name: t.Optional[str] = ""
         self._last_index = 0
         self._backend: t.Optional[Backend] = None
+        self._state_version = 0
         for item in items:
             self.append(item)
 
@@ -80,6 +81,7 @@ class List(t.List[T]):
         v._name = f"{self.name}.{self._last_index}"
         self._last_index += 1
         super().append(v)
+        self._state_version += 1
 
     @property
     def name(self):
@@ -0,0 +1,165 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A local stand-in for the HTTP queue service used by :class:`~lightning.app.core.queues.HTTPQueue`, meant for
+tests and benchmarks only."""
+
+import asyncio
+import pickle
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from lightning.app.core.queues import _LONG_POLL_HEADER
+from lightning.app.utilities.network import find_free_network_port
+
+
+class _QueueServerState:
+    def __init__(self) -> None:
+        self.queues: Dict[str, Deque[bytes]] = defaultdict(deque)
+        self.num_requests = 0
+        self._conditions: Dict[str, asyncio.Condition] = {}
+
+    def condition(self, name: str) -> asyncio.Condition:
+        # created lazily so that the conditions are bound to the event loop of the server
+        if name not in self._conditions:
+            self._conditions[name] = asyncio.Condition()
+        return self._conditions[name]
+
+
+def _create_app(state: _QueueServerState, long_poll: bool) -> FastAPI:
+    app = FastAPI()
+    headers = {_LONG_POLL_HEADER: "1"} if long_poll else {}
+
+    @app.get("/health")
+    async def health() -> Response:
+        return Response(status_code=200)
+
+    @app.get("/v1/{app_id}/{queue_name}/length")
+    async def length(app_id: str, queue_name: str) -> Response:
+        state.num_requests += 1
+        return Response(content=str(len(state.queues[f"{app_id}_{queue_name}"])))
+
+    @app.post("/v1/{app_id}/{queue_name}")
+    async def action(app_id: str, queue_name: str, request: Request) -> Response:
+        state.num_requests += 1
+        name = f"{app_id}_{queue_name}"
+        items = state.queues[name]
+        condition = state.condition(name)
+        params = request.query_params
+        action = params.get("action")
+
+        if action in ("push", "pushmany"):
+            body = await request.body()
+            async with condition:
+                items.extend([body] if action == "push" else [pickle.dumps(item) for item in pickle.loads(body)])
+                condition.notify_all()
+            return Response(status_code=201)
+
+        if action == "pop":
+            wait = float(params.get("wait", 0)) if long_poll else 0
+            async with condition:
+                if not items and wait > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait_for(lambda: bool(items)), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                if not items:
+                    return Response(status_code=204, headers=headers)
+                return Response(content=items.popleft(), headers=headers)
+
+        if action == "popmany":
+            count = int(params.get("count", 1))
+            popped = [pickle.loads(items.popleft()) for _ in range(min(count, len(items)))]
+            if not popped:
+                return Response(status_code=204)
+            return Response(content=pickle.dumps(popped))
+
+        return Response(status_code=400)
+
+    return app
+
+
+class _QueueUvicornServer(uvicorn.Server):
+    def install_signal_handlers(self):
+        """Ignore Uvicorn Signal Handlers."""
+
+
+class HTTPQueueServer:
+    """Runs an in-memory HTTP queue service in a background thread.
+
+    Example:
+
+        >>> from lightning.app.core import queues
+        >>> with HTTPQueueServer() as server:  # doctest: +SKIP
+        ...     queues.HTTP_QUEUE_URL = server.url
+        ...     queue = queues.HTTPQueue("appid_queue", default_timeout=0.005)
+        ...     queue.put(1)
+        ...     assert queue.get(timeout=1) == 1
+
+    Arguments:
+        host: The host to bind the server to.
+        port: The port to bind the server to. A free port is picked if ``None``.
+        long_poll: Whether ``pop`` requests are held until an item is available or their ``wait`` time elapsed.
+            If ``False``, the server answers right away as services without long polling do.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: Optional[int] = None, long_poll: bool = True) -> None:
+        self.host = host
+        self.port = port or find_free_network_port()
+        self.long_poll = long_poll
+        self._state = _QueueServerState()
+        self._server: Optional[_QueueUvicornServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def num_requests(self) -> int:
+        """The number of requests received on the queue endpoints."""
+        return self._state.num_requests
+
+    def start(self, timeout: float = 10) -> None:
+        config = uvicorn.Config(
+            _create_app(self._state, self.long_poll), host=self.host, port=self.port, log_level="error"
+        )
+        self._server = _QueueUvicornServer(config=config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        start_time = time.time()
+        while not self._server.started:
+            if time.time() - start_time > timeout:
+                raise RuntimeError(f"The HTTP queue server didn't start within {timeout} seconds.")
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "HTTPQueueServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
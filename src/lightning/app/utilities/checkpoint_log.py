@@ -0,0 +1,267 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An append-only log of the states of a :class:`~lightning.app.core.app.LightningApp`.
+
+The log is made of generations. Each generation has a base file holding the full state at some version, and a
+deltas file where each snapshot appends a record with the state of the components which changed since the previous
+one. The state at a given version is restored by replaying the records of the deltas files over the latest base
+before it. Regularly, the records are folded into the base of a new generation by a background thread.
+"""
+
+import os
+import pickle
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from lightning.app.core.constants import CHECKPOINT_COMPACTION_INTERVAL
+from lightning.app.utilities.app_helpers import Logger
+from lightning.app.utilities.component import _ComponentSnapshot, _sanitize_state
+
+if TYPE_CHECKING:
+    from lightning.app.core.app import LightningApp
+
+logger = Logger(__name__)
+
+_LOG_FILE_PATTERN = re.compile(r"^log_(\d+)_(base|deltas)\.pkl$")
+
+
+class _CheckpointLog:
+    """Writes and reads the checkpoint log of an app in the given directory.
+
+    Arguments:
+        checkpoints_dir: The directory holding the log.
+        compaction_interval: The number of records after which the records are folded into a new base.
+    """
+
+    def __init__(self, checkpoints_dir: str, compaction_interval: int = CHECKPOINT_COMPACTION_INTERVAL) -> None:
+        self.checkpoints_dir = checkpoints_dir
+        self.compaction_interval = compaction_interval
+        self._snapshots: Optional[Dict[str, _ComponentSnapshot]] = None
+        self._structure: Optional[Tuple[Any, ...]] = None
+        self._compaction_thread: Optional[threading.Thread] = None
+
+        # the directory is only listed once, the next files are tracked in memory
+        generations = self.generations(checkpoints_dir)
+        self._generation = generations[-1] if generations else 0
+        self._version = -1
+        self._num_records = 0
+        for generation in reversed(generations):
+            path = self._path(generation, "deltas")
+            records, end = [], 0
+            for record, end in _read_pickles_with_offsets(path):
+                records.append(record)
+            if generation == self._generation:
+                self._num_records = len(records)
+                if os.path.exists(path) and os.path.getsize(path) > end:
+                    # the next records are appended after the last complete one, over the partially written one
+                    with open(path, "r+b") as f:
+                        f.truncate(end)
+            if records:
+                self._version = records[-1]["version"]
+                break
+            if os.path.exists(self._path(generation, "base")):
+                self._version = _read_version(self._path(generation, "base"))
+                break
+
+    @staticmethod
+    def generations(checkpoints_dir: str) -> List[int]:
+        """Returns the generations of the log found in the directory, in increasing order."""
+        if not os.path.isdir(checkpoints_dir):
+            return []
+        matches = (_LOG_FILE_PATTERN.match(f) for f in os.listdir(checkpoints_dir))
+        return sorted({int(match.group(1)) for match in matches if match})
+
+    @property
+    def version(self) -> int:
+        """The version of the last state appended to the log, -1 if it is empty."""
+        return self._version
+
+    def append(self, app: "LightningApp") -> str:
+        """Appends the state of the app to the log and returns the path of the file written.
+
+        Only the components which changed since the previous call are written, unless components were added or
+        removed, in which case the full state is.
+        """
+        os.makedirs(self.checkpoints_dir, exist_ok=True)
+        components = {component.name: component for component in app.flows + app.works}
+        structure = (tuple(components), app._get_structure_versions())
+        version = self._version + 1
+
+        if self._version < 0:
+            path = self._path(self._generation, "base")
+            _atomic_dump(path, {"version": version, "state": app.state_dict()})
+        else:
+            if self._snapshots is None or structure != self._structure:
+                record = {"version": version, "state": app.state_dict()}
+            else:
+                changed = [name for name, snapshot in self._snapshots.items() if snapshot.has_changed()]
+                record = {
+                    "version": version,
+                    "components": {name: _component_state(components[name]) for name in changed},
+                    "app_state": {"stage": app.stage.value},
+                }
+            path = self._path(self._generation, "deltas")
+            with open(path, "ab") as f:
+                pickle.dump(record, f)
+            self._num_records += 1
+
+        if self._snapshots is None or structure != self._structure:
+            self._snapshots = {name: _ComponentSnapshot(component) for name, component in components.items()}
+        else:
+            for name in record.get("components", ()):
+                self._snapshots[name] = _ComponentSnapshot(components[name])
+        self._structure = structure
+        self._version = version
+
+        if self._num_records >= self.compaction_interval and not self._is_compacting():
+            self._start_compaction()
+        return path
+
+    def load(self, version: Optional[int] = None) -> Dict[str, Any]:
+        """Returns the state at the given version, or the latest one."""
+        generations = self.generations(self.checkpoints_dir)
+        if not generations:
+            raise Exception(f"No checkpoints where found in `{self.checkpoints_dir}`.")
+        state = None
+        for record_version, record_state in self._read_records(generations, stop_at=version):
+            state = record_state
+            if record_version == version:
+                break
+        else:
+            if version is not None:
+                raise FileNotFoundError(f"The version `{version}` wasn't found in the log `{self.checkpoints_dir}`.")
+        return state
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Waits for the compaction in progress to finish."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join(timeout)
+
+    def _read_records(self, generations: List[int], stop_at: Optional[int] = None) -> Iterator[Tuple[int, Dict]]:
+        """Yields the versions and the states obtained by replaying the log from the latest base which isn't after
+        ``stop_at``."""
+        bases = [g for g in generations if os.path.exists(self._path(g, "base"))]
+        if stop_at is not None:
+            bases = [g for g in bases if _read_version(self._path(g, "base")) <= stop_at]
+        if not bases:
+            return
+        with open(self._path(bases[-1], "base"), "rb") as f:
+            base = pickle.load(f)
+        state, version = base["state"], base["version"]
+        yield version, state
+        for generation in (g for g in generations if g >= bases[-1]):
+            for record in _read_pickles(self._path(generation, "deltas")):
+                if record["version"] <= version:
+                    continue
+                state = _apply_record(state, record)
+                version = record["version"]
+                yield version, state
+
+    def _path(self, generation: int, kind: str) -> str:
+        return os.path.join(self.checkpoints_dir, f"log_{generation}_{kind}.pkl")
+
+    def _is_compacting(self) -> bool:
+        return self._compaction_thread is not None and self._compaction_thread.is_alive()
+
+    def _start_compaction(self) -> None:
+        # the next records go to a new generation while the base of the previous ones is written
+        generation = self._generation
+        self._generation += 1
+        self._num_records = 0
+        self._compaction_thread = threading.Thread(target=self._compact, args=(generation,), daemon=True)
+        self._compaction_thread.start()
+
+    def _compact(self, generation: int) -> None:
+        try:
+            version, state = -1, None
+            generations = [g for g in self.generations(self.checkpoints_dir) if g <= generation]
+            for version, state in self._read_records(generations):
+                pass
+            if state is None:
+                return
+            _atomic_dump(self._path(generation + 1, "base"), {"version": version, "state": state})
+            for g in self.generations(self.checkpoints_dir):
+                if g <= generation:
+                    for kind in ("base", "deltas"):
+                        if os.path.exists(self._path(g, kind)):
+                            os.remove(self._path(g, kind))
+            logger.debug(f"Compacted the checkpoint log up to the version {version}.")
+        except Exception as e:
+            logger.error(f"The compaction of the checkpoint log failed: {e}")
+
+
+def _component_state(component: Any) -> Dict[str, Any]:
+    return {
+        "vars": _sanitize_state({el: getattr(component, el) for el in component._state}),
+        "calls": component._calls.copy(),
+    }
+
+
+def _component_states(state: Dict[str, Any], name: str = "root") -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yields the names of the components in the app state along with their state."""
+    yield name, state
+    for key in ("flows", "works"):
+        for child_name, child_state in state.get(key, {}).items():
+            yield from _component_states(child_state, f"{name}.{child_name}")
+    for structure_name, structure_state in state.get("structures", {}).items():
+        for key in ("flows", "works"):
+            for child_name, child_state in structure_state.get(key, {}).items():
+                yield from _component_states(child_state, f"{name}.{structure_name}.{child_name}")
+
+
+def _apply_record(state: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    if "state" in record:
+        return record["state"]
+    if record["components"]:
+        component_states = dict(_component_states(state))
+        for name, component_state in record["components"].items():
+            component_states[name].update(component_state)
+    state["app_state"] = record["app_state"]
+    return state
+
+
+def _read_pickles(path: str) -> Iterator[Any]:
+    for record, _ in _read_pickles_with_offsets(path):
+        yield record
+
+
+def _read_pickles_with_offsets(path: str) -> Iterator[Tuple[Any, int]]:
+    """Yields the records of the file along with the offset of their end."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        while True:
+            try:
+                record = pickle.load(f)
+            except EOFError:
+                return
+            except (pickle.UnpicklingError, ValueError):
+                # the last record was only partially written
+                logger.warn(f"Ignoring the incomplete record at the end of {path}.")
+                return
+            yield record, f.tell()
+
+
+def _read_version(path: str) -> int:
+    with open(path, "rb") as f:
+        return pickle.load(f)["version"]
+
+
+def _atomic_dump(path: str, obj: Any) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(obj, f)
+    os.replace(tmp_path, path)
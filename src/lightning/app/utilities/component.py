@@ -14,7 +14,8 @@
 
 import os
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional, TYPE_CHECKING
+from copy import deepcopy
+from typing import Any, Dict, Generator, Optional, TYPE_CHECKING, Union
 
 from deepdiff.helper import NotPresent
 from lightning_utilities.core.apply_func import apply_to_collection
@@ -25,7 +26,7 @@ from lightning.app.utilities.packaging.cloud_compute import CloudCompute
 from lightning.app.utilities.tree import breadth_first
 
 if TYPE_CHECKING:
-    from lightning.app import LightningFlow
+    from lightning.app import LightningFlow, LightningWork
 
 COMPONENT_CONTEXT: Optional[ComponentContext] = None
 
@@ -87,6 +88,49 @@ def _state_to_json(state: Dict[str, Any]) -> Dict[str, Any]:
     return state_diff_cleaned
 
 
+_IMMUTABLE_STATE_TYPES = (bool, int, float, str, type(None))
+
+
+class _ComponentSnapshot:
+    """Keeps a copy of the variables and calls of a component to tell whether they changed since it was taken.
+
+    Setting an attribute of a component bumps its ``_state_version``, so the variables holding immutable values only
+    need to be compared when the version changed. The ones holding mutable values (lists, dicts, ...) can be modified
+    in-place without going through ``__setattr__`` and are always compared.
+    """
+
+    def __init__(self, component: Union["LightningFlow", "LightningWork"]) -> None:
+        self.component = component
+        self.version = component._state_version
+        self.vars = deepcopy(self._get_vars())
+        self.mutable_vars = [name for name, value in self.vars.items() if not isinstance(value, _IMMUTABLE_STATE_TYPES)]
+        self.calls = deepcopy(component._calls)
+
+    def _get_vars(self) -> Dict[str, Any]:
+        return {name: self._get_var(name) for name in self.component._state}
+
+    def _get_var(self, name: str) -> Any:
+        from lightning.app.storage import Drive, Path
+        from lightning.app.storage.payload import _BasePayload
+
+        value = getattr(self.component, name)
+        # these don't implement equality, compare their serialized form instead
+        if isinstance(value, (Path, Drive, _BasePayload)):
+            return value.to_dict()
+        return value
+
+    def has_changed(self) -> bool:
+        if self.component._calls != self.calls:
+            return True
+        if self.component._state_version != self.version:
+            if self._get_vars() != self.vars:
+                return True
+            # the attributes were re-assigned the values they already had
+            self.version = self.component._state_version
+            return False
+        return any(self._get_var(name) != self.vars[name] for name in self.mutable_vars)
+
+
 def _set_context(name: Optional[str]) -> None:
     global COMPONENT_CONTEXT
     COMPONENT_CONTEXT = os.getenv("COMPONENT_CONTEXT") if name is None else ComponentContext(name)
@@ -72,6 +72,10 @@ def _is_redis_available() -> bool:
     return module_available("redis")
 
 
+def _is_zstandard_available() -> bool:
+    return module_available("zstandard")
+
+
 def _is_torch_available() -> bool:
     return module_available("torch")
 
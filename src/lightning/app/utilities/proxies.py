@@ -39,7 +39,7 @@ from lightning.app.storage.drive import _maybe_create_drive, Drive
 from lightning.app.storage.path import _path_to_work_artifact
 from lightning.app.storage.payload import Payload
 from lightning.app.utilities.app_helpers import affiliation
-from lightning.app.utilities.component import _set_work_context
+from lightning.app.utilities.component import _IMMUTABLE_STATE_TYPES, _sanitize_state, _set_work_context
 from lightning.app.utilities.enum import (
     CacheCallsKeys,
     make_status,
@@ -232,6 +232,12 @@ class WorkStateObserver(Thread):
     from one interval to the next, it will compute the delta and add it to the queue which is connected to the
     Flow. This enables state changes to be captured that are not triggered through a setattr call.
 
+    The attributes are compared one by one with their previous value, by equality for those holding plain JSON
+    data, so that DeepDiff only runs on the attributes which changed. Unlike DeepDiff, the equality doesn't report the
+    type changes of the nested values, e.g. ``[1]`` to ``[1.0]``, which are sent along with the next change of the
+    attribute. The values held by the work aren't replaced, so that they can still be mutated through any reference
+    to them.
+
     Args:
         work: The LightningWork for which the state should be monitored
         delta_queue: The queue to send deltas to when state changes occur
@@ -265,6 +271,8 @@ class WorkStateObserver(Thread):
         self._exit_event = Event()
         self._delta_memory = []
         self._last_state = deepcopy(self._work.state)
+        # the attributes whose last value is made of plain JSON data, which can be compared without sanitizing it
+        self._plain_vars: Set[str] = {name for name, value in self._last_state["vars"].items() if _is_plain(value)}
 
     def run(self) -> None:
         self.started = True
@@ -281,19 +289,59 @@ class WorkStateObserver(Thread):
         except queue.Empty:
             return None
 
+    def _get_changed_state(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Returns the previous and current values of the variables and calls which changed since the last check."""
+        last_vars = self._last_state["vars"]
+        before, after = {"vars": {}}, {"vars": {}}
+        for name in last_vars.keys() - self._work._state:
+            before["vars"][name] = last_vars[name]
+
+        for name in self._work._state:
+            raw_value = getattr(self._work, name)
+            if name in self._plain_vars and _is_unchanged(raw_value, last_vars[name]):
+                # a value equal to plain JSON data is the same once sanitized
+                continue
+            value = _sanitize_state({name: raw_value})[name]
+            if name not in last_vars:
+                after["vars"][name] = value
+            elif not _is_unchanged(value, last_vars[name]):
+                before["vars"][name] = last_vars[name]
+                after["vars"][name] = value
+            elif _is_plain(raw_value):
+                # e.g. an attribute assigned through the setattr proxy, which is compared by equality again
+                self._plain_vars.add(name)
+
+        if self._work._calls != self._last_state["calls"]:
+            before["calls"] = self._last_state["calls"]
+            after["calls"] = self._work._calls.copy()
+        return before, after
+
     def run_once(self) -> None:
         with _state_observer_lock:
             # Add all deltas the LightningWorkSetAttrProxy has processed and sent to the Flow already while
-            # the WorkStateObserver was sleeping
+            # the WorkStateObserver was sleeping. They are applied in-place to avoid copying the whole state.
             for delta in self._delta_memory:
-                self._last_state += delta
+                Delta(deepcopy(delta.to_dict()), mutate=True) + self._last_state
             self._delta_memory.clear()
 
             # The remaining delta is the result of state updates triggered outside the setattr, e.g, by a list append
-            delta = Delta(DeepDiff(self._last_state, self._work.state, verbose_level=2))
+            before, after = self._get_changed_state()
+            if not before["vars"] and not after["vars"] and "calls" not in after:
+                return
+            delta = Delta(DeepDiff(before, after, verbose_level=2))
+            for name in before["vars"].keys() - after["vars"].keys():
+                del self._last_state["vars"][name]
+                self._plain_vars.discard(name)
+            self._last_state["vars"].update(deepcopy(after["vars"]))
+            for name, value in after["vars"].items():
+                if _is_plain(value):
+                    self._plain_vars.add(name)
+                else:
+                    self._plain_vars.discard(name)
+            if "calls" in after:
+                self._last_state["calls"] = deepcopy(after["calls"])
             if not delta.to_dict():
                 return
-            self._last_state = deepcopy(self._work.state)
             self._delta_queue.put(ComponentDelta(id=self._work.name, delta=delta))
 
         if self._flow_to_work_delta_queue:
@@ -336,9 +384,11 @@ class LightningWorkSetAttrProxy:
     def __call__(self, name: str, value: Any) -> None:
         logger.debug(f"Setting {name}: {value}")
         with _state_observer_lock:
-            state = deepcopy(self.work.state)
+            # only the attribute being set can change, along with the paths when it is a Path
+            names = (name, "_paths")
+            state = deepcopy(_get_state_vars(self.work, names))
             self.work._default_setattr(name, value)
-            delta = Delta(DeepDiff(state, self.work.state, verbose_level=2))
+            delta = Delta(DeepDiff(state, _get_state_vars(self.work, names), verbose_level=2))
             if not delta.to_dict():
                 return
 
@@ -348,6 +398,32 @@ class LightningWorkSetAttrProxy:
             # add the delta to the buffer to let WorkStateObserver know we already sent this one to the Flow
             if self.state_observer:
                 self.state_observer._delta_memory.append(delta)
+                # the last values of these attributes are updated by the delta, they are sanitized on the next check
+                self.state_observer._plain_vars.difference_update(names)
+
+
+def _get_state_vars(work: "LightningWork", names: Tuple[str, ...]) -> Dict[str, Any]:
+    return {"vars": _sanitize_state({name: getattr(work, name) for name in names if name in work._state})}
+
+
+def _is_unchanged(value: Any, last_value: Any) -> bool:
+    # DeepDiff reports type changes such as 1 to 1.0 which the equality doesn't. Only the top-level types are compared,
+    # walking the nested values would cost as much as sanitizing them
+    if type(value) is not type(last_value):
+        return False
+    # the other values, e.g. Paths, are left to DeepDiff
+    return isinstance(value, _IMMUTABLE_STATE_TYPES + (list, dict, tuple)) and value == last_value
+
+
+def _is_plain(value: Any) -> bool:
+    """Whether the value is only made of the builtin containers and immutable types of the JSON state."""
+    if isinstance(value, _IMMUTABLE_STATE_TYPES):
+        return True
+    if type(value) in (list, tuple):
+        return all(_is_plain(item) for item in value)
+    if type(value) is dict:
+        return all(_is_plain(item) for item in value.values())
+    return False
 
 
 @dataclass
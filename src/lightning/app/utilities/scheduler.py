@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import threading
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from croniter import croniter
 from deepdiff import Delta
@@ -23,43 +25,86 @@ from lightning.app.utilities.proxies import ComponentDelta
 
 
 class SchedulerThread(threading.Thread):
+    """Enables the scheduled calls of the flows when their cron pattern is reached.
+
+    The schedules are kept in a heap ordered by their next event, so that the thread sleeps until the earliest one and
+    only the schedules which are due are looked at when it wakes up.
+    """
+
     # TODO (tchaton) Abstract this logic to a generic scheduling service.
 
     def __init__(self, app) -> None:
         super().__init__(daemon=True)
         self._exit_event = threading.Event()
-        self._sleep_time = 1.0
         self._app = app
+        self._heap: List[Tuple[datetime, str]] = []
+        self._iterators: Dict[str, croniter] = {}
+        # notified when a schedule is added, so that the thread wakes up if it fires before the current deadline
+        self._condition = threading.Condition()
+
+    def add_schedule(self, call_hash: str, metadata: Dict) -> None:
+        with self._condition:
+            iterator = croniter(metadata["cron_pattern"], datetime.fromisoformat(metadata["start_time"]))
+            self._iterators[call_hash] = iterator
+            heapq.heappush(self._heap, (iterator.get_next(datetime), call_hash))
+            self._condition.notify()
 
     def run(self) -> None:
         try:
             while not self._exit_event.is_set():
-                self._exit_event.wait(self._sleep_time)
+                with self._condition:
+                    # checked again under the condition, as `join` could have notified it since the last check
+                    if self._exit_event.is_set():
+                        break
+                    self._condition.wait(self._time_to_next_event())
+                if self._exit_event.is_set():
+                    break
                 self.run_once()
         except Exception as e:
             raise e
 
-    def run_once(self):
-        for call_hash in list(self._app._schedules.keys()):
-            metadata = self._app._schedules[call_hash]
-            start_time = datetime.fromisoformat(metadata["start_time"])
-            current_date = datetime.now()
-            next_event = croniter(metadata["cron_pattern"], start_time).get_next(datetime)
-            # When the event is reached, send a delta to activate scheduling.
-            if current_date > next_event:
-                component_delta = ComponentDelta(
-                    id=metadata["name"],
-                    delta=Delta(
-                        {
-                            "values_changed": {
-                                f"root['calls']['scheduling']['{call_hash}']['running']": {"new_value": True}
-                            }
-                        }
-                    ),
-                )
-                self._app.delta_queue.put(component_delta)
+    def run_once(self) -> None:
+        current_date = datetime.now()
+        due_call_hashes: Dict[str, List[str]] = defaultdict(list)
+        with self._condition:
+            while self._heap and self._heap[0][0] <= current_date:
+                next_event, call_hash = heapq.heappop(self._heap)
+                metadata = self._app._schedules[call_hash]
+                due_call_hashes[metadata["name"]].append(call_hash)
                 metadata["start_time"] = next_event.isoformat()
+                # the events missed while the app was busy are skipped, the call is enabled only once
+                iterator = self._iterators[call_hash]
+                while next_event <= current_date:
+                    next_event = iterator.get_next(datetime)
+                heapq.heappush(self._heap, (next_event, call_hash))
+
+        if not due_call_hashes:
+            return
+
+        # When the events are reached, send the deltas to activate scheduling all at once.
+        component_deltas = [
+            ComponentDelta(
+                id=name,
+                delta=Delta(
+                    {
+                        "values_changed": {
+                            f"root['calls']['scheduling']['{call_hash}']['running']": {"new_value": True}
+                            for call_hash in call_hashes
+                        }
+                    }
+                ),
+            )
+            for name, call_hashes in due_call_hashes.items()
+        ]
+        self._app.delta_queue.batch_put(component_deltas)
 
     def join(self, timeout: Optional[float] = None) -> None:
         self._exit_event.set()
+        with self._condition:
+            self._condition.notify()
         super().join(timeout)
+
+    def _time_to_next_event(self) -> Optional[float]:
+        if not self._heap:
+            return None
+        return max((self._heap[0][0] - datetime.now()).total_seconds(), 0.0)
@@ -169,6 +169,10 @@ class _ExperimentWriter:
     r"""
     Experiment writer for CSVLogger.
 
+    The recorded metrics are appended to the metrics file on every save and then released, so that the memory used and
+    the cost of a save don't grow with the length of the run. The file is only rewritten when new metric keys appear,
+    to add them as columns to its header.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -177,6 +181,9 @@ class _ExperimentWriter:
 
     def __init__(self, log_dir: str) -> None:
         self.metrics: List[Dict[str, float]] = []
+        self.metrics_keys: List[str] = []
+        # the number of rows recorded since the start, which is the default step
+        self._num_rows = 0
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -197,23 +204,48 @@ class _ExperimentWriter:
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_rows
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics["step"] = step
         self.metrics.append(metrics)
+        self._num_rows += 1
 
     def save(self) -> None:
         """Save recorded metrics into files."""
         if not self.metrics:
             return
 
-        last_m = {}
-        for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+        # a file left by a previous run in this directory is replaced on the first save
+        file_exists = bool(self.metrics_keys)
+        new_keys = self._record_new_keys()
+        if file_exists and new_keys:
+            self._rewrite_with_new_header()
 
-        with open(self.metrics_file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            writer.writeheader()
+        with open(self.metrics_file_path, "a" if file_exists else "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+            if not file_exists:
+                writer.writeheader()
             writer.writerows(self.metrics)
+        self.metrics = []
+
+    def _record_new_keys(self) -> List[str]:
+        """Adds the keys of the recorded metrics which aren't in the header yet, in order of appearance."""
+        known_keys = set(self.metrics_keys)
+        new_keys = []
+        for m in self.metrics:
+            for key in m:
+                if key not in known_keys:
+                    known_keys.add(key)
+                    new_keys.append(key)
+        self.metrics_keys.extend(new_keys)
+        return new_keys
+
+    def _rewrite_with_new_header(self) -> None:
+        """Copies the rows saved so far to a new file with all the metric keys in its header, one row at a time."""
+        tmp_path = f"{self.metrics_file_path}.tmp"
+        with open(self.metrics_file_path, newline="") as src, open(tmp_path, "w", newline="") as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.metrics_keys)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+        os.replace(tmp_path, self.metrics_file_path)
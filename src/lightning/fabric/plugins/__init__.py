@@ -13,6 +13,7 @@
 # limitations under the License.
 from lightning.fabric.plugins.environments.cluster_environment import ClusterEnvironment
 from lightning.fabric.plugins.io.checkpoint_io import CheckpointIO
+from lightning.fabric.plugins.io.directory_io import DirectoryCheckpointIO
 from lightning.fabric.plugins.io.torch_io import TorchCheckpointIO
 from lightning.fabric.plugins.io.xla import XLACheckpointIO
 from lightning.fabric.plugins.precision.amp import MixedPrecision
@@ -26,6 +27,7 @@ from lightning.fabric.plugins.precision.tpu_bf16 import TPUBf16Precision
 __all__ = [
     "ClusterEnvironment",
     "CheckpointIO",
+    "DirectoryCheckpointIO",
     "TorchCheckpointIO",
     "XLACheckpointIO",
     "Precision",
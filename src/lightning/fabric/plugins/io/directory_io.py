@@ -0,0 +1,95 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from lightning.fabric.plugins.io.torch_io import TorchCheckpointIO
+from lightning.fabric.utilities.cloud_io import _load as pl_load
+from lightning.fabric.utilities.cloud_io import get_filesystem
+from lightning.fabric.utilities.tensor_directory import (
+    _is_tensor_directory,
+    _load_tensor_directory,
+    _save_tensor_directory,
+)
+from lightning.fabric.utilities.types import _PATH
+
+log = logging.getLogger(__name__)
+
+
+class DirectoryCheckpointIO(TorchCheckpointIO):
+    """CheckpointIO that saves each checkpoint as a directory with a small index and a file per tensor.
+
+    The files of the tensors are memory-mapped when loading from the local file system, so that the tensors loaded on
+    CPU are only read when accessed, and read by a pool of threads otherwise. Loading can be restricted to some of the
+    top-level keys of the checkpoint, for example to read only the weights for inference. The checkpoints saved with
+    :func:`torch.save` can still be loaded.
+
+    Args:
+        mmap: Whether to memory-map the files of the tensors when loading from the local file system.
+    """
+
+    def __init__(self, mmap: bool = True) -> None:
+        super().__init__()
+        self.mmap = mmap
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Save model/training states as a checkpoint directory.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target path
+            storage_options: not used in ``DirectoryCheckpointIO.save_checkpoint``
+
+        Raises:
+            TypeError:
+                If ``storage_options`` arg is passed in
+        """
+        if storage_options is not None:
+            raise TypeError(
+                "`Trainer.save_checkpoint(..., storage_options=...)` with `storage_options` arg"
+                f" is not supported for `{self.__class__.__name__}`. Please implement your custom `CheckpointIO`"
+                " to define how you'd like to use `storage_options`."
+            )
+        _save_tensor_directory(checkpoint, path)
+
+    def load_checkpoint(
+        self,
+        path: _PATH,
+        map_location: Optional[Callable] = lambda storage, loc: storage,
+        keys: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Loads a checkpoint directory, or a checkpoint file saved with :func:`torch.save`.
+
+        Args:
+            path: Path to checkpoint
+            map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
+                locations.
+            keys: The top-level keys of the checkpoint to load, for example ``["state_dict"]``. Only the tensors
+                under these keys are read. All of them are loaded by default.
+
+        Returns: The loaded checkpoint.
+
+        Raises:
+            FileNotFoundError: If ``path`` is not found by the ``fsspec`` filesystem
+        """
+        fs = get_filesystem(path)
+        if not fs.exists(path):
+            raise FileNotFoundError(f"Checkpoint at {path} not found. Aborting training.")
+
+        if _is_tensor_directory(path):
+            return _load_tensor_directory(path, map_location=map_location, keys=keys, mmap=self.mmap)
+        checkpoint = pl_load(path, map_location=map_location)
+        if keys is not None:
+            checkpoint = {key: checkpoint[key] for key in keys if key in checkpoint}
+        return checkpoint
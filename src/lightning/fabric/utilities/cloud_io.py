@@ -13,15 +13,16 @@
 # limitations under the License.
 """Utilities related to data saving/loading."""
 
-import io
+import os
+import uuid
 from pathlib import Path
 from typing import Any, Dict, IO, Union
 
-import fsspec
 import torch
 from fsspec.core import url_to_fs
-from fsspec.implementations.local import AbstractFileSystem
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
 
+from lightning.fabric.utilities.tensor_directory import _is_tensor_directory, _load_tensor_directory
 from lightning.fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
 
 
@@ -29,7 +30,8 @@ def _load(
     path_or_url: Union[IO, _PATH],
     map_location: _MAP_LOCATION_TYPE = None,
 ) -> Any:
-    """Loads a checkpoint.
+    """Loads a checkpoint, saved with :func:`torch.save` or in the directory format of
+    :class:`~lightning.fabric.plugins.io.directory_io.DirectoryCheckpointIO`.
 
     Args:
         path_or_url: Path or URL of the checkpoint.
@@ -43,6 +45,8 @@ def _load(
             str(path_or_url),
             map_location=map_location,  # type: ignore[arg-type] # upstream annotation is not correct
         )
+    if _is_tensor_directory(path_or_url):
+        return _load_tensor_directory(path_or_url, map_location=map_location)
     fs = get_filesystem(path_or_url)
     with fs.open(path_or_url, "rb") as f:
         return torch.load(f, map_location=map_location)
@@ -56,6 +60,11 @@ def get_filesystem(path: _PATH, **kwargs: Any) -> AbstractFileSystem:
 def _atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    The checkpoint is serialized straight to the target file system, without being buffered in memory first. On the
+    local file system, it is written to a temporary file next to the target which is then renamed to it. On the other
+    file systems, the file is written within a transaction, so that it is only created once complete. For object
+    stores, the file is uploaded in parts as it is written and the upload is aborted on failure.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
@@ -63,7 +72,25 @@ def _atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None
         filepath: The path to which the checkpoint will be saved.
             This points to the file that the checkpoint will be stored in.
     """
-    bytesbuffer = io.BytesIO()
-    torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+    # the transaction belongs to the file system instance, so the cached instance shared by the process isn't used
+    fs, path = url_to_fs(str(filepath), skip_instance_cache=True)
+    if isinstance(fs, LocalFileSystem):
+        _atomic_local_save(checkpoint, path)
+        return
+    with fs.transaction, fs.open(path, "wb") as f:
+        torch.save(checkpoint, f)
+
+
+def _atomic_local_save(checkpoint: Dict[str, Any], path: str) -> None:
+    # in the same directory, so that the rename doesn't cross file systems
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, "xb") as f:
+            torch.save(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
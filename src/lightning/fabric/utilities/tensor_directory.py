@@ -0,0 +1,234 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A checkpoint format made of a directory with an index and a file per tensor.
+
+The index is the checkpoint saved with :func:`torch.save`, in which the tensors are replaced by references to their
+files. The files hold the raw bytes of the tensors, so that they can be memory-mapped or read in parallel, and only the
+tensors under the requested keys of the checkpoint need to be read::
+
+    model.ckpt/
+        index.pt
+        tensors/0.bin
+        tensors/1.bin
+        ...
+
+On file systems other than the local one, the tensors of each save are written to their own ``tensors-<id>``
+directory, which the index names.
+"""
+
+import copy
+import io
+import mmap
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import torch
+from fsspec.core import url_to_fs
+from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
+from torch import Tensor
+
+from lightning.fabric.utilities.types import _MAP_LOCATION_TYPE, _PATH
+
+_INDEX_FILENAME = "index.pt"
+_TENSORS_DIRNAME = "tensors"
+_FORMAT_VERSION = 1
+
+
+class _TensorRef(NamedTuple):
+    filename: str
+    dtype: torch.dtype
+    shape: Tuple[int, ...]
+    location: str
+    requires_grad: bool
+    is_parameter: bool
+
+
+def _is_tensor_directory(path: _PATH) -> bool:
+    """Returns whether the path is a checkpoint in the directory format."""
+    fs, fs_path = url_to_fs(str(path))
+    return fs.isfile(_join(fs, fs_path, _INDEX_FILENAME))
+
+
+def _save_tensor_directory(checkpoint: Dict[str, Any], path: _PATH) -> None:
+    """Saves the checkpoint as a directory with an index and a file per tensor.
+
+    On the local file system, the directory is written next to the target and then renamed to it. On the other file
+    systems, which can't rename a directory, the tensors are written to a new directory next to those of the previous
+    checkpoint and the index is written last. The previous checkpoint is therefore loaded until the new index replaces
+    it, after which its tensors are removed. A previous checkpoint saved as a single file is removed first.
+    """
+    fs, fs_path = url_to_fs(str(path))
+    if isinstance(fs, LocalFileSystem):
+        tmp_path = os.path.join(os.path.dirname(fs_path), f".{os.path.basename(fs_path)}.{uuid.uuid4().hex}.tmp")
+        try:
+            _write_tensor_directory(fs, checkpoint, tmp_path)
+            if os.path.isdir(fs_path):
+                shutil.rmtree(fs_path)
+            elif os.path.exists(fs_path):
+                os.remove(fs_path)
+            os.replace(tmp_path, fs_path)
+        finally:
+            if os.path.exists(tmp_path):
+                shutil.rmtree(tmp_path)
+        return
+    if fs.isfile(fs_path):
+        fs.rm(fs_path)
+    previous = fs.ls(fs_path, detail=False) if fs.isdir(fs_path) else []
+    tensors_dirname = f"{_TENSORS_DIRNAME}-{uuid.uuid4().hex}"
+    _write_tensor_directory(fs, checkpoint, fs_path, tensors_dirname)
+    keep = {_join(fs, fs_path, _INDEX_FILENAME), _join(fs, fs_path, tensors_dirname)}
+    for previous_path in previous:
+        if previous_path.rstrip(fs.sep) not in keep:
+            fs.rm(previous_path, recursive=True)
+
+
+def _load_tensor_directory(
+    path: _PATH,
+    map_location: _MAP_LOCATION_TYPE = None,
+    keys: Optional[Iterable[str]] = None,
+    mmap: bool = True,
+) -> Dict[str, Any]:
+    """Loads a checkpoint saved in the directory format.
+
+    Args:
+        path: Path or URL of the checkpoint directory.
+        map_location: a function, ``torch.device``, string or a dict specifying how to remap storage locations.
+        keys: The top-level keys of the checkpoint to load, all of them by default. Only the tensors under these keys
+            are read.
+        mmap: Whether to memory-map the files of the tensors on the local file system, in which case the tensors
+            mapped to the CPU are only read when accessed. Otherwise, the files are read by a pool of threads.
+    """
+    fs, fs_path = url_to_fs(str(path))
+    with fs.open(_join(fs, fs_path, _INDEX_FILENAME), "rb") as f:
+        index = torch.load(f)
+    checkpoint = index["checkpoint"]
+    tensors_dirname = index.get("tensors", _TENSORS_DIRNAME)
+    if keys is not None:
+        checkpoint = {key: checkpoint[key] for key in keys if key in checkpoint}
+
+    refs: Dict[str, _TensorRef] = {}
+    _map_collection(checkpoint, _TensorRef, lambda ref: refs.setdefault(ref.filename, ref))
+    mmap = mmap and isinstance(fs, LocalFileSystem)
+
+    def _load_ref(ref: _TensorRef) -> Tensor:
+        filepath = _join(fs, fs_path, tensors_dirname, ref.filename)
+        tensor = _mmap_tensor(filepath, ref) if mmap else _read_tensor(fs, filepath, ref)
+        tensor = _map_location(tensor, ref.location, map_location)
+        if ref.is_parameter:
+            return torch.nn.Parameter(tensor, requires_grad=ref.requires_grad)
+        return tensor.requires_grad_(ref.requires_grad)
+
+    with ThreadPoolExecutor() as executor:
+        tensors = dict(zip(refs, executor.map(_load_ref, refs.values())))
+    return _map_collection(checkpoint, _TensorRef, lambda ref: tensors[ref.filename])
+
+
+def _write_tensor_directory(
+    fs: AbstractFileSystem, checkpoint: Dict[str, Any], path: str, tensors_dirname: str = _TENSORS_DIRNAME
+) -> None:
+    fs.makedirs(_join(fs, path, tensors_dirname), exist_ok=True)
+    # the views of the same data are saved once
+    refs: Dict[Tuple, _TensorRef] = {}
+
+    def _save_tensor(tensor: Tensor) -> Any:
+        if tensor.layout != torch.strided or tensor.is_quantized or tensor.is_meta:
+            # saved in the index
+            return tensor
+        key = (
+            tensor.untyped_storage().data_ptr(),
+            tensor.storage_offset(),
+            tuple(tensor.shape),
+            tensor.stride(),
+            tensor.dtype,
+            str(tensor.device),
+        )
+        if key not in refs:
+            ref = _TensorRef(
+                filename=f"{len(refs)}.bin",
+                dtype=tensor.dtype,
+                shape=tuple(tensor.shape),
+                location=str(tensor.device),
+                requires_grad=tensor.requires_grad,
+                is_parameter=isinstance(tensor, torch.nn.Parameter),
+            )
+            data = tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8)
+            with fs.open(_join(fs, path, tensors_dirname, ref.filename), "wb") as f:
+                f.write(memoryview(data.numpy()))
+            refs[key] = ref
+        return refs[key]
+
+    index = {
+        "version": _FORMAT_VERSION,
+        "tensors": tensors_dirname,
+        "checkpoint": _map_collection(checkpoint, Tensor, _save_tensor),
+    }
+    # the index is serialized first and written at once, so that a failed save doesn't leave a partial index
+    buffer = io.BytesIO()
+    torch.save(index, buffer)
+    fs.pipe_file(_join(fs, path, _INDEX_FILENAME), buffer.getvalue())
+
+
+def _map_collection(data: Any, dtype: type, function: Callable) -> Any:
+    """Applies the function to the elements of the given type in the collection.
+
+    Unlike :func:`~lightning_utilities.core.apply_func.apply_to_collection`, the mappings are shallow-copied, which
+    keeps the attributes of the state dicts, such as their ``_metadata``.
+    """
+    if isinstance(data, dtype):
+        return function(data)
+    if isinstance(data, dict):
+        out = copy.copy(data)
+        for key, value in data.items():
+            out[key] = _map_collection(value, dtype, function)
+        return out
+    if isinstance(data, tuple) and hasattr(data, "_fields"):
+        return type(data)(*(_map_collection(value, dtype, function) for value in data))
+    if isinstance(data, (list, tuple)):
+        return type(data)(_map_collection(value, dtype, function) for value in data)
+    return data
+
+
+def _mmap_tensor(filepath: str, ref: _TensorRef) -> Tensor:
+    if not os.path.getsize(filepath):
+        return torch.empty(ref.shape, dtype=ref.dtype)
+    with open(filepath, "rb") as f:
+        # copy-on-write, so that the tensor is writable without changing the file
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    return torch.frombuffer(buffer, dtype=ref.dtype).reshape(ref.shape)
+
+
+def _read_tensor(fs: AbstractFileSystem, filepath: str, ref: _TensorRef) -> Tensor:
+    tensor = torch.empty(ref.shape, dtype=ref.dtype)
+    with fs.open(filepath, "rb") as f:
+        f.readinto(memoryview(tensor.reshape(-1).view(torch.uint8).numpy()))
+    return tensor
+
+
+def _map_location(tensor: Tensor, location: str, map_location: _MAP_LOCATION_TYPE) -> Tensor:
+    """Moves the tensor loaded on CPU to the device given by ``map_location``, as :func:`torch.load` does."""
+    if callable(map_location):
+        storage = map_location(tensor.untyped_storage(), location)
+        if storage is None:
+            return tensor.to(location)
+        return tensor.to(storage.device)
+    if isinstance(map_location, dict):
+        return tensor.to(map_location.get(location, location))
+    return tensor.to(map_location if map_location is not None else location)
+
+
+def _join(fs: AbstractFileSystem, *parts: str) -> str:
+    return fs.sep.join(part.rstrip(fs.sep) for part in parts)
@@ -158,6 +158,12 @@ def _load_from_checkpoint(
         map_location = cast(_MAP_LOCATION_TYPE, lambda storage, loc: storage)
     with pl_legacy_patch():
         checkpoint = pl_load(checkpoint_path, map_location=map_location)
+        if isinstance(checkpoint_path, (str, Path)):
+            from lightning.pytorch.plugins.io.delta_plugin import _resolve_delta_checkpoint
+
+            checkpoint = _resolve_delta_checkpoint(
+                checkpoint, checkpoint_path, lambda base_path: pl_load(base_path, map_location=map_location)
+            )
 
     # convert legacy checkpoints to the new format
     checkpoint = _pl_migrate_checkpoint(
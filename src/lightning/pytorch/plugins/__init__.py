@@ -1,7 +1,14 @@
 from typing import Union
 
-from lightning.fabric.plugins import CheckpointIO, ClusterEnvironment, TorchCheckpointIO, XLACheckpointIO
+from lightning.fabric.plugins import (
+    CheckpointIO,
+    ClusterEnvironment,
+    DirectoryCheckpointIO,
+    TorchCheckpointIO,
+    XLACheckpointIO,
+)
 from lightning.pytorch.plugins.io.async_plugin import AsyncCheckpointIO
+from lightning.pytorch.plugins.io.delta_plugin import DeltaCheckpointIO
 from lightning.pytorch.plugins.io.hpu_plugin import HPUCheckpointIO
 from lightning.pytorch.plugins.layer_sync import LayerSync, TorchSyncBatchNorm
 from lightning.pytorch.plugins.precision.amp import MixedPrecisionPlugin
@@ -20,6 +27,8 @@ PLUGIN_INPUT = Union[PLUGIN, str]
 __all__ = [
     "AsyncCheckpointIO",
     "CheckpointIO",
+    "DeltaCheckpointIO",
+    "DirectoryCheckpointIO",
     "TorchCheckpointIO",
     "XLACheckpointIO",
     "HPUCheckpointIO",
@@ -11,8 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from lightning.fabric.plugins import CheckpointIO, TorchCheckpointIO, XLACheckpointIO
+from lightning.fabric.plugins import CheckpointIO, DirectoryCheckpointIO, TorchCheckpointIO, XLACheckpointIO
 from lightning.pytorch.plugins.io.async_plugin import AsyncCheckpointIO
+from lightning.pytorch.plugins.io.delta_plugin import DeltaCheckpointIO
 from lightning.pytorch.plugins.io.hpu_plugin import HPUCheckpointIO
 
-__all__ = ["AsyncCheckpointIO", "CheckpointIO", "HPUCheckpointIO", "TorchCheckpointIO", "XLACheckpointIO"]
+__all__ = [
+    "AsyncCheckpointIO",
+    "CheckpointIO",
+    "DeltaCheckpointIO",
+    "DirectoryCheckpointIO",
+    "HPUCheckpointIO",
+    "TorchCheckpointIO",
+    "XLACheckpointIO",
+]
@@ -12,12 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
+
+import torch
+from torch import Tensor
 
 from lightning.fabric.plugins import CheckpointIO
+from lightning.fabric.utilities.tensor_directory import _map_collection
+from lightning.fabric.utilities.types import _PATH
 from lightning.pytorch.plugins.io.wrapper import _WrappingCheckpointIO
 
+log = logging.getLogger(__name__)
+
+_DEFAULT_MAX_PENDING_SNAPSHOTS = 2
+
 
 class AsyncCheckpointIO(_WrappingCheckpointIO):
     """``AsyncCheckpointIO`` enables saving the checkpoints asynchronously in a thread.
@@ -28,35 +40,141 @@ class AsyncCheckpointIO(_WrappingCheckpointIO):
 
     Args:
         checkpoint_io: A checkpoint IO plugin that is used as the basis for async checkpointing.
+        snapshot: Whether to copy the tensors of the checkpoint to CPU staging buffers before returning, so that the
+            training can continue to update them while the copy is being saved. The staging buffers are reused by the
+            next saves and allocated in pinned memory for the tensors on GPU.
+        max_pending_saves: The maximum number of saves submitted and not completed yet. When reached, saving blocks
+            until the oldest save completes. By default, the number of pending saves is not limited, unless
+            ``snapshot=True`` in which case it is limited to 2 to bound the memory used by the staging buffers.
     """
 
-    def __init__(self, checkpoint_io: Optional["CheckpointIO"] = None) -> None:
+    def __init__(
+        self,
+        checkpoint_io: Optional["CheckpointIO"] = None,
+        snapshot: bool = False,
+        max_pending_saves: Optional[int] = None,
+    ) -> None:
         super().__init__(checkpoint_io)
+        if max_pending_saves is not None and max_pending_saves < 1:
+            raise ValueError(f"`max_pending_saves` must be a positive integer, got {max_pending_saves}.")
+        if snapshot and max_pending_saves is None:
+            # each pending save holds a copy of the checkpoint in host memory
+            max_pending_saves = _DEFAULT_MAX_PENDING_SNAPSHOTS
 
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._error: Optional[BaseException] = None
+        self._snapshot = snapshot
+        self._pending_saves_slots = (
+            threading.BoundedSemaphore(max_pending_saves) if max_pending_saves is not None else None
+        )
+        self._lock = threading.Lock()
+        self._num_pending_saves = 0
+        # the sets of staging buffers which aren't used by a pending save
+        self._staging_buffers: List[List[Tensor]] = []
+        self.last_snapshot_duration: Optional[float] = None
+        self.last_save_duration: Optional[float] = None
 
-    def save_checkpoint(self, *args: Any, **kwargs: Any) -> None:
+    @property
+    def num_pending_saves(self) -> int:
+        """The number of saves submitted and not completed yet."""
+        return self._num_pending_saves
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
         """Uses the ``ThreadPoolExecutor`` to save the checkpoints using the base ``checkpoint_io``."""
+        # if an error was raised by a previous save
+        self._raise_error()
 
-        def _save_checkpoint(*args: Any, **kwargs: Any) -> None:
+        if self._pending_saves_slots is not None:
+            # blocks the training until a slot is released by a completed save
+            self._pending_saves_slots.acquire()
+        staging_buffers = None
+        copy_done = None
+        if self._snapshot:
+            start = time.perf_counter()
+            with self._lock:
+                staging_buffers = self._staging_buffers.pop() if self._staging_buffers else []
             try:
+                checkpoint, copy_done = _snapshot(checkpoint, staging_buffers)
+            except BaseException:
+                with self._lock:
+                    self._staging_buffers.append(staging_buffers)
+                if self._pending_saves_slots is not None:
+                    self._pending_saves_slots.release()
+                raise
+            self.last_snapshot_duration = time.perf_counter() - start
+        with self._lock:
+            self._num_pending_saves += 1
+        log.debug(f"Submitted the save of {path}, {self._num_pending_saves} pending saves.")
+
+        def _save_checkpoint() -> None:
+            start = time.perf_counter()
+            try:
+                if copy_done is not None:
+                    copy_done.synchronize()
                 assert self.checkpoint_io is not None
-                self.checkpoint_io.save_checkpoint(*args, **kwargs)
+                self.checkpoint_io.save_checkpoint(checkpoint, path, storage_options=storage_options)
             except BaseException as e:
+                log.error(f"The asynchronous save of {path} failed: {e!r}")
                 self._error = e
+            finally:
+                self.last_save_duration = time.perf_counter() - start
+                with self._lock:
+                    self._num_pending_saves -= 1
+                    if staging_buffers is not None:
+                        self._staging_buffers.append(staging_buffers)
+                if self._pending_saves_slots is not None:
+                    self._pending_saves_slots.release()
+                log.debug(f"Saved {path} in {self.last_save_duration:.3f} seconds.")
 
-        self._executor.submit(_save_checkpoint, *args, **kwargs)
-
-        # if an error was raised between the previous time `save_checkpoint`` was called and now,
-        # because `executor.submit` is not blocking
-        if self._error:
-            raise self._error
+        self._executor.submit(_save_checkpoint)
 
     def teardown(self) -> None:
         """This method is called to close the threads."""
         self._executor.shutdown(wait=True)
+        self._staging_buffers = []
 
         # if an error was raised anytime in any of the `executor.submit` calls
+        self._raise_error()
+
+    def _raise_error(self) -> None:
         if self._error:
             raise self._error
+
+
+def _snapshot(checkpoint: Dict[str, Any], staging_buffers: List[Tensor]) -> Any:
+    """Copies the tensors of the checkpoint to the staging buffers, which are allocated or replaced as needed.
+
+    The buffers are matched with the tensors in the order the checkpoint is traversed, which stays the same between the
+    saves of a training. Returns the copied checkpoint and, when tensors are copied from GPU, a CUDA event to
+    synchronize with before reading them.
+    """
+    index = 0
+    copy_from_cuda = False
+
+    def _copy(tensor: Tensor) -> Tensor:
+        nonlocal index, copy_from_cuda
+        if tensor.layout != torch.strided or tensor.is_quantized:
+            return tensor.detach().cpu().clone()
+        pin_memory = tensor.is_cuda
+        if index == len(staging_buffers):
+            staging_buffers.append(_empty_buffer(tensor, pin_memory))
+        buffer = staging_buffers[index]
+        if buffer.shape != tensor.shape or buffer.dtype != tensor.dtype or buffer.is_pinned() != pin_memory:
+            buffer = staging_buffers[index] = _empty_buffer(tensor, pin_memory)
+        index += 1
+        copy_from_cuda |= tensor.is_cuda
+        return buffer.copy_(tensor.detach(), non_blocking=tensor.is_cuda)
+
+    # the state dicts keep their `_metadata`, which `load_state_dict` reads
+    checkpoint = _map_collection(checkpoint, Tensor, _copy)
+    # the buffers of the tensors no longer in the checkpoint are released
+    del staging_buffers[index:]
+    if not copy_from_cuda:
+        return checkpoint, None
+    copy_done = torch.cuda.Event()
+    copy_done.record()
+    return checkpoint, copy_done
+
+
+def _empty_buffer(tensor: Tensor, pin_memory: bool) -> Tensor:
+    return torch.empty(tensor.shape, dtype=tensor.dtype, device="cpu", pin_memory=pin_memory)
@@ -0,0 +1,235 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+import torch
+from torch import Tensor
+
+from lightning.fabric.plugins import CheckpointIO
+from lightning.fabric.utilities.cloud_io import get_filesystem
+from lightning.fabric.utilities.tensor_directory import _map_collection
+from lightning.fabric.utilities.types import _PATH
+from lightning.pytorch.plugins.io.wrapper import _WrappingCheckpointIO
+
+log = logging.getLogger(__name__)
+
+_DELTA_KEY = "delta_checkpoint"
+_BASE_PREFIX = ".delta-base-"
+_INDEX_NAME = ".delta-index.json"
+
+
+class _BaseTensor(NamedTuple):
+    """Reference to a tensor stored in the base of a delta checkpoint."""
+
+    digest: str
+
+
+@dataclass
+class _Base:
+    """The base which the next checkpoints saved in a directory reference."""
+
+    path: str
+    digests: Set[str]
+    num_saves: int = 0
+
+
+class DeltaCheckpointIO(_WrappingCheckpointIO):
+    """``DeltaCheckpointIO`` saves the tensors of the checkpoints only when they changed since the last consolidation.
+
+    The tensors are stored in a base file, named ``.delta-base-*.pt`` and saved in the directory of the checkpoints,
+    and are identified by the hash of their content. The checkpoints reference the tensors of the base which they
+    contain, so that only the tensors which changed since the base was saved are written again, for example the ones of
+    the head of a model whose backbone is frozen. Every ``consolidate_every_n_saves`` saves in a directory, a new base
+    is saved with all the tensors of the checkpoint. The bases are removed once the checkpoints referencing them are
+    removed, including the bases of the checkpoints saved by a previous run in the same directory, which are found
+    through the index of the checkpoints referencing each base, saved next to them as ``.delta-index.json``.
+
+    The checkpoints are restored transparently by the ``Trainer`` and by ``LightningModule.load_from_checkpoint``,
+    as long as their base is next to them.
+
+    .. warning::
+
+        This is currently an experimental plugin/feature and API changes are to be expected.
+
+    Args:
+        checkpoint_io: A checkpoint IO plugin that is used as the basis to save and load the files.
+        consolidate_every_n_saves: The number of checkpoints saved against a base before saving a new one.
+    """
+
+    def __init__(self, checkpoint_io: Optional["CheckpointIO"] = None, consolidate_every_n_saves: int = 10) -> None:
+        super().__init__(checkpoint_io)
+        if consolidate_every_n_saves < 1:
+            raise ValueError(
+                f"`consolidate_every_n_saves` must be a positive integer, got {consolidate_every_n_saves}."
+            )
+        self.consolidate_every_n_saves = consolidate_every_n_saves
+        # the current base of each directory, as the checkpoints reference a base in their own directory
+        self._bases: Dict[str, _Base] = {}
+        # the checkpoints which reference each base, including the ones found in the directories when first used
+        self._checkpoints_by_base: Dict[str, Set[str]] = {}
+        self._scanned_dirs: Set[str] = set()
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        """Saves the checkpoint with references to the tensors of the base, saving a new base when needed."""
+        assert self.checkpoint_io is not None
+        path = str(path)
+        dirpath = os.path.dirname(path)
+        self._scan_directory(dirpath)
+        tensors: Dict[str, Tensor] = {}
+        digests: Dict[int, str] = {}
+        _map_collection(checkpoint, Tensor, lambda tensor: _add_tensor(tensors, digests, tensor))
+
+        base = self._bases.get(dirpath)
+        if base is None or base.num_saves >= self.consolidate_every_n_saves:
+            base_path = os.path.join(dirpath, f"{_BASE_PREFIX}{uuid.uuid4().hex}.pt")
+            self.checkpoint_io.save_checkpoint({"tensors": tensors}, base_path, storage_options=storage_options)
+            base = self._bases[dirpath] = _Base(base_path, set(tensors))
+            self._checkpoints_by_base[base_path] = set()
+            log.debug(f"Saved the base {base_path} with {len(tensors)} tensors.")
+
+        def _to_reference(tensor: Tensor) -> Any:
+            digest = digests.get(id(tensor))
+            return _BaseTensor(digest) if digest in base.digests else tensor
+
+        # the tensors which changed since the base was saved are saved in the checkpoint
+        delta = _map_collection(checkpoint, Tensor, _to_reference)
+        delta[_DELTA_KEY] = {"base": os.path.basename(base.path)}
+        # the reference is indexed before the checkpoint is saved, so that its base is never removed by a later run
+        self._checkpoints_by_base[base.path].add(path)
+        self._save_index(dirpath)
+        self.checkpoint_io.save_checkpoint(delta, path, storage_options=storage_options)
+        base.num_saves += 1
+
+        # a checkpoint saved again at the same path no longer references its previous base
+        self._forget_checkpoint(path, keep_base=base.path)
+        self._save_index(dirpath)
+
+    def load_checkpoint(self, path: _PATH, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Loads the checkpoint and replaces its references with the tensors of its base."""
+        assert self.checkpoint_io is not None
+        checkpoint = self.checkpoint_io.load_checkpoint(path, *args, **kwargs)
+        return _resolve_delta_checkpoint(
+            checkpoint, path, lambda base_path: self.checkpoint_io.load_checkpoint(base_path, *args, **kwargs)
+        )
+
+    def remove_checkpoint(self, path: _PATH) -> None:
+        """Removes the checkpoint, along with its base when no other checkpoint references it."""
+        assert self.checkpoint_io is not None
+        path = str(path)
+        self._scan_directory(os.path.dirname(path))
+        self.checkpoint_io.remove_checkpoint(path)
+        self._forget_checkpoint(path)
+        self._save_index(os.path.dirname(path))
+
+    def _forget_checkpoint(self, path: str, keep_base: Optional[str] = None) -> None:
+        current_bases = {base.path for base in self._bases.values()}
+        for base_path, checkpoints in list(self._checkpoints_by_base.items()):
+            if base_path == keep_base:
+                continue
+            checkpoints.discard(path)
+            if not checkpoints and base_path not in current_bases:
+                assert self.checkpoint_io is not None
+                self.checkpoint_io.remove_checkpoint(base_path)
+                del self._checkpoints_by_base[base_path]
+                log.debug(f"Removed the base {base_path}, which isn't referenced anymore.")
+
+    def _save_index(self, dirpath: str) -> None:
+        """Saves the names of the checkpoints which reference each base of the directory next to them."""
+        index = {
+            os.path.basename(base_path): sorted(os.path.basename(path) for path in checkpoints)
+            for base_path, checkpoints in self._checkpoints_by_base.items()
+            if os.path.dirname(base_path) == dirpath
+        }
+        fs = get_filesystem(dirpath)
+        index_path = os.path.join(dirpath, _INDEX_NAME)
+        if not index:
+            if fs.exists(index_path):
+                fs.rm(index_path)
+            return
+        with fs.open(index_path, "w") as f:
+            json.dump(index, f)
+
+    def _scan_directory(self, dirpath: str) -> None:
+        """Finds the bases left in the directory by a previous run and the checkpoints which reference them, so that
+        they are removed along with these checkpoints, or right away when no checkpoint references them."""
+        if dirpath in self._scanned_dirs:
+            return
+        self._scanned_dirs.add(dirpath)
+        fs = get_filesystem(dirpath)
+        if not fs.isdir(dirpath):
+            return
+        assert self.checkpoint_io is not None
+        filenames = {os.path.basename(f.rstrip("/")) for f in fs.ls(dirpath, detail=False)}
+        bases = {f for f in filenames if f.startswith(_BASE_PREFIX)}
+        if not bases:
+            return
+        index: Dict[str, List[str]] = {}
+        if _INDEX_NAME in filenames:
+            with fs.open(os.path.join(dirpath, _INDEX_NAME), "r") as f:
+                index = json.load(f)
+        for base in bases:
+            base_path = os.path.join(dirpath, base)
+            # the checkpoints removed without this plugin don't reference their base anymore
+            checkpoints = {os.path.join(dirpath, f) for f in index.get(base, []) if f in filenames}
+            if checkpoints:
+                self._checkpoints_by_base.setdefault(base_path, set()).update(checkpoints)
+            elif base_path not in self._checkpoints_by_base:
+                self.checkpoint_io.remove_checkpoint(base_path)
+                log.debug(f"Removed the base {base_path} left by a previous run, which isn't referenced anymore.")
+        self._save_index(dirpath)
+
+
+def _resolve_delta_checkpoint(
+    checkpoint: Dict[str, Any], path: _PATH, load: Callable[[str], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Replaces the references of a checkpoint saved by :class:`DeltaCheckpointIO` with the tensors of its base,
+    loaded with the given function.
+
+    Other checkpoints are returned as they are.
+    """
+    if _DELTA_KEY not in checkpoint:
+        return checkpoint
+    base_path = os.path.join(os.path.dirname(str(path)), checkpoint.pop(_DELTA_KEY)["base"])
+    base_tensors = load(base_path)["tensors"]
+    resolved: Set[str] = set()
+
+    def _resolve(reference: _BaseTensor) -> Tensor:
+        tensor = base_tensors[reference.digest]
+        if reference.digest in resolved:
+            # the tensors with the same content are restored as distinct tensors, as they were saved
+            return tensor.clone()
+        resolved.add(reference.digest)
+        return tensor
+
+    return _map_collection(checkpoint, _BaseTensor, _resolve)
+
+
+def _add_tensor(tensors: Dict[str, Tensor], digests: Dict[int, str], tensor: Tensor) -> Tensor:
+    if tensor.layout == torch.strided and not tensor.is_quantized and not tensor.is_meta:
+        digests[id(tensor)] = digest = _digest(tensor)
+        tensors.setdefault(digest, tensor)
+    return tensor
+
+
+def _digest(tensor: Tensor) -> str:
+    data = tensor.detach().cpu().contiguous().reshape(-1).view(torch.uint8)
+    digest = hashlib.blake2b(memoryview(data.numpy()), digest_size=16)
+    digest.update(f"{tensor.dtype}{tuple(tensor.shape)}{tensor.requires_grad}".encode())
+    return digest.hexdigest()
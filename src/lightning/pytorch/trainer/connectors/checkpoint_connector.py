@@ -26,6 +26,7 @@ from lightning.fabric.plugins.environments.slurm import SLURMEnvironment
 from lightning.fabric.utilities.cloud_io import get_filesystem
 from lightning.fabric.utilities.types import _PATH
 from lightning.pytorch.callbacks import ModelCheckpoint
+from lightning.pytorch.plugins.io.delta_plugin import _resolve_delta_checkpoint
 from lightning.pytorch.plugins.precision import MixedPrecisionPlugin
 from lightning.pytorch.trainer import call
 from lightning.pytorch.trainer.states import TrainerFn
@@ -80,6 +81,10 @@ class CheckpointConnector:
         rank_zero_info(f"Restoring states from the checkpoint path at {checkpoint_path}")
         with pl_legacy_patch():
             loaded_checkpoint = self.trainer.strategy.load_checkpoint(checkpoint_path)
+            # when saved by a `DeltaCheckpointIO` which isn't used to load it
+            loaded_checkpoint = _resolve_delta_checkpoint(
+                loaded_checkpoint, checkpoint_path, self.trainer.strategy.load_checkpoint
+            )
         self._loaded_checkpoint = _pl_migrate_checkpoint(loaded_checkpoint, checkpoint_path)
 
     def _select_ckpt_path(
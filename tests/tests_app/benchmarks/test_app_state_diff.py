@@ -0,0 +1,73 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+
+import pytest
+
+from lightning.app import LightningApp, LightningFlow, LightningWork
+from lightning.app.core.queues import MultiProcessQueue
+from lightning.app.structures import List
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+class _Work(LightningWork):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.metrics = {"loss": 0.0}
+
+    def run(self):
+        pass
+
+
+class _Flow(LightningFlow):
+    def __init__(self, num_works: int):
+        super().__init__()
+        self.ws = List(*[_Work() for _ in range(num_works)])
+
+    def run(self):
+        pass
+
+
+def _measure(app: LightningApp, num_runs: int, num_changed_works: int) -> float:
+    start = time.perf_counter()
+    for i in range(num_runs):
+        for work in app.root.ws[:num_changed_works]:
+            work.counter = i
+        app.maybe_apply_changes()
+    return (time.perf_counter() - start) / num_runs
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+@pytest.mark.parametrize("num_changed_works", [0, 1, 10])
+def test_maybe_apply_changes_1000_works(num_changed_works, num_runs: int = 10):
+    """Compares diffing the whole state against only diffing the components which changed in an app with 1000
+    works."""
+    app = LightningApp(_Flow(num_works=1000))
+    app.delta_queue = MultiProcessQueue("delta", 0)
+    app.maybe_apply_changes()
+
+    incremental_time = _measure(app, num_runs, num_changed_works)
+
+    # never trust the snapshots so that every call falls back to diffing the whole state
+    app._find_changed_components = lambda: None
+    full_time = _measure(app, num_runs, num_changed_works)
+
+    print(
+        f"num_changed_works={num_changed_works}: full diff {full_time * 1000:.2f} ms,"
+        f" incremental diff {incremental_time * 1000:.2f} ms"
+    )
+    assert incremental_time < full_time
@@ -0,0 +1,60 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import statistics
+import threading
+import time
+
+import pytest
+
+from lightning.app.core import queues
+from lightning.app.core.queues import QueuingSystem
+from lightning.app.testing.http_queue_server import HTTPQueueServer
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+def _measure(long_poll: bool, num_items: int, interval: float, monkeypatch):
+    with HTTPQueueServer(long_poll=long_poll) as server:
+        monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+        consumer_queue = QueuingSystem.HTTP.get_queue(queue_name="benchmark_queue")
+        producer_queue = QueuingSystem.HTTP.get_queue(queue_name="benchmark_queue")
+
+        def produce():
+            for _ in range(num_items):
+                time.sleep(interval)
+                producer_queue.put(time.perf_counter())
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        latencies = [time.perf_counter() - consumer_queue.get(timeout=10) for _ in range(num_items)]
+        producer.join()
+        # the producer sends one request per item
+        return server.num_requests - num_items, latencies
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+def test_http_queue_long_poll(monkeypatch, num_items: int = 20, interval: float = 0.2):
+    """Compares the number of requests and the delivery latency of a consumer waiting for items sent every
+    ``interval`` seconds, with and without long polling."""
+    polling_requests, polling_latencies = _measure(False, num_items, interval, monkeypatch)
+    long_poll_requests, long_poll_latencies = _measure(True, num_items, interval, monkeypatch)
+
+    print(
+        f"polling: {polling_requests} requests, median latency {statistics.median(polling_latencies) * 1000:.1f} ms\n"
+        f"long polling: {long_poll_requests} requests,"
+        f" median latency {statistics.median(long_poll_latencies) * 1000:.1f} ms"
+    )
+    assert long_poll_requests < polling_requests
+    assert statistics.median(long_poll_latencies) < statistics.median(polling_latencies)
@@ -0,0 +1,63 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pytest
+
+from lightning.app.core.queues import QueuingSystem
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+def _consume(item_queue, result_queue, num_items):
+    for _ in range(num_items):
+        item_queue.get()
+    result_queue.put(time.perf_counter())
+
+
+def _throughput(queuing_system: QueuingSystem, item: np.ndarray, num_items: int) -> float:
+    """Returns the number of bytes per second sent by this process to another one through a queue."""
+    item_queue = queuing_system.get_queue("benchmark_queue")
+    result_queue = queuing_system.get_queue("benchmark_result_queue")
+    consumer = multiprocessing.get_context("spawn").Process(target=_consume, args=(item_queue, result_queue, num_items))
+    consumer.start()
+    # warm up the consumer, which imports lightning
+    item_queue.put(np.zeros(1))
+    item_queue.put(np.zeros(1))
+    time.sleep(5)
+
+    start = time.perf_counter()
+    for _ in range(num_items - 2):
+        item_queue.put(item)
+    end = result_queue.get()
+    consumer.join()
+    return (num_items - 2) * item.nbytes / (end - start)
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+@pytest.mark.parametrize(("item_size", "num_items"), [(1024, 20_000), (100 * 1024**2, 20)])
+def test_multiprocess_queues_throughput(item_size, num_items):
+    """Compares the throughput of the pipe and the shared memory queues with small and large items."""
+    item = np.random.randint(0, 255, size=item_size, dtype=np.uint8)
+    pipe = _throughput(QueuingSystem.MULTIPROCESS, item, num_items)
+    shared_memory = _throughput(QueuingSystem.SHARED_MEMORY, item, num_items)
+
+    print(
+        f"{item_size} bytes items, pipe: {pipe / 1024**2:.0f} MB/s, shared memory: {shared_memory / 1024**2:.0f} MB/s"
+    )
+    if item_size > 1024**2:
+        assert shared_memory > pipe
@@ -0,0 +1,49 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from lightning.app.components.serve.wire_format import _decode_batch, _encode_batch
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+def _measure(fn, num_runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_runs):
+        fn()
+    return (time.perf_counter() - start) / num_runs
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+@pytest.mark.parametrize("batch_size", [1, 8])
+def test_wire_format_image_batch(batch_size, num_runs: int = 20):
+    """Compares the JSON and binary wire formats on batches of 1 MB base64 encoded images."""
+    image = base64.b64encode(os.urandom(1024 * 1024)).decode("ascii")
+    batch = {"inputs": [{"image": image} for _ in range(batch_size)]}
+
+    json_time = _measure(lambda: json.loads(json.dumps(batch).encode("utf-8")), num_runs)
+    binary_time = _measure(lambda: _decode_batch(_encode_batch(batch)), num_runs)
+    json_size = len(json.dumps(batch).encode("utf-8"))
+    binary_size = len(_encode_batch(batch))
+
+    print(
+        f"batch_size={batch_size}: json {json_time * 1000:.2f} ms ({json_size} bytes),"
+        f" binary {binary_time * 1000:.2f} ms ({binary_size} bytes)"
+    )
+    assert binary_time < json_time
@@ -0,0 +1,58 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+import time
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+
+from lightning.app.storage.transfer import _ranged_transfer, TransferProgress
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+class _ThrottledFileSystem(LocalFileSystem):
+    """Simulates an object store where each request has a latency and each connection a limited bandwidth."""
+
+    latency = 0.02
+    bandwidth = 200 * 1024 * 1024
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        data = super().cat_file(path, start=start, end=end, **kwargs)
+        time.sleep(self.latency + len(data) / self.bandwidth)
+        return data
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+def test_ranged_transfer_throughput(tmpdir, size: int = 2 * 1024**3, chunk_size: int = 16 * 1024 * 1024):
+    """Compares the throughput of transferring a multi-GB file with one and several concurrent range requests."""
+    source = pathlib.Path(tmpdir) / "source.bin"
+    with open(source, "wb") as f:
+        for _ in range(size // chunk_size):
+            f.write(os.urandom(chunk_size))
+    fs = _ThrottledFileSystem(skip_instance_cache=True)
+
+    throughputs = {}
+    for num_workers in (1, 8):
+        destination = pathlib.Path(tmpdir) / f"destination_{num_workers}.bin"
+        progress = TransferProgress()
+        progress._start(size)
+        _ranged_transfer(fs, source, destination, size, progress, chunk_size=chunk_size, num_workers=num_workers)
+        assert destination.stat().st_size == size
+        throughputs[num_workers] = progress.throughput
+        destination.unlink()
+
+    print(", ".join(f"{n} workers: {t / 1024**2:.0f} MB/s" for n, t in throughputs.items()))
+    assert throughputs[8] > 3 * throughputs[1]
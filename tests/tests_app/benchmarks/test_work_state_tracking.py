@@ -0,0 +1,79 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+from copy import deepcopy
+
+import pytest
+from deepdiff import DeepDiff
+
+from lightning.app import LightningWork
+from lightning.app.testing.helpers import _MockQueue
+from lightning.app.utilities.proxies import LightningWorkSetAttrProxy, WorkStateObserver
+
+_RUN_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+
+
+class _Work(LightningWork):
+    def __init__(self, num_rows: int):
+        super().__init__()
+        self.counter = 0
+        self.metrics = {"loss": 0.0}
+        self.rows = [{"step": i, "loss": 0.0} for i in range(num_rows)]
+
+    def run(self):
+        pass
+
+
+def _measure(num_rows: int, num_runs: int):
+    work = _Work(num_rows)
+    delta_queue = _MockQueue()
+    observer = WorkStateObserver(work, delta_queue)
+    work._setattr_replacement = LightningWorkSetAttrProxy(
+        work=work, work_name="root.work", delta_queue=delta_queue, state_observer=observer
+    )
+    observer.run_once()
+
+    start = time.perf_counter()
+    for i in range(num_runs):
+        work.counter = i
+    setattr_time = (time.perf_counter() - start) / num_runs
+
+    start = time.perf_counter()
+    for i in range(num_runs):
+        work.metrics["loss"] = float(i)
+        observer.run_once()
+    observer_time = (time.perf_counter() - start) / num_runs
+
+    # what each check used to cost: copying and diffing the whole state
+    start = time.perf_counter()
+    DeepDiff(deepcopy(work.state), work.state, verbose_level=2)
+    full_diff_time = time.perf_counter() - start
+    return setattr_time, observer_time, full_diff_time
+
+
+@pytest.mark.skipif(not _RUN_BENCHMARKS, reason="Only run during Benchmarking")
+def test_work_state_tracking_cost_independent_of_state_size(num_runs: int = 100):
+    """Checks that setting an attribute doesn't get slower with the size of the rest of the state of a work, and that
+    observing an in-place update is much cheaper than diffing the whole state."""
+    small_setattr, small_observer, _ = _measure(num_rows=num_runs, num_runs=num_runs)
+    large_setattr, large_observer, large_full_diff = _measure(num_rows=100_000, num_runs=num_runs)
+
+    print(
+        f"setattr: {small_setattr * 1e6:.1f} us with {num_runs} rows, {large_setattr * 1e6:.1f} us with 100000 rows\n"
+        f"observer: {small_observer * 1e3:.2f} ms with {num_runs} rows, {large_observer * 1e3:.2f} ms with 100000 rows,"
+        f" {large_full_diff * 1e3:.2f} ms to diff the whole state"
+    )
+    assert large_setattr < 5 * small_setattr
+    assert large_observer < large_full_diff / 10
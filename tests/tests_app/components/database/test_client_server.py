@@ -1,6 +1,8 @@
+import asyncio
 import os
 import sys
 import tempfile
+import threading
 import time
 import traceback
 from pathlib import Path
@@ -9,12 +11,25 @@ from typing import List, Optional
 from uuid import uuid4
 
 import pytest
+import uvicorn
+from fastapi import FastAPI
 
 from lightning.app import LightningApp, LightningFlow, LightningWork
-from lightning.app.components.database import Database, DatabaseClient
-from lightning.app.components.database.utilities import _GeneralModel, _pydantic_column_type
+from lightning.app.components.database import AsyncDatabaseClient, Database, DatabaseClient
+from lightning.app.components.database.utilities import (
+    _create_database,
+    _DeleteMany,
+    _GeneralModel,
+    _InsertMany,
+    _pydantic_column_type,
+    _Select,
+    _SelectAll,
+    _SelectStream,
+    _UpdateMany,
+)
 from lightning.app.runners import MultiProcessRuntime
-from lightning.app.utilities.imports import _is_sqlmodel_available
+from lightning.app.utilities.imports import _is_aiohttp_available, _is_sqlmodel_available
+from lightning.app.utilities.network import find_free_network_port
 
 if _is_sqlmodel_available():
     from sqlalchemy import Column
@@ -31,6 +46,13 @@ if _is_sqlmodel_available():
         name: str
         secrets: List[Secret] = Field(..., sa_column=Column(_pydantic_column_type(List[Secret])))
 
+    class Trial(SQLModel, table=True):
+        __table_args__ = {"extend_existing": True}
+
+        id: Optional[int] = Field(default=None, primary_key=True)
+        sweep: str
+        score: float
+
 
 class Work(LightningWork):
     def __init__(self):
@@ -121,7 +143,8 @@ def test_client_server():
 
 @pytest.mark.skipif(sys.platform == "win32", reason="currently not supported for windows.")
 @pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
-def test_work_database_restart():
+@pytest.mark.parametrize("incremental_store", [False, True])
+def test_work_database_restart(incremental_store):
 
     id = str(uuid4()).split("-")[0]
 
@@ -129,7 +152,7 @@ def test_work_database_restart():
         def __init__(self, db_root=".", restart=False):
             super().__init__()
             self._db_filename = os.path.join(db_root, id)
-            self.db = Database(db_filename=self._db_filename, models=[TestConfig])
+            self.db = Database(db_filename=self._db_filename, models=[TestConfig], incremental_store=incremental_store)
             self._client = None
             self.restart = restart
 
@@ -204,3 +227,74 @@ def test_work_database_periodic_store():
             MultiProcessRuntime(app).dispatch()
     except Exception:
         print(traceback.print_exc())
+
+
+@pytest.fixture()
+def database_url(tmpdir):
+    """Serves the bulk and query endpoints of a database in a thread."""
+    _create_database(str(tmpdir / "database.db"), [Trial])
+    models = {"Trial": Trial}
+    app = FastAPI()
+    app.post("/select_all/")(_SelectAll(models, "token"))
+    app.post("/select/")(_Select(models, "token"))
+    app.post("/select_stream/")(_SelectStream(models, "token"))
+    app.post("/insert_many/")(_InsertMany(models, "token"))
+    app.post("/update_many/")(_UpdateMany(models, "token"))
+    app.post("/delete_many/")(_DeleteMany(models, "token"))
+
+    port = find_free_network_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+def test_client_bulk_and_queries(database_url):
+    client = DatabaseClient(database_url, "token", model=Trial)
+    client.insert_many([Trial(sweep="a" if i % 2 else "b", score=i / 10) for i in range(25)], batch_size=10)
+    assert len(client.select_all()) == 25
+
+    rows = client.select(where={"sweep": "a"}, order_by="-score", limit=3, offset=1)
+    assert [row.score for row in rows] == [2.1, 1.9, 1.7]
+    assert [row.id for row in client.select(where={"id": [1, 2, 30]}, order_by="id")] == [1, 2]
+    with pytest.raises(AssertionError, match="doesn't have a field named `name`"):
+        client.select(where={"name": "a"})
+
+    streamed = list(client.select_iter(where={"sweep": "b"}, order_by=["sweep", "-id"]))
+    assert [row.id for row in streamed] == list(range(25, 0, -2))
+    assert all(isinstance(row, Trial) for row in streamed)
+
+    for row in streamed:
+        row.score = -1.0
+    client.update_many(streamed, batch_size=5)
+    assert len(client.select(where={"score": -1.0})) == 13
+
+    client.delete_many(streamed)
+    assert len(client.select_all()) == 12
+    assert not client.select(where={"sweep": "b"})
+
+    unauthorized = DatabaseClient(database_url, "wrong", model=Trial)
+    with pytest.raises(AssertionError, match="Unauthorized"):
+        unauthorized.select()
+
+
+@pytest.mark.skipif(not _is_sqlmodel_available(), reason="sqlmodel is required for this test.")
+@pytest.mark.skipif(not _is_aiohttp_available(), reason="aiohttp is required for this test.")
+def test_async_client(database_url):
+    async def run():
+        async with AsyncDatabaseClient(database_url, "token", model=Trial, max_connections=4) as client:
+            await asyncio.gather(*(client.insert_many([Trial(sweep=str(i), score=i)]) for i in range(20)))
+            assert len(await client.select_all()) == 20
+            best = await client.select(order_by="-score", limit=2)
+            assert [row.score for row in best] == [19, 18]
+            streamed = [row async for row in client.select_iter(where={"sweep": ["1", "2"]}, order_by="score")]
+            assert [row.sweep for row in streamed] == ["1", "2"]
+            await client.delete_many(streamed)
+            assert len(await client.select_all()) == 18
+
+    asyncio.run(run())
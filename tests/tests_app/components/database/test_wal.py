@@ -0,0 +1,110 @@
+import os
+import sqlite3
+
+import pytest
+
+from lightning.app.components.database.wal import _IncrementalStore
+from lightning.app.storage import Drive
+
+
+def _connect(db_filename):
+    connection = sqlite3.connect(db_filename, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA wal_autocheckpoint=0")
+    return connection
+
+
+def _stored_files():
+    drive = Drive("lit://database", component_name="db")
+    return sorted(os.path.basename(f) for f in drive.list(component_name="db"))
+
+
+def _restored_rows(db_filename):
+    assert _IncrementalStore.restore(db_filename, "db")
+    connection = sqlite3.connect(db_filename)
+    rows = connection.execute("SELECT value FROM items ORDER BY id").fetchall()
+    connection.close()
+    return [value for (value,) in rows]
+
+
+@pytest.fixture()
+def shared_storage(tmpdir, monkeypatch):
+    monkeypatch.setenv("LIGHTNING_STORAGE_PATH", str(tmpdir / ".shared"))
+
+
+def test_incremental_store(shared_storage, tmpdir):
+    db_filename = str(tmpdir / "data" / "database.db")
+    os.makedirs(os.path.dirname(db_filename))
+    connection = _connect(db_filename)
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+    connection.execute("INSERT INTO items (value) VALUES ('a')")
+
+    store = _IncrementalStore(db_filename, "db")
+    store.store()
+    assert _stored_files() == ["database.db.0.base"]
+
+    # only the frames committed since the previous store are stored
+    connection.execute("INSERT INTO items (value) VALUES ('b')")
+    store.store()
+    connection.execute("INSERT INTO items (value) VALUES ('c')")
+    connection.execute("UPDATE items SET value = 'A' WHERE value = 'a'")
+    store.store()
+    assert _stored_files() == ["database.db.0.base", "database.db.0.wal.0", "database.db.0.wal.1"]
+    wal_size = os.path.getsize(store.wal_filename)
+    assert store._stored_bytes == wal_size
+
+    # the transaction in progress isn't stored
+    connection.execute("BEGIN")
+    connection.execute("INSERT INTO items (value) VALUES ('d')")
+    store.store()
+    assert len(_stored_files()) == 3
+    connection.execute("COMMIT")
+    store.store()
+    assert len(_stored_files()) == 4
+
+    assert _restored_rows(str(tmpdir / "restored" / "database.db")) == ["A", "b", "c", "d"]
+    connection.close()
+    store.close()
+
+
+def test_incremental_store_compaction(shared_storage, tmpdir):
+    db_filename = str(tmpdir / "database.db")
+    connection = _connect(db_filename)
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+
+    store = _IncrementalStore(db_filename, "db", compaction_size=1)
+    store.store()
+    connection.execute("INSERT INTO items (value) VALUES ('a')")
+    store.store()
+    assert _stored_files() == ["database.db.0.base", "database.db.0.wal.0"]
+
+    # the log is moved into a new base and the previous generation removed
+    store.store()
+    assert _stored_files() == ["database.db.1.base"]
+    assert os.path.getsize(store.wal_filename) == 0
+
+    # the next frames are stored in the new generation
+    connection.execute("INSERT INTO items (value) VALUES ('b')")
+    store.store()
+    assert _stored_files() == ["database.db.1.base", "database.db.1.wal.0"]
+    assert _restored_rows(str(tmpdir / "restored" / "database.db")) == ["a", "b"]
+
+    # the log restarted by another connection is detected
+    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    connection.execute("INSERT INTO items (value) VALUES ('c')")
+    store.compaction_size = 1024**3
+    store.store()
+    assert _stored_files() == ["database.db.2.base"]
+    assert _restored_rows(str(tmpdir / "restored" / "database.db")) == ["a", "b", "c"]
+    connection.close()
+    store.close()
+
+    # a new store continues after the generations of the previous one
+    store = _IncrementalStore(db_filename, "db")
+    store.store()
+    assert _stored_files() == ["database.db.3.base"]
+    store.close()
+
+
+def test_incremental_store_restore_without_generations(shared_storage, tmpdir):
+    assert not _IncrementalStore.restore(str(tmpdir / "database.db"), "db")
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import time
 import uuid
 from unittest import mock
@@ -8,7 +10,8 @@ from fastapi import HTTPException
 
 from lightning.app import CloudCompute, LightningWork
 from lightning.app.components import AutoScaler, ColdStartProxy, Text
-from lightning.app.components.serve.auto_scaler import _LoadBalancer
+from lightning.app.components.serve.auto_scaler import _BatchRequestModel, _LoadBalancer
+from lightning.app.components.serve.scheduling import ReplicaStatus
 
 
 class EmptyWork(LightningWork):
@@ -117,6 +120,15 @@ def test_create_work_cloud_compute_cloned():
     assert auto_scaler._work_kwargs["cloud_compute"] is not cloud_compute
 
 
+def test_work_args_are_passed_positionally():
+    """Test that the arguments after ``cold_start_proxy`` are forwarded to the works."""
+    auto_scaler = AutoScaler(
+        EmptyWork, 1, 4, 10, 10, 8, 1, "api/predict", dict, dict, None, "arg", wire_format="binary"
+    )
+    assert auto_scaler._work_args == ("arg",)
+    assert auto_scaler.load_balancer._wire_format == "binary"
+
+
 fastapi_mock = mock.MagicMock()
 mocked_fastapi_creater = mock.MagicMock(return_value=fastapi_mock)
 
@@ -190,8 +202,6 @@ class TestLoadBalancerProcessRequest:
             endpoint="/predict",
         )
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
         with pytest.raises(HTTPException):
             await load_balancer.process_request("test", req_id)
 
@@ -217,7 +227,257 @@ class TestLoadBalancerProcessRequest:
         )
         load_balancer.servers.append(mock.MagicMock())
         req_id = uuid.uuid4().hex
-        # populating the responses so the while loop exists
-        load_balancer._responses = {req_id: "Dummy"}
-        await load_balancer.process_request("test", req_id)
-        assert load_balancer._batch == [(req_id, "test")]
+        task = asyncio.create_task(load_balancer.process_request("test", req_id))
+        await asyncio.sleep(0)
+        assert load_balancer._request_queue.get_nowait() == (req_id, "test")
+
+        # resolving the response ends the request without any polling
+        load_balancer._set_response(req_id, "Dummy")
+        assert await task == "Dummy"
+        assert load_balancer._responses == {}
+
+    @pytest.mark.asyncio
+    async def test_worker_error_is_raised(self):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict")
+        load_balancer.servers.append(mock.MagicMock())
+        req_id = uuid.uuid4().hex
+        task = asyncio.create_task(load_balancer.process_request("test", req_id))
+        await asyncio.sleep(0)
+        load_balancer._set_response(req_id, asyncio.TimeoutError())
+        with pytest.raises(HTTPException, match="Request timed out"):
+            await task
+
+
+class TestLoadBalancerBatching:
+    @pytest.mark.asyncio
+    async def test_batch_closes_at_max_batch_size(self):
+        load_balancer = _LoadBalancer(
+            input_type=Text, output_type=Text, endpoint="/predict", max_batch_size=2, timeout_batching=10
+        )
+        load_balancer._setup_async_primitives()
+        for i in range(3):
+            load_balancer._request_queue.put_nowait((str(i), i))
+
+        start = time.monotonic()
+        batch = await load_balancer._collect_batch()
+        assert batch == [("0", 0), ("1", 1)]
+        assert time.monotonic() - start < 1
+        assert load_balancer._request_queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_closes_at_timeout(self):
+        load_balancer = _LoadBalancer(
+            input_type=Text, output_type=Text, endpoint="/predict", max_batch_size=8, timeout_batching=0.05
+        )
+        load_balancer._setup_async_primitives()
+        load_balancer._request_queue.put_nowait(("0", 0))
+
+        batch = await load_balancer._collect_batch()
+        assert batch == [("0", 0)]
+
+    @pytest.mark.asyncio
+    @mock.patch.object(_LoadBalancer, "send_batch", new_callable=mock.AsyncMock)
+    async def test_consumer_waits_for_free_server(self, send_batch):
+        load_balancer = _LoadBalancer(
+            input_type=Text, output_type=Text, endpoint="/predict", max_batch_size=1, timeout_batching=0
+        )
+        load_balancer._server_status = {"http://server": ReplicaStatus("http://server", num_in_flight=1)}
+        load_balancer._setup_async_primitives()
+        load_balancer._request_queue.put_nowait(("0", 0))
+
+        consumer = asyncio.create_task(load_balancer.consumer())
+        await asyncio.sleep(0.01)
+        send_batch.assert_not_called()
+
+        load_balancer._server_status["http://server"].num_in_flight = 0
+        load_balancer._notify_server_available()
+        await asyncio.sleep(0.01)
+        send_batch.assert_called_once_with([("0", 0)], "http://server")
+        assert load_balancer._server_status["http://server"].num_in_flight == 1
+        consumer.cancel()
+
+
+class TestLoadBalancerConnectionPools:
+    @pytest.mark.asyncio
+    async def test_connection_pool_is_reused_and_closed(self):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict", connection_pool_limit=4)
+        pool = load_balancer._get_connection_pool("http://server")
+        assert load_balancer._get_connection_pool("http://server") is pool
+        assert pool.stats().dict() == {"limit": 4, "num_requests": 0, "num_errors": 0, "num_in_flight": 0}
+
+        await load_balancer._close_connection_pool("http://server")
+        assert pool.session.closed
+        assert load_balancer._connection_pools == {}
+
+    @pytest.mark.asyncio
+    async def test_deregistered_connection_pool_is_drained(self, monkeypatch):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict")
+        pool = load_balancer._get_connection_pool("http://server")
+        release = asyncio.Event()
+
+        class _Response:
+            status = 200
+            content_type = "application/json"
+
+            def raise_for_status(self):
+                pass
+
+            async def json(self):
+                return {"outputs": ["a"]}
+
+        @contextlib.asynccontextmanager
+        async def post(*_, **__):
+            await release.wait()
+            yield _Response()
+
+        monkeypatch.setattr(pool.session, "post", post)
+        request = asyncio.create_task(pool.post("/predict"))
+        await asyncio.sleep(0)
+
+        load_balancer._drain_connection_pool("http://server")
+        assert load_balancer._connection_pools == {}
+        await asyncio.sleep(0.01)
+        # the batch in flight completes on the pool of the de-registered replica
+        assert not pool.session.closed
+        release.set()
+        assert await request == {"outputs": ["a"]}
+        await asyncio.gather(*load_balancer._draining_pools)
+        assert pool.session.closed
+
+    @pytest.mark.asyncio
+    async def test_connection_pool_drain_timeout(self):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict")
+        pool = load_balancer._get_connection_pool("http://server")
+        pool.num_in_flight = 1
+        await pool.close(drain_timeout=0.01)
+        assert pool.session.closed
+
+    @pytest.mark.asyncio
+    async def test_send_batch_uses_connection_pool(self, monkeypatch):
+        load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict")
+        load_balancer._server_status = {"http://server": ReplicaStatus("http://server", num_in_flight=1)}
+        pool = load_balancer._get_connection_pool("http://server")
+        monkeypatch.setattr(pool, "post", mock.AsyncMock(return_value={"outputs": ["a", "b"]}))
+        futures = {}
+        for req_id in ("0", "1"):
+            futures[req_id] = asyncio.get_running_loop().create_future()
+            load_balancer._responses[req_id] = futures[req_id]
+
+        await load_balancer.send_batch([("0", "x"), ("1", "y")], "http://server")
+        pool.post.assert_called_once()
+        assert futures["0"].result() == "a"
+        assert futures["1"].result() == "b"
+        status = load_balancer._server_status["http://server"]
+        assert status.num_in_flight == 0
+        assert status.latency_ewma is not None
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_replica_is_not_preferred(monkeypatch):
+    load_balancer = _LoadBalancer(
+        input_type=Text, output_type=Text, endpoint="/predict", scheduling_policy="latency_ewma"
+    )
+    load_balancer._server_status = {
+        url: ReplicaStatus(url, num_in_flight=1) for url in ("http://broken", "http://healthy")
+    }
+    monkeypatch.setattr(
+        load_balancer, "_post_batch", mock.AsyncMock(side_effect=[RuntimeError("boom"), {"outputs": ["a"]}])
+    )
+    futures = {}
+    for req_id in ("0", "1"):
+        futures[req_id] = asyncio.get_running_loop().create_future()
+        load_balancer._responses[req_id] = futures[req_id]
+
+    await load_balancer.send_batch([("0", "x")], "http://broken")
+    assert isinstance(futures["0"].exception(), RuntimeError)
+    broken = load_balancer._server_status["http://broken"]
+    assert broken.num_in_flight == 0
+    assert broken.latency_ewma == load_balancer._timeout_inference_request
+
+    await load_balancer.send_batch([("1", "y")], "http://healthy")
+    # the replica failing fast doesn't receive the next batches
+    assert load_balancer._find_free_server() == "http://healthy"
+
+
+@pytest.mark.parametrize("max_batches_per_replica, expected", [(1, None), (2, "http://server")])
+def test_find_free_server_respects_max_batches_per_replica(max_batches_per_replica, expected):
+    load_balancer = _LoadBalancer(
+        input_type=Text, output_type=Text, endpoint="/predict", max_batches_per_replica=max_batches_per_replica
+    )
+    load_balancer._server_status = {"http://server": ReplicaStatus("http://server", num_in_flight=1)}
+    assert load_balancer._find_free_server() == expected
+
+
+@pytest.mark.asyncio
+async def test_binary_wire_format_falls_back_to_json(monkeypatch):
+    import aiohttp.client_exceptions
+
+    load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict", wire_format="binary")
+    pool = load_balancer._get_connection_pool("http://server")
+    rejected = aiohttp.client_exceptions.ClientResponseError(mock.MagicMock(), (), status=422)
+    monkeypatch.setattr(pool, "post", mock.AsyncMock(side_effect=[rejected, {"outputs": []}, {"outputs": []}]))
+    batch_request = _BatchRequestModel(inputs=[])
+
+    assert await load_balancer._post_batch(batch_request, "http://server") == {"outputs": []}
+    assert "data" in pool.post.call_args_list[0].kwargs
+    assert "json" in pool.post.call_args_list[1].kwargs
+    assert load_balancer._json_only_servers == {"http://server"}
+
+    # the server is remembered as JSON only
+    await load_balancer._post_batch(batch_request, "http://server")
+    assert pool.post.call_count == 3
+    assert "json" in pool.post.call_args_list[2].kwargs
+    await pool.close()
+
+
+def test_invalid_wire_format():
+    with pytest.raises(ValueError, match="`wire_format` must be one of"):
+        _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict", wire_format="msgpack")
+
+
+@pytest.mark.asyncio
+async def test_load_balancer_metrics():
+    load_balancer = _LoadBalancer(input_type=Text, output_type=Text, endpoint="/predict", max_batches_per_replica=2)
+    load_balancer._server_status = {
+        "http://a": ReplicaStatus("http://a", num_in_flight=2),
+        "http://b": ReplicaStatus("http://b", num_in_flight=0),
+    }
+    load_balancer._queue_wait.observe(0.1)
+    load_balancer._inference_latency.observe(0.5)
+
+    metrics = load_balancer._get_metrics()
+    assert metrics.queue_depth == 0
+    assert metrics.queue_wait["p95"] == 0.1
+    assert metrics.inference_latency["p95"] == 0.5
+    assert metrics.replica_utilization == {"http://a": 1.0, "http://b": 0.0}
+    assert metrics.utilization == 0.5
+
+    text = load_balancer._get_prometheus_metrics()
+    assert 'lightning_load_balancer_replica_utilization{replica="http://a"} 1.0' in text
+    assert "lightning_load_balancer_inference_latency_seconds_count 1" in text
+
+
+def test_autoscaler_passes_load_balancer_metrics_to_scale(monkeypatch):
+    monkeypatch.setattr(AutoScaler, "num_pending_works", 0)
+    monkeypatch.setattr(AutoScaler, "load_balancer_metrics", {"pending_requests": 3, "inference_latency": {"p95": 2.0}})
+    monkeypatch.setattr(AutoScaler, "scale", mock.MagicMock(return_value=0))
+
+    auto_scaler = AutoScaler(EmptyWork, min_replicas=0, max_replicas=4, scale_in_interval=0.001)
+    auto_scaler._last_autoscale = time.time() - 100000
+    auto_scaler.__dict__["load_balancer"] = mock.MagicMock()
+
+    auto_scaler.autoscale()
+    auto_scaler.scale.assert_called_once_with(
+        0, {"pending_requests": 3, "inference_latency": {"p95": 2.0}, "pending_works": 0}
+    )
+
+
+def test_autoscaler_skips_metrics_between_intervals(monkeypatch):
+    monkeypatch.setattr(AutoScaler, "scale", mock.MagicMock())
+    auto_scaler = AutoScaler(EmptyWork, scale_out_interval=100, scale_in_interval=100)
+    auto_scaler.__dict__["load_balancer"] = mock.MagicMock()
+
+    auto_scaler.autoscale()
+    auto_scaler.scale.assert_not_called()
+    auto_scaler.load_balancer.update_servers.assert_called_once()
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from lightning.app.components.serve.batching import _AdaptiveBatcher
+
+
+@pytest.mark.asyncio
+async def test_batcher_groups_concurrent_requests():
+    calls = []
+
+    def predict_batch(requests):
+        calls.append(list(requests))
+        return [request * 2 for request in requests]
+
+    batcher = _AdaptiveBatcher(predict_batch, max_batch_size=4, timeout_batching=0.1)
+    task = asyncio.create_task(batcher.run())
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+    task.cancel()
+
+    assert results == [0, 2, 4, 6]
+    assert calls == [[0, 1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_sheds_expired_requests():
+    batcher = _AdaptiveBatcher(lambda requests: requests, max_batch_size=2, timeout_batching=0)
+    expired = asyncio.create_task(batcher.submit("expired", timeout=-1))
+    alive = asyncio.create_task(batcher.submit("alive", timeout=10))
+    await asyncio.sleep(0)
+
+    await batcher.process_batch()
+    assert await alive == "alive"
+    with pytest.raises(HTTPException, match="deadline exceeded"):
+        await expired
+    assert batcher.num_expired == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_propagates_errors():
+    def predict_batch(requests):
+        raise ValueError("boom")
+
+    batcher = _AdaptiveBatcher(predict_batch, max_batch_size=1, timeout_batching=0)
+    request = asyncio.create_task(batcher.submit("x"))
+    await asyncio.sleep(0)
+    await batcher.process_batch()
+    with pytest.raises(ValueError, match="boom"):
+        await request
+
+
+def test_batcher_adapts_batch_size_to_target_latency():
+    batcher = _AdaptiveBatcher(lambda requests: requests, max_batch_size=4, timeout_batching=0, target_latency=0.1)
+    assert batcher.batch_size == 1
+
+    # full batches under the target grow the batch size up to max_batch_size
+    for _ in range(5):
+        batcher._adapt(batcher.batch_size, latency=0.01)
+    assert batcher.batch_size == 4
+
+    # a partial batch doesn't tell anything about the capacity
+    batcher._adapt(1, latency=0.01)
+    assert batcher.batch_size == 4
+
+    # exceeding the target halves the batch size
+    batcher._adapt(4, latency=0.2)
+    assert batcher.batch_size == 2
+    batcher._adapt(2, latency=0.2)
+    batcher._adapt(1, latency=0.2)
+    assert batcher.batch_size == 1
@@ -0,0 +1,41 @@
+from lightning.app.components.serve.metrics import _format_prometheus_metrics, _RollingSummary
+
+
+def test_rolling_summary_quantiles():
+    summary = _RollingSummary(window=10)
+    assert summary.quantiles(now=0) == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    for i in range(1, 101):
+        summary.observe(i, now=0)
+    assert summary.quantiles(now=0) == {"p50": 50, "p95": 95, "p99": 99}
+    assert summary.count == 100
+    assert summary.sum == 5050
+
+    # observations older than the window are evicted but still counted in the totals
+    summary.observe(1000, now=20)
+    assert summary.quantiles(now=20) == {"p50": 1000, "p95": 1000, "p99": 1000}
+    assert summary.count == 101
+
+
+def test_format_prometheus_metrics():
+    summary = _RollingSummary()
+    summary.observe(0.5)
+    text = _format_prometheus_metrics(
+        gauges=[("queue_depth", "Queued requests.", {(): 3}), ("utilization", "Busy slots.", {(("replica", "a"),): 1})],
+        summaries=[("latency_seconds", "Latency.", summary)],
+    )
+    assert text.splitlines() == [
+        "# HELP queue_depth Queued requests.",
+        "# TYPE queue_depth gauge",
+        "queue_depth 3",
+        "# HELP utilization Busy slots.",
+        "# TYPE utilization gauge",
+        'utilization{replica="a"} 1',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds summary",
+        'latency_seconds{quantile="0.5"} 0.5',
+        'latency_seconds{quantile="0.95"} 0.5',
+        'latency_seconds{quantile="0.99"} 0.5',
+        "latency_seconds_sum 0.5",
+        "latency_seconds_count 1",
+    ]
@@ -1,6 +1,16 @@
 import multiprocessing as mp
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
 from lightning.app.components import Image, Number, PythonServer
+from lightning.app.components.serve.wire_format import (
+    _BINARY_CONTENT_TYPE,
+    _decode_batch,
+    _encode_batch,
+    _HEADER_LENGTH,
+    _MAGIC,
+)
 from lightning.app.utilities.network import _configure_session, find_free_network_port
 
 
@@ -44,3 +54,81 @@ def test_number_sample_data():
     assert isinstance(data, dict)
     assert "prediction" in data
     assert data["prediction"] == 463
+
+
+def test_python_server_binary_wire_format():
+    server = SimpleServer(port=None)
+    server.setup()
+    fastapi_app = FastAPI()
+    server._attach_predict_fn(fastapi_app)
+    client = TestClient(fastapi_app)
+
+    headers = {"Content-Type": _BINARY_CONTENT_TYPE, "accept": _BINARY_CONTENT_TYPE}
+    response = client.post("/predict", content=_encode_batch({"payload": "test"}), headers=headers)
+    assert response.headers["content-type"] == _BINARY_CONTENT_TYPE
+    assert _decode_batch(response.content) == {"prediction": "test"}
+
+    response = client.post("/predict", content=b"invalid", headers=headers)
+    assert response.status_code == 400
+    response = client.post("/predict", content=_encode_batch({"payload": "test"})[:6], headers=headers)
+    assert response.status_code == 400
+    header = b'{"buffers": []}'
+    response = client.post("/predict", content=_MAGIC + _HEADER_LENGTH.pack(len(header)) + header, headers=headers)
+    assert response.status_code == 400
+
+    # JSON requests are still served by the regular endpoint
+    assert client.post("/predict", json={"payload": "test"}).json() == {"prediction": "test"}
+
+
+class BatchedServer(PythonServer):
+    def __init__(self):
+        super().__init__(max_batch_size=4, timeout_batching=0.05)
+        self.batch_sizes = []
+
+    def predict(self, data):
+        raise NotImplementedError
+
+    def predict_batch(self, inputs):
+        self.batch_sizes.append(len(inputs))
+        return [{"prediction": request.payload} for request in inputs]
+
+
+def test_python_server_predict_batch():
+    server = BatchedServer()
+    fastapi_app = FastAPI()
+    server._attach_predict_fn(fastapi_app)
+
+    with TestClient(fastapi_app) as client:
+        assert client.post("/predict", json={"payload": "test"}).json() == {"prediction": "test"}
+        response = client.post("/predict", json={"payload": "test"}, headers={"X-Request-Timeout": "-1"})
+        assert response.status_code == 408
+    assert server.batch_sizes == [1]
+
+
+def test_python_server_predict_batch_binary_timeout():
+    server = BatchedServer()
+    fastapi_app = FastAPI()
+    server._attach_predict_fn(fastapi_app)
+
+    headers = {"Content-Type": _BINARY_CONTENT_TYPE, "X-Request-Timeout": "-1"}
+    with TestClient(fastapi_app) as client:
+        response = client.post("/predict", content=_encode_batch({"payload": "test"}), headers=headers)
+        assert response.status_code == 408
+    assert server.batch_sizes == []
+
+
+class AsyncBatchedServer(PythonServer):
+    def __init__(self):
+        super().__init__(max_batch_size=4, timeout_batching=0.05)
+
+    async def predict(self, data):
+        return {"prediction": data.payload}
+
+
+def test_python_server_predict_batch_async_predict():
+    server = AsyncBatchedServer()
+    fastapi_app = FastAPI()
+    server._attach_predict_fn(fastapi_app)
+
+    with TestClient(fastapi_app) as client:
+        assert client.post("/predict", json={"payload": "test"}).json() == {"prediction": "test"}
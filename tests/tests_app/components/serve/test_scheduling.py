@@ -0,0 +1,47 @@
+import pytest
+
+from lightning.app.components.serve.scheduling import (
+    _get_scheduling_policy,
+    LatencyWeighted,
+    LeastOutstandingRequests,
+    PowerOfTwoChoices,
+    ReplicaStatus,
+)
+
+
+def test_least_outstanding_requests():
+    replicas = [ReplicaStatus("a", num_in_flight=2), ReplicaStatus("b", num_in_flight=0), ReplicaStatus("c", 1)]
+    assert LeastOutstandingRequests().select(replicas).url == "b"
+
+
+def test_power_of_two_choices():
+    replicas = [ReplicaStatus("a", num_in_flight=3), ReplicaStatus("b", num_in_flight=0)]
+    # with two replicas both are sampled, so the least loaded one always wins
+    for _ in range(10):
+        assert PowerOfTwoChoices().select(replicas).url == "b"
+    assert PowerOfTwoChoices().select(replicas[:1]).url == "a"
+
+
+def test_latency_weighted():
+    fast = ReplicaStatus("fast", num_in_flight=1, latency_ewma=0.1)
+    slow = ReplicaStatus("slow", num_in_flight=0, latency_ewma=1.0)
+    assert LatencyWeighted().select([fast, slow]).url == "fast"
+
+    unmeasured = ReplicaStatus("new", num_in_flight=0)
+    assert LatencyWeighted().select([fast, slow, unmeasured]).url == "new"
+
+
+def test_record_latency():
+    replica = ReplicaStatus("a")
+    replica.record_latency(1.0, alpha=0.5)
+    assert replica.latency_ewma == 1.0
+    replica.record_latency(2.0, alpha=0.5)
+    assert replica.latency_ewma == 1.5
+
+
+def test_get_scheduling_policy():
+    assert isinstance(_get_scheduling_policy("power_of_two"), PowerOfTwoChoices)
+    policy = LatencyWeighted()
+    assert _get_scheduling_policy(policy) is policy
+    with pytest.raises(ValueError, match="scheduling_policy must be"):
+        _get_scheduling_policy("round_robin")
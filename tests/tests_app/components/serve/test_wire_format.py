@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from lightning.app.components.serve.wire_format import (
+    _decode_batch,
+    _encode_batch,
+    _HEADER_LENGTH,
+    _INLINE_THRESHOLD,
+    _MAGIC,
+)
+
+
+def test_encode_decode_roundtrip():
+    large_string = "a" * (_INLINE_THRESHOLD + 1)
+    batch = {"inputs": [{"image": large_string, "raw": b"\x00\x01", "label": 1}, {"image": None, "text": "short"}]}
+    frame = _encode_batch(batch)
+    # the large string travels as a raw buffer instead of being part of the JSON header
+    assert large_string.encode() in frame
+    assert f'"{large_string}"'.encode() not in frame
+    assert _decode_batch(frame) == batch
+
+
+def test_decode_invalid_frame():
+    with pytest.raises(ValueError, match="isn't a binary batch frame"):
+        _decode_batch(b'{"inputs": []}')
+
+    frame = _encode_batch({"inputs": [b"data"]})
+    with pytest.raises(ValueError, match="truncated"):
+        _decode_batch(frame[:6])
+    with pytest.raises(ValueError, match="corrupted"):
+        _decode_batch(frame[:-1])
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        {"data": {"inputs": []}},
+        {"buffers": []},
+        {"buffers": [], "data": {"__lightning_buffer__": 0}},
+        {"buffers": None, "data": {}},
+        [],
+    ],
+)
+def test_decode_invalid_header(header):
+    header = json.dumps(header).encode()
+    with pytest.raises(ValueError, match="header of the binary batch frame is invalid"):
+        _decode_batch(_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
@@ -13,7 +13,8 @@ import aiohttp
 import pytest
 import requests
 from deepdiff import DeepDiff, Delta
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, WebSocketDisconnect
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from pydantic import BaseModel
 
@@ -22,6 +23,8 @@ from lightning.app import LightningApp, LightningFlow, LightningWork
 from lightning.app.api.http_methods import Post
 from lightning.app.core import api
 from lightning.app.core.api import (
+    _json_patch,
+    _StateBroadcaster,
     fastapi_service,
     global_app_state_store,
     register_global_routes,
@@ -207,6 +210,125 @@ def test_update_publish_state_and_maybe_refresh_ui():
     global_app_state_store.add("1234")
 
 
+def test_json_patch():
+    old = {"vars": {"a": 1, "b/c": [1, 2, 3], "d": {"e": 0}}, "flows": {}}
+    new = {"vars": {"a": 2, "b/c": [1, 4], "f": None}, "flows": {"x": {"list": [0, 1]}}}
+    assert _json_patch(old, old) == []
+    assert _json_patch(old, new) == [
+        {"op": "remove", "path": "/vars/d"},
+        {"op": "replace", "path": "/vars/a", "value": 2},
+        {"op": "replace", "path": "/vars/b~1c/1", "value": 4},
+        {"op": "remove", "path": "/vars/b~1c/2"},
+        {"op": "add", "path": "/vars/f", "value": None},
+        {"op": "add", "path": "/flows/x", "value": {"list": [0, 1]}},
+    ]
+    assert _json_patch([1], [1, 2, 3]) == [
+        {"op": "add", "path": "/-", "value": 2},
+        {"op": "add", "path": "/-", "value": 3},
+    ]
+
+
+@pytest.mark.anyio
+async def test_get_state_etag(monkeypatch):
+    """Tests that a client sending the ETag of the state it already has gets a 304 until the state changes."""
+    publish_state_queue = _MockQueue("publish_state_queue")
+    refresher = UIRefresher(publish_state_queue, _MockQueue("api_response_queue"))
+    headers = headers_for({"type": "DEFAULT"})
+
+    publish_state_queue.put(({"vars": {"counter": 0}}, None))
+    refresher.run_once()
+    async with AsyncClient(app=fastapi_service, base_url="http://test") as client:
+        response = await client.get("/api/v1/state", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await client.get("/api/v1/state", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+        publish_state_queue.put(({"vars": {"counter": 1}}, None))
+        refresher.run_once()
+        response = await client.get("/api/v1/state", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == {"vars": {"counter": 1}}
+        assert response.headers["ETag"] != etag
+
+    # the ETags of a previous process of the API server don't match
+    monkeypatch.setattr(api, "state_broadcaster", _StateBroadcaster())
+    publish_state_queue.put(({"vars": {"counter": 1}}, None))
+    refresher.run_once()
+    async with AsyncClient(app=fastapi_service, base_url="http://test") as client:
+        response = await client.get("/api/v1/state", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+
+
+def test_websocket_state_deltas(monkeypatch):
+    """Tests that the websocket sends the whole state and then the JSON patches of the following versions."""
+    monkeypatch.setattr(api, "ENABLE_STATE_WEBSOCKET", True)
+    state_broadcaster = _StateBroadcaster(max_patches=2)
+    monkeypatch.setattr(api, "state_broadcaster", state_broadcaster)
+    tag = state_broadcaster.tag
+    publish_state_queue = _MockQueue("publish_state_queue")
+    refresher = UIRefresher(publish_state_queue, _MockQueue("api_response_queue"))
+
+    def publish(state):
+        publish_state_queue.put((state, None))
+        refresher.run_once()
+
+    publish({"vars": {"counter": 0, "list": []}})
+    with TestClient(fastapi_service) as client:
+        with client.websocket_connect("/api/v1/ws?deltas=true") as websocket:
+            assert websocket.receive_json() == {"version": tag(1), "state": {"vars": {"counter": 0, "list": []}}}
+            publish({"vars": {"counter": 0, "list": []}})  # no changes, no new version
+            publish({"vars": {"counter": 1, "list": []}})
+            assert websocket.receive_json() == {
+                "version": tag(2),
+                "patch": [{"op": "replace", "path": "/vars/counter", "value": 1}],
+            }
+
+        publish({"vars": {"counter": 1, "list": [1]}})
+        publish({"vars": {"counter": 2, "list": [1]}})
+        # a client reconnecting gets the patches it missed
+        with client.websocket_connect(f"/api/v1/ws?deltas=true&version={tag(2)}") as websocket:
+            assert websocket.receive_json()["patch"] == [{"op": "add", "path": "/vars/list/-", "value": 1}]
+            assert websocket.receive_json()["patch"] == [{"op": "replace", "path": "/vars/counter", "value": 2}]
+
+        # or the whole state if they are no longer kept
+        with client.websocket_connect(f"/api/v1/ws?deltas=true&version={tag(1)}") as websocket:
+            assert websocket.receive_json() == {"version": tag(4), "state": {"vars": {"counter": 2, "list": [1]}}}
+
+        # or the whole state if the version comes from a previous process of the API server
+        with client.websocket_connect("/api/v1/ws?deltas=true&version=other-3") as websocket:
+            assert websocket.receive_json() == {"version": tag(4), "state": {"vars": {"counter": 2, "list": [1]}}}
+
+        # the clients not asking for deltas are only sent the version
+        with client.websocket_connect("/api/v1/ws") as websocket:
+            publish({"vars": {"counter": 3, "list": [1]}})
+            assert websocket.receive_text() == "5"
+
+    global_app_state_store.remove("1234")
+    global_app_state_store.add("1234")
+
+
+def test_websocket_state_updates_error(monkeypatch, caplog):
+    """Tests that the websocket is closed when sending the state updates fails."""
+    monkeypatch.setattr(api, "ENABLE_STATE_WEBSOCKET", True)
+    state_broadcaster = _StateBroadcaster()
+    monkeypatch.setattr(api, "state_broadcaster", state_broadcaster)
+    monkeypatch.setattr(state_broadcaster, "state_message", mock.Mock(side_effect=RuntimeError("boom")))
+    monkeypatch.setattr(api, "logger", logging.getLogger())
+
+    with TestClient(fastapi_service) as client, caplog.at_level(logging.ERROR):
+        with client.websocket_connect("/api/v1/ws?deltas=true") as websocket:
+            with pytest.raises(WebSocketDisconnect) as ex:
+                websocket.receive_json()
+    assert ex.value.code == 1011
+    assert "boom" in caplog.text
+
+
 @pytest.mark.parametrize("x_lightning_type", ["DEFAULT", "STREAMLIT"])
 @pytest.mark.anyio
 async def test_start_server(x_lightning_type, monkeypatch):
@@ -6,7 +6,7 @@ from time import sleep, time
 from unittest import mock
 
 import pytest
-from deepdiff import Delta
+from deepdiff import DeepDiff, Delta
 from pympler import asizeof
 from tests_app import _PROJECT_ROOT
 
@@ -23,6 +23,7 @@ from lightning.app.frontend import StreamlitFrontend
 from lightning.app.runners import MultiProcessRuntime
 from lightning.app.storage import Path
 from lightning.app.storage.path import _storage_root_dir
+from lightning.app.structures import Dict
 from lightning.app.testing.helpers import _RunIf
 from lightning.app.testing.testing import LightningTestApp
 from lightning.app.utilities.app_helpers import affiliation
@@ -458,6 +459,8 @@ def test_lightning_app_aggregation_speed(default_timeout, queue_type_cls: BaseQu
             return out
 
     app = LightningApp(EmptyFlow())
+    # fetch the deltas one by one so the time window is reached
+    app.state_accumulate_batch_size = 1
 
     app.delta_queue = SlowQueue("api_delta_queue", default_timeout)
     if queue_type_cls is RedisQueue:
@@ -497,6 +500,30 @@ def test_lightning_app_aggregation_empty():
     assert (time() - t0) < app.state_accumulate_wait
 
 
+def test_lightning_app_aggregation_batch_get():
+    """Verify the deltas are fetched with as few queue calls as possible."""
+
+    class CountingQueue(MultiProcessQueue):
+        num_calls = 0
+
+        def batch_get(self, max_items, timeout=None):
+            self.num_calls += 1
+            return super().batch_get(max_items, timeout=timeout)
+
+    app = LightningApp(EmptyFlow())
+    app.delta_queue = CountingQueue("api_delta_queue", STATE_UPDATE_TIMEOUT)
+    app.delta_queue.batch_put(
+        [_DeltaRequest(Delta({"values_changed": {"root['vars']['counter']": {"new_value": i}}})) for i in range(10)]
+    )
+    # Wait for a bit because multiprocessing.Queue doesn't run in the same thread and takes some time for writes
+    sleep(0.1)
+
+    deltas = app._collect_deltas_from_ui_and_work_queues()
+    assert len(deltas) == 10
+    # one call fetches all the deltas and the second one finds the queue empty
+    assert app.delta_queue.num_calls == 2
+
+
 class SimpleFlow2(LightningFlow):
     def __init__(self):
         super().__init__()
@@ -527,6 +554,76 @@ def test_maybe_apply_changes_from_flow():
     assert not app._has_updated
 
 
+class EmptyWork(LightningWork):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+
+    def run(self):
+        pass
+
+
+class FlowWithManyWorks(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.values = []
+        self.works_dict = Dict(**{f"work_{i}": EmptyWork() for i in range(3)})
+
+    def run(self):
+        pass
+
+
+@mock.patch("lightning.app.core.app.DeepDiff", wraps=DeepDiff)
+def test_maybe_apply_changes_only_diffs_changed_components(deep_diff_mock):
+    app = LightningApp(FlowWithManyWorks())
+    app.delta_queue = MultiProcessQueue("a", 0)
+    app.maybe_apply_changes()
+    # the first call diffs the whole state to take the snapshots of the components
+    assert deep_diff_mock.call_count == 1
+
+    def assert_updated(expected):
+        app._has_updated = False
+        app.maybe_apply_changes()
+        assert app._has_updated is expected
+        assert deep_diff_mock.call_count == 1
+
+    assert_updated(False)
+
+    # re-assigning the same value bumps the version but doesn't change the state
+    version = app.root._state_version
+    app.root.counter = 0
+    assert app.root._state_version == version + 1
+    assert_updated(False)
+
+    work = app.root.works_dict["work_1"]
+    work.counter = 1
+    assert_updated(True)
+    assert app.last_state["structures"]["works_dict"]["works"]["work_1"]["vars"]["counter"] == 1
+    assert_updated(False)
+
+    # in-place mutations don't go through ``__setattr__``
+    app.root.values.append(1)
+    assert_updated(True)
+    assert app.last_state["vars"]["values"] == [1]
+
+    work._calls["latest_call_hash"] = "abc"
+    assert_updated(True)
+    assert_updated(False)
+
+    app.stage = AppStage.STOPPING
+    assert_updated(True)
+
+    # adding a component falls back to diffing the whole state
+    version = app.root.works_dict._state_version
+    app.root.works_dict["work_3"] = EmptyWork()
+    assert app.root.works_dict._state_version == version + 1
+    app._has_updated = False
+    app.maybe_apply_changes()
+    assert app._has_updated
+    assert deep_diff_mock.call_count == 2
+
+
 class SimpleWork(LightningWork):
     def __init__(self):
         super().__init__(cache_calls=False, parallel=True)
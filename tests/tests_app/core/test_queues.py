@@ -1,6 +1,7 @@
 import multiprocessing
 import pickle
 import queue
+import threading
 import time
 from unittest import mock
 
@@ -10,7 +11,8 @@ import requests_mock
 from lightning.app import LightningFlow
 from lightning.app.core import queues
 from lightning.app.core.constants import HTTP_QUEUE_URL
-from lightning.app.core.queues import BaseQueue, QueuingSystem, READINESS_QUEUE_CONSTANT, RedisQueue
+from lightning.app.core.queues import BaseQueue, QueuingSystem, READINESS_QUEUE_CONSTANT, RedisQueue, SharedMemoryQueue
+from lightning.app.testing.http_queue_server import HTTPQueueServer
 from lightning.app.utilities.imports import _is_redis_available
 from lightning.app.utilities.redis import check_if_redis_running
 
@@ -127,6 +129,131 @@ def test_process_queue_read_timeout(queue_type, queue_process_mock, monkeypatch)
     assert queue_mocked.return_value.get.call_args_list[2] == mock.call(timeout=None, block=True)
 
 
+def test_multiprocess_queue_batch_get_put():
+    test_queue = QueuingSystem.MULTIPROCESS.get_readiness_queue()
+    test_queue.batch_put(list(range(5)))
+    # Wait for a bit because multiprocessing.Queue doesn't run in the same thread and takes some time for writes
+    time.sleep(0.1)
+    assert test_queue.batch_get(3, timeout=1) == [0, 1, 2]
+    assert test_queue.batch_get(10, timeout=1) == [3, 4]
+    with pytest.raises(queue.Empty):
+        test_queue.batch_get(10, timeout=0)
+
+
+def test_shared_memory_queue_batch_get_put():
+    test_queue = QueuingSystem.SHARED_MEMORY.get_readiness_queue()
+    assert isinstance(test_queue, SharedMemoryQueue)
+    test_queue.batch_put(list(range(5)))
+    assert test_queue.batch_get(3, timeout=1) == [0, 1, 2]
+    assert test_queue.batch_get(10, timeout=1) == [3, 4]
+    with pytest.raises(queue.Empty):
+        test_queue.batch_get(10, timeout=0)
+
+
+def test_shared_memory_queue_ring_buffer():
+    test_queue = SharedMemoryQueue("test_queue", default_timeout=0.001, capacity=1000)
+    # the records wrap around the end of the ring buffer many times
+    for i in range(100):
+        item = {"index": i, "payload": bytes([i]) * 200}
+        test_queue.put(item)
+        assert test_queue.get() == item
+
+    # the writers wait for the readers to make room
+    items = [bytes([i]) * 300 for i in range(10)]
+    thread = threading.Thread(target=test_queue.batch_put, args=(items,))
+    thread.start()
+    received = []
+    while len(received) < len(items):
+        received.extend(test_queue.batch_get(10, timeout=1))
+    thread.join()
+    assert received == items
+
+
+def test_shared_memory_queue_large_items():
+    test_queue = SharedMemoryQueue("test_queue", default_timeout=0.001, capacity=1000)
+    payload = bytearray(range(256)) * 1024
+    test_queue.put({"payload": pickle.PickleBuffer(payload), "b": 2})
+    with mock.patch.object(queues.shared_memory, "SharedMemory", wraps=queues.shared_memory.SharedMemory) as shm_mock:
+        item = test_queue.get()
+    assert item == {"payload": payload, "b": 2}
+    # the segment holding the item was released by the reader
+    (name,) = {call.kwargs["name"] for call in shm_mock.call_args_list}
+    with pytest.raises(FileNotFoundError):
+        queues.shared_memory.SharedMemory(name=name)
+
+
+def _put_items(test_queue, num_items):
+    for i in range(num_items):
+        test_queue.put({"index": i, "payload": pickle.PickleBuffer(bytearray([i % 256]) * 100_000)})
+
+
+def test_shared_memory_queue_across_processes():
+    test_queue = QueuingSystem.SHARED_MEMORY.get_queue("test_queue")
+    process = multiprocessing.get_context("spawn").Process(target=_put_items, args=(test_queue, 20))
+    process.start()
+    for i in range(20):
+        item = test_queue.get(timeout=30)
+        assert item["index"] == i
+        assert item["payload"] == bytearray([i % 256]) * 100_000
+    process.join()
+    assert process.exitcode == 0
+
+
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+@mock.patch("lightning.app.core.queues.redis.Redis")
+def test_redis_queue_batch_get_put(redis_mock):
+    redis_mock.return_value.rpush.return_value = 3
+    redis_mock.return_value.blpop.return_value = (b"READINESS_QUEUE", pickle.dumps(0))
+    redis_mock.return_value.pipeline.return_value.execute.return_value = ([pickle.dumps(1), pickle.dumps(2)], True)
+    redis_queue = QueuingSystem.REDIS.get_readiness_queue()
+
+    redis_queue.batch_put([0, 1, 2])
+    redis_mock.return_value.rpush.assert_called_once_with(
+        "READINESS_QUEUE", pickle.dumps(0, protocol=5), pickle.dumps(1, protocol=5), pickle.dumps(2, protocol=5)
+    )
+    # the length returned by RPUSH is used instead of a separate LLEN call
+    redis_mock.return_value.llen.assert_not_called()
+
+    assert redis_queue.batch_get(3, timeout=1) == [0, 1, 2]
+    pipeline = redis_mock.return_value.pipeline.return_value
+    pipeline.lrange.assert_called_once_with("READINESS_QUEUE", 0, 1)
+    pipeline.ltrim.assert_called_once_with("READINESS_QUEUE", 2, -1)
+
+
+@pytest.mark.skipif(not _is_redis_available(), reason="redis isn't installed.")
+def test_redis_queues_share_connection_pool():
+    first_queue = QueuingSystem.REDIS.get_readiness_queue()
+    second_queue = QueuingSystem.REDIS.get_delta_queue()
+    assert first_queue.redis.connection_pool is second_queue.redis.connection_pool
+
+    other_queue = RedisQueue(name="test_queue", default_timeout=1, host="other-host")
+    assert other_queue.redis.connection_pool is not first_queue.redis.connection_pool
+
+
+def test_queue_serialization_out_of_band_buffers():
+    # small items are plain pickles
+    value = queues._serialize({"a": 1})
+    assert value == pickle.dumps({"a": 1}, protocol=5)
+    assert queues._deserialize(value) == {"a": 1}
+
+    payload = bytearray(range(256)) * 1024
+    value = queues._serialize({"payload": pickle.PickleBuffer(payload), "b": 2})
+    assert value.startswith(queues._FRAME_MAGIC)
+    assert queues._deserialize(value) == {"payload": payload, "b": 2}
+
+
+@pytest.mark.skipif(not queues._is_zstandard_available(), reason="zstandard isn't installed.")
+def test_queue_serialization_compression():
+    item = {"text": "a" * 10_000}
+    value = queues._serialize(item, compression_threshold=1000)
+    assert value.startswith(queues._FRAME_MAGIC)
+    assert len(value) < 1000
+    assert queues._deserialize(value) == item
+
+    # the threshold isn't reached
+    assert queues._serialize(item, compression_threshold=100_000) == pickle.dumps(item, protocol=5)
+
+
 @pytest.mark.skipif(not check_if_redis_running(), reason="Redis is not running")
 @mock.patch("lightning.app.core.queues.WARNING_QUEUE_SIZE", 2)
 def test_redis_queue_warning():
@@ -199,6 +326,45 @@ class TestHTTPQueue:
 
         test_queue.put(test_obj)
 
+    def test_http_queue_batch_put_and_get(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        adapter.register_uri(
+            "POST",
+            f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pushmany",
+            status_code=201,
+            additional_matcher=lambda req: pickle.dumps(["a", "b"]) == req._request.body,
+        )
+        adapter.register_uri(
+            "POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pop", status_code=200, content=pickle.dumps("a")
+        )
+        adapter.register_uri(
+            "POST",
+            f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=popmany&count=9",
+            status_code=200,
+            content=pickle.dumps(["b"]),
+        )
+
+        test_queue.batch_put(["a", "b"])
+        assert test_queue.batch_get(10, timeout=0) == ["a", "b"]
+        assert test_queue._supports_batch_actions
+
+    def test_http_queue_batch_fallback(self, monkeypatch):
+        monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        adapter = requests_mock.Adapter()
+        test_queue.client.session.mount("http://", adapter)
+        adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=pushmany", status_code=400)
+        adapter.register_uri("POST", f"{HTTP_QUEUE_URL}/v1/test/http_queue?action=push", status_code=201)
+
+        test_queue.batch_put(["a", "b"])
+        assert not test_queue._supports_batch_actions
+        assert [r.qs["action"] for r in adapter.request_history] == [["pushmany"], ["push"], ["push"]]
+
     def test_http_queue_get(self, monkeypatch):
         monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
         test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
@@ -216,6 +382,26 @@ class TestHTTPQueue:
         assert test_queue.get() == "test"
 
 
+@pytest.mark.parametrize("long_poll", [True, False])
+def test_http_queue_long_poll(long_poll, monkeypatch):
+    with HTTPQueueServer(long_poll=long_poll) as server:
+        monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+        test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
+
+        with pytest.raises(queue.Empty):
+            test_queue.get(timeout=0.5)
+        assert test_queue._supports_long_poll is long_poll
+        num_requests = server.num_requests
+        if long_poll:
+            # the server held the request instead of being polled
+            assert num_requests <= 2
+        else:
+            assert num_requests > 1
+
+        threading.Timer(0.2, test_queue.put, args=("item",)).start()
+        assert test_queue.get(timeout=5) == "item"
+
+
 def test_unreachable_queue(monkeypatch):
     monkeypatch.setattr(queues, "HTTP_QUEUE_TOKEN", "test-token")
     test_queue = QueuingSystem.HTTP.get_queue(queue_name="test_http_queue")
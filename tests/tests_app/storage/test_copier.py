@@ -94,6 +94,8 @@ def test_copier_existence_check(tmpdir):
     copier.run_once()
     response = copy_response_queue.get()
     assert response.exists is True
+    # the locks of the copied files aren't kept
+    assert not copier._locks
 
 
 def test_copy_files(tmpdir):
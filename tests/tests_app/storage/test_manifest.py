@@ -0,0 +1,147 @@
+import json
+import os
+import pathlib
+from unittest import mock
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+
+from lightning.app.storage import manifest
+from lightning.app.storage.manifest import _chunk_path, _download_content_addressed, _upload_content_addressed
+from lightning.app.storage.path import Path
+from lightning.app.storage.requests import _GetRequest
+from lightning.app.testing.helpers import _MockQueue
+from lightning.app.utilities.component import _context
+
+
+@pytest.fixture()
+def shared_storage(tmpdir):
+    shared = pathlib.Path(tmpdir) / ".shared"
+    with mock.patch.dict(os.environ, {"SHARED_MOUNT_DIRECTORY": str(shared)}):
+        yield shared
+
+
+class _CountingFileSystem(LocalFileSystem):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_reads = 0
+
+    def cat_file(self, path, *args, **kwargs):
+        self.num_reads += 1
+        return super().cat_file(path, *args, **kwargs)
+
+
+def test_upload_content_addressed_skips_existing_chunks(shared_storage, tmpdir):
+    source = pathlib.Path(tmpdir) / "source"
+    source.mkdir()
+    (source / "a.bin").write_bytes(b"a" * 10 + b"b" * 10)
+    (source / "sub").mkdir()
+    (source / "sub" / "b.bin").write_bytes(b"b" * 10 + b"c" * 5)
+
+    manifest_path = shared_storage / "hash.manifest.json"
+    fs = LocalFileSystem()
+    with mock.patch.object(manifest, "_write", wraps=manifest._write) as write_mock:
+        size = _upload_content_addressed(source, manifest_path, fs, chunk_size=10)
+    # the chunk of b's shared by both files is only written once, plus the manifest
+    assert write_mock.call_count == 4
+    assert size == manifest_path.stat().st_size
+
+    content = json.loads(manifest_path.read_text())
+    assert content["is_dir"]
+    assert [entry["path"] for entry in content["files"]] == ["a.bin", os.path.join("sub", "b.bin")]
+    assert all(_chunk_path(digest).exists() for entry in content["files"] for digest in entry["chunks"])
+
+    # a second transfer of the same files only writes the manifest
+    with mock.patch.object(manifest, "_write", wraps=manifest._write) as write_mock:
+        _upload_content_addressed(source, manifest_path, fs, chunk_size=10)
+    assert write_mock.call_count == 1
+
+    # only the modified chunk is uploaded
+    (source / "a.bin").write_bytes(b"a" * 10 + b"d" * 10)
+    with mock.patch.object(manifest, "_write", wraps=manifest._write) as write_mock:
+        _upload_content_addressed(source, manifest_path, fs, chunk_size=10)
+    assert write_mock.call_count == 2
+
+
+def test_upload_content_addressed_removes_unreferenced_chunks(shared_storage, tmpdir):
+    source = pathlib.Path(tmpdir) / "source.bin"
+    other = pathlib.Path(tmpdir) / "other.bin"
+    source.write_bytes(b"a" * 10 + b"b" * 10 + b"c" * 10)
+    other.write_bytes(b"c" * 10)
+    fs = LocalFileSystem()
+    _upload_content_addressed(source, shared_storage / "source.manifest.json", fs, chunk_size=10)
+    _upload_content_addressed(other, shared_storage / "other.manifest.json", fs, chunk_size=10)
+    old_chunks = [_chunk_path(digest) for digest in manifest._file_chunk_digests(source, 10)]
+
+    source.write_bytes(b"a" * 10 + b"d" * 10)
+    _upload_content_addressed(source, shared_storage / "source.manifest.json", fs, chunk_size=10)
+    # the chunk of a's is still referenced, the one of c's by the other manifest
+    assert [chunk.exists() for chunk in old_chunks] == [True, False, True]
+
+
+def test_file_chunk_digests_cache_is_bounded(tmpdir, monkeypatch):
+    monkeypatch.setattr(manifest, "_digests_cache", manifest.OrderedDict())
+    monkeypatch.setattr(manifest, "_digests_cache_size", 2)
+    files = [pathlib.Path(tmpdir) / f"{i}.bin" for i in range(3)]
+    for file in files:
+        file.write_bytes(b"data")
+
+    manifest._file_chunk_digests(files[0], 10)
+    manifest._file_chunk_digests(files[1], 10)
+    # the least recently used file is evicted
+    manifest._file_chunk_digests(files[0], 10)
+    manifest._file_chunk_digests(files[2], 10)
+    assert [path for path, _ in manifest._digests_cache] == [str(files[0].absolute()), str(files[2].absolute())]
+
+
+def test_download_content_addressed_only_fetches_missing_chunks(shared_storage, tmpdir):
+    source = pathlib.Path(tmpdir) / "source"
+    source.mkdir()
+    (source / "a.bin").write_bytes(b"a" * 10 + b"b" * 10 + b"c" * 3)
+    manifest_path = shared_storage / "hash.manifest.json"
+    _upload_content_addressed(source, manifest_path, LocalFileSystem(), chunk_size=10)
+
+    destination = pathlib.Path(tmpdir) / "destination"
+    fs = _CountingFileSystem(skip_instance_cache=True)
+    _download_content_addressed(manifest_path, destination, fs)
+    assert (destination / "a.bin").read_bytes() == b"a" * 10 + b"b" * 10 + b"c" * 3
+    # the manifest and the three chunks
+    assert fs.num_reads == 4
+
+    # nothing is downloaded when the local copy is up to date
+    fs.num_reads = 0
+    _download_content_addressed(manifest_path, destination, fs)
+    assert fs.num_reads == 1
+
+    # only the changed chunk is downloaded and the files removed from the source are removed locally
+    (source / "a.bin").write_bytes(b"a" * 10 + b"d" * 10 + b"c" * 3)
+    (destination / "stale.bin").write_bytes(b"stale")
+    _upload_content_addressed(source, manifest_path, LocalFileSystem(), chunk_size=10)
+    fs.num_reads = 0
+    _download_content_addressed(manifest_path, destination, fs)
+    assert (destination / "a.bin").read_bytes() == b"a" * 10 + b"d" * 10 + b"c" * 3
+    assert not (destination / "stale.bin").exists()
+    assert fs.num_reads == 2
+
+
+def test_path_get_content_addressed(shared_storage, tmpdir):
+    source = pathlib.Path(tmpdir) / "source.txt"
+    source.write_text("content")
+    request_queue = _MockQueue()
+    response_queue = _MockQueue()
+    path = Path(tmpdir / "destination.txt")
+    path._attach_queues(request_queue, response_queue)
+    path._origin = "origin"
+    path._consumer = "consumer"
+
+    request = _GetRequest(source="origin", path=str(source), hash=path.hash, destination="consumer", name="")
+    with mock.patch("lightning.app.storage.path.STORAGE_CONTENT_ADDRESSED", True):
+        response = Path._handle_get_request(mock.Mock(), request)
+    assert response.exception is None
+    assert response.content_addressed
+    assert response.path == str(shared_storage.absolute() / f"{path.hash}.manifest.json")
+
+    response_queue.put(response)
+    with _context("work"):
+        path.get()
+    assert path.read_text() == "content"
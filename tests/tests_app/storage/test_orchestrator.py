@@ -1,8 +1,15 @@
+import threading
+import time
+from queue import Empty
 from unittest.mock import MagicMock
 
+from lightning.app.core import queues
+from lightning.app.core.queues import QueuingSystem
+from lightning.app.storage import orchestrator as orchestrator_module
 from lightning.app.storage.orchestrator import StorageOrchestrator
 from lightning.app.storage.requests import _GetRequest, _GetResponse
 from lightning.app.testing.helpers import _MockQueue
+from lightning.app.testing.http_queue_server import HTTPQueueServer
 from lightning.app.utilities.enum import WorkStageStatus
 
 
@@ -75,3 +82,151 @@ def test_orchestrator():
     assert all(len(queue) == 0 for queue in response_queues.values())
     assert all(len(queue) == 0 for queue in copy_request_queues.values())
     assert all(len(queue) == 0 for queue in copy_response_queues.values())
+
+
+def test_orchestrator_multiple_pending_requests():
+    """Test that a Work can have several requests pending at the same time and that the running orchestrator
+    forwards them as they arrive."""
+    names = ("work_a", "work_b", "work_c")
+    request_queues = {name: _MockQueue() for name in names}
+    response_queues = {name: _MockQueue() for name in names}
+    copy_request_queues = {name: _MockQueue() for name in names}
+    copy_response_queues = {name: _MockQueue() for name in names}
+    app = MagicMock()
+    work = MagicMock()
+    work.status.stage = WorkStageStatus.RUNNING
+    app.get_component_by_name = MagicMock(return_value=work)
+
+    orchestrator = StorageOrchestrator(
+        app,
+        request_queues=request_queues,
+        response_queues=response_queues,
+        copy_request_queues=copy_request_queues,
+        copy_response_queues=copy_response_queues,
+    )
+    orchestrator.start()
+    try:
+        # Work B requests files from Work A and Work C without waiting for the first response
+        request_a = _GetRequest(source="work_a", path="/a.txt", hash="a", destination="", name="")
+        request_c = _GetRequest(source="work_c", path="/c.txt", hash="c", destination="", name="")
+        request_queues["work_b"].put(request_a)
+        request_queues["work_b"].put(request_c)
+        _wait_for(lambda: len(copy_request_queues["work_a"]) == 1 and len(copy_request_queues["work_c"]) == 1)
+        assert sorted(orchestrator.waiting_for_response["work_b"]) == ["work_a", "work_c"]
+
+        for source in ("work_c", "work_a"):
+            request = copy_request_queues[source].get()
+            copy_response_queues[source].put(
+                _GetResponse(source=source, path=request.path, hash=request.hash, destination="work_b", name="")
+            )
+        _wait_for(lambda: len(response_queues["work_b"]) == 2)
+        assert sorted(response_queues["work_b"].get().hash for _ in range(2)) == ["a", "c"]
+        _wait_for(lambda: not orchestrator.waiting_for_response)
+    finally:
+        orchestrator.join(timeout=1)
+    assert not orchestrator.is_alive()
+
+
+def test_orchestrator_readers_exit():
+    """Test that the threads reading the queues exit with the orchestrator rather than block forever."""
+
+    class _BlockingQueue(_MockQueue):
+        def get(self, timeout=None):
+            # blocks forever without a timeout
+            threading.Event().wait(timeout)
+            raise Empty()
+
+    names = ("work_a", "work_b")
+    orchestrator = StorageOrchestrator(
+        MagicMock(),
+        request_queues={name: _BlockingQueue() for name in names},
+        response_queues={name: _MockQueue() for name in names},
+        copy_request_queues={name: _MockQueue() for name in names},
+        copy_response_queues={name: _BlockingQueue() for name in names},
+    )
+    orchestrator._read_timeout = 0.1
+    orchestrator.start()
+    _wait_for(lambda: len(orchestrator._readers) == 4)
+    orchestrator.join(timeout=1)
+    _wait_for(lambda: not set(orchestrator._readers.values()) & set(threading.enumerate()))
+
+
+def test_orchestrator_polls_queues_at_interval():
+    """Test that the queues which don't block are polled at an interval and that the copy responses of a Work are only
+    read while requests to it are pending."""
+
+    class _CountingQueue(_MockQueue):
+        num_gets = 0
+
+        def get(self, timeout=None):
+            self.num_gets += 1
+            return super().get(timeout)
+
+    names = ("work_a", "work_b")
+    request_queues = {name: _CountingQueue() for name in names}
+    copy_response_queues = {name: _CountingQueue() for name in names}
+    app = MagicMock()
+    app.get_component_by_name.return_value.status.stage = WorkStageStatus.RUNNING
+    orchestrator = StorageOrchestrator(
+        app,
+        request_queues=request_queues,
+        response_queues={name: _MockQueue() for name in names},
+        copy_request_queues={name: _MockQueue() for name in names},
+        copy_response_queues=copy_response_queues,
+    )
+    orchestrator.fs = MagicMock()
+    orchestrator.fs.exists.return_value = False
+    orchestrator.start()
+    try:
+        time.sleep(0.5)
+        assert 0 < request_queues["work_a"].num_gets <= 10
+        assert all(queue.num_gets == 0 for queue in copy_response_queues.values())
+
+        request_queues["work_b"].put(_GetRequest(source="work_a", path="/a.txt", hash="a", destination="", name=""))
+        _wait_for(lambda: copy_response_queues["work_a"].num_gets > 0)
+        copy_response_queues["work_a"].put(
+            _GetResponse(source="work_a", path="/a.txt", hash="a", destination="work_b", name="")
+        )
+        _wait_for(lambda: not orchestrator.waiting_for_response)
+        num_gets = copy_response_queues["work_a"].num_gets
+        time.sleep(0.3)
+        assert copy_response_queues["work_a"].num_gets <= num_gets + 1
+        assert copy_response_queues["work_b"].num_gets == 0
+    finally:
+        orchestrator.join(timeout=1)
+
+
+def test_orchestrator_idle_http_queue_calls(monkeypatch):
+    """Test that an idle orchestrator makes one long-poll call per request queue rather than one call per
+    second."""
+    monkeypatch.setattr(queues, "HTTP_QUEUE_LONG_POLL_TIMEOUT", 2.0)
+    monkeypatch.setattr(orchestrator_module, "HTTP_QUEUE_LONG_POLL_TIMEOUT", 2.0)
+    names = ("work_a", "work_b", "work_c")
+    with HTTPQueueServer(long_poll=True) as server:
+        monkeypatch.setattr(queues, "HTTP_QUEUE_URL", server.url)
+
+        def _queues(prefix):
+            return {name: QueuingSystem.HTTP.get_queue(queue_name=f"app_{prefix}_{name}") for name in names}
+
+        orchestrator = StorageOrchestrator(
+            MagicMock(),
+            request_queues=_queues("request"),
+            response_queues=_queues("response"),
+            copy_request_queues=_queues("copy_request"),
+            copy_response_queues=_queues("copy_response"),
+        )
+        orchestrator.start()
+        try:
+            _wait_for(lambda: len(orchestrator._readers) == 2 * len(names))
+            time.sleep(1.5)
+            # the copy response queues aren't read as no request is pending
+            assert server.num_requests <= len(names)
+        finally:
+            orchestrator.join(timeout=1)
+
+
+def _wait_for(condition, timeout: float = 5):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout
+        time.sleep(0.01)
@@ -0,0 +1,133 @@
+import os
+import pathlib
+from unittest import mock
+
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+
+import lightning.app.storage.transfer
+from lightning.app.storage import FileSystem, TransferProgress
+from lightning.app.storage.transfer import _get_file, _ranged_transfer
+
+
+class _InterruptedFileSystem(MemoryFileSystem):
+    """Fails to read the range starting at ``fail_at`` and counts the ranges read."""
+
+    def __init__(self, *args, fail_at=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_at = fail_at
+        self.starts = []
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        if start == self.fail_at:
+            raise ConnectionError("The connection was interrupted")
+        self.starts.append(start)
+        return super().cat_file(path, start=start, end=end, **kwargs)
+
+
+@pytest.fixture()
+def memory_fs():
+    fs = _InterruptedFileSystem(skip_instance_cache=True)
+    yield fs
+    fs.store.clear()
+    fs.pseudo_dirs[:] = [""]
+
+
+def test_ranged_transfer(memory_fs, tmpdir):
+    data = os.urandom(1000)
+    memory_fs.pipe_file("/source.bin", data)
+    destination = pathlib.Path(tmpdir) / "nested" / "destination.bin"
+    progress = TransferProgress()
+
+    _ranged_transfer(memory_fs, "/source.bin", destination, len(data), progress, chunk_size=100, num_workers=4)
+
+    assert destination.read_bytes() == data
+    assert sorted(memory_fs.starts) == list(range(0, 1000, 100))
+    assert progress.transferred_bytes == 1000
+    assert progress.resumed_bytes == 0
+    assert os.listdir(destination.parent) == ["destination.bin"]
+
+
+def test_ranged_transfer_resumes(memory_fs, tmpdir):
+    data = os.urandom(1050)
+    memory_fs.pipe_file("/source.bin", data)
+    destination = pathlib.Path(tmpdir) / "destination.bin"
+
+    memory_fs.fail_at = 500
+    progress = TransferProgress()
+    with pytest.raises(ConnectionError, match="interrupted"):
+        _ranged_transfer(memory_fs, "/source.bin", destination, len(data), progress, chunk_size=100, num_workers=1)
+    assert not destination.exists()
+    # the ranges before the failure were written, the next ones may have been too
+    interrupted_bytes = progress.transferred_bytes
+    assert interrupted_bytes >= 500
+    assert 500 not in memory_fs.starts
+
+    # only the ranges which weren't written are read again
+    memory_fs.fail_at = None
+    memory_fs.starts.clear()
+    progress = TransferProgress()
+    _ranged_transfer(memory_fs, "/source.bin", destination, len(data), progress, chunk_size=100, num_workers=4)
+    assert destination.read_bytes() == data
+    assert 500 in memory_fs.starts
+    assert not set(memory_fs.starts) & set(range(0, 500, 100))
+    assert progress.resumed_bytes == interrupted_bytes
+    assert progress.resumed_bytes + progress.transferred_bytes == 1050
+    assert os.listdir(tmpdir) == ["destination.bin"]
+
+
+def test_ranged_transfer_restarts_when_the_source_changed(memory_fs, tmpdir):
+    memory_fs.pipe_file("/source.bin", b"a" * 1000)
+    destination = pathlib.Path(tmpdir) / "destination.bin"
+    memory_fs.fail_at = 500
+    with pytest.raises(ConnectionError):
+        _ranged_transfer(memory_fs, "/source.bin", destination, 1000, TransferProgress(), chunk_size=100, num_workers=1)
+
+    # a new version of the file is written
+    memory_fs.pipe_file("/source.bin", b"b" * 1000)
+    memory_fs.fail_at = None
+    memory_fs.starts.clear()
+    progress = TransferProgress()
+    _ranged_transfer(memory_fs, "/source.bin", destination, 1000, progress, chunk_size=100, num_workers=4)
+    assert destination.read_bytes() == b"b" * 1000
+    assert len(memory_fs.starts) == 10
+    assert progress.resumed_bytes == 0
+
+
+def test_get_file_uses_ranges_for_large_files(memory_fs, tmpdir, monkeypatch):
+    monkeypatch.setattr(lightning.app.storage.transfer, "STORAGE_TRANSFER_CHUNK_SIZE", 100)
+    memory_fs.pipe_file("/small.bin", b"a" * 100)
+    memory_fs.pipe_file("/large.bin", b"b" * 250)
+    progress = TransferProgress()
+
+    with mock.patch.object(lightning.app.storage.transfer, "_ranged_transfer", wraps=_ranged_transfer) as ranged_mock:
+        _get_file(memory_fs, "/small.bin", pathlib.Path(tmpdir) / "small.bin", progress)
+        ranged_mock.assert_not_called()
+        _get_file(memory_fs, "/large.bin", pathlib.Path(tmpdir) / "large.bin", progress)
+        ranged_mock.assert_called_once()
+
+    assert (pathlib.Path(tmpdir) / "large.bin").read_bytes() == b"b" * 250
+    assert progress.num_files == 2
+    assert progress.total_bytes == progress.transferred_bytes == 350
+    assert progress.throughput > 0
+
+
+def test_filesystem_transfer_progress(tmpdir, monkeypatch):
+    monkeypatch.setattr(lightning.app.storage.transfer, "STORAGE_TRANSFER_CHUNK_SIZE", 100)
+    monkeypatch.setenv("SHARED_MOUNT_DIRECTORY", str(tmpdir / ".shared"))
+    source = pathlib.Path(tmpdir) / "checkpoints"
+    source.mkdir()
+    (source / "small.ckpt").write_bytes(b"a" * 10)
+    (source / "large.ckpt").write_bytes(os.urandom(1000))
+    fs = FileSystem()
+
+    progress = TransferProgress()
+    fs.put(str(source), "/checkpoints", progress=progress)
+    assert progress.num_files == 2
+    assert progress.transferred_bytes == 1010
+
+    progress = TransferProgress()
+    fs.get("/checkpoints", str(tmpdir / "copy"), progress=progress)
+    assert progress.num_files == 2
+    assert progress.transferred_bytes == 1010
+    assert (tmpdir / "copy" / "large.ckpt").read_binary() == (source / "large.ckpt").read_bytes()
@@ -0,0 +1,142 @@
+import os
+import pickle
+
+import pytest
+
+from lightning.app import LightningApp, LightningFlow, LightningWork
+from lightning.app.structures import List
+from lightning.app.utilities.checkpoint_log import _CheckpointLog
+
+
+class _Work(LightningWork):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.rows = list(range(1000))
+
+    def run(self):
+        pass
+
+
+class _Flow(LightningFlow):
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+        self.work = _Work()
+        self.dynamic = List()
+
+    def run(self):
+        pass
+
+
+def test_checkpoint_log_appends_changed_components(tmpdir):
+    app = LightningApp(_Flow())
+    log = _CheckpointLog(str(tmpdir))
+
+    base_path = log.append(app)
+    assert os.path.basename(base_path) == "log_0_base.pkl"
+
+    app.root.work.counter = 1
+    deltas_path = log.append(app)
+    assert os.path.basename(deltas_path) == "log_0_deltas.pkl"
+    with open(deltas_path, "rb") as f:
+        record = pickle.load(f)
+    # only the work which changed is written
+    assert list(record["components"]) == ["root.work"]
+    assert record["components"]["root.work"]["vars"]["counter"] == 1
+
+    # a snapshot without changes is a tiny record
+    size = os.path.getsize(deltas_path)
+    log.append(app)
+    assert os.path.getsize(deltas_path) - size < 200
+
+    app.root.counter = 2
+    app.root.work.rows.append(1000)
+    log.append(app)
+
+    assert log.version == 3
+    state = log.load()
+    assert state["vars"]["counter"] == 2
+    assert state["works"]["work"]["vars"]["counter"] == 1
+    assert state["works"]["work"]["vars"]["rows"][-1] == 1000
+    assert log.load(version=1)["vars"]["counter"] == 0
+    assert log.load(version=1)["works"]["work"]["vars"]["counter"] == 1
+    with pytest.raises(FileNotFoundError, match="The version `4` wasn't found"):
+        log.load(version=4)
+
+    # the log can be continued by another process
+    log = _CheckpointLog(str(tmpdir))
+    assert log.version == 3
+    app.root.work.counter = 5
+    log.append(app)
+    assert log.load()["works"]["work"]["vars"]["counter"] == 5
+
+
+def test_checkpoint_log_truncates_incomplete_record(tmpdir):
+    app = LightningApp(_Flow())
+    log = _CheckpointLog(str(tmpdir))
+    log.append(app)
+    app.root.counter = 1
+    deltas_path = log.append(app)
+    app.root.counter = 2
+    log.append(app)
+
+    # the last record was only partially written
+    with open(deltas_path, "r+b") as f:
+        f.truncate(os.path.getsize(deltas_path) - 10)
+
+    log = _CheckpointLog(str(tmpdir))
+    assert log.version == 1
+    app.root.counter = 3
+    log.append(app)
+    assert log.version == 2
+    assert log.load()["vars"]["counter"] == 3
+    assert log.load(version=1)["vars"]["counter"] == 1
+
+
+def test_checkpoint_log_with_dynamic_components(tmpdir):
+    app = LightningApp(_Flow())
+    log = _CheckpointLog(str(tmpdir))
+    log.append(app)
+
+    # the full state is written when components are added
+    app.root.dynamic.append(_Work())
+    log.append(app)
+    app.root.dynamic[0].counter = 3
+    log.append(app)
+
+    state = log.load()
+    assert state["structures"]["dynamic"]["works"]["0"]["vars"]["counter"] == 3
+
+
+def test_checkpoint_log_compaction(tmpdir):
+    app = LightningApp(_Flow())
+    log = _CheckpointLog(str(tmpdir), compaction_interval=3)
+    for i in range(8):
+        app.root.counter = i
+        log.append(app)
+        log.join()
+
+    # the records were folded into the bases of new generations and the previous generations removed
+    assert _CheckpointLog.generations(str(tmpdir)) == [2]
+    assert sorted(os.listdir(tmpdir)) == ["log_2_base.pkl", "log_2_deltas.pkl"]
+    assert log.load()["vars"]["counter"] == 7
+    assert log.load(version=6)["vars"]["counter"] == 6
+    with pytest.raises(FileNotFoundError):
+        log.load(version=2)
+
+
+def test_load_state_dict_from_incremental_checkpoints(tmpdir, monkeypatch):
+    monkeypatch.setenv("STORAGE_ROOT_DIR", str(tmpdir))
+    app = LightningApp(_Flow())
+    app.incremental_checkpointing = True
+    for i in range(5):
+        app.root.counter = i
+        app._dump_checkpoint()
+    assert not [f for f in os.listdir(app.checkpoint_dir) if f.startswith("v_")]
+
+    app = LightningApp(_Flow())
+    app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir)
+    assert app.root.counter == 4
+    app.load_state_dict_from_checkpoint_dir(app.checkpoint_dir, version=2)
+    assert app.root.counter == 2
@@ -18,7 +18,7 @@ from lightning.app.storage import Drive, Path
 from lightning.app.storage.path import _artifacts_path
 from lightning.app.storage.requests import _GetRequest
 from lightning.app.testing.helpers import _MockQueue, EmptyFlow
-from lightning.app.utilities.component import _convert_paths_after_init
+from lightning.app.utilities.component import _convert_paths_after_init, _sanitize_state
 from lightning.app.utilities.enum import AppStage, CacheCallsKeys, WorkFailureReasons, WorkStageStatus
 from lightning.app.utilities.exceptions import CacheMissException, ExitAppException
 from lightning.app.utilities.proxies import (
@@ -606,6 +606,72 @@ def test_work_state_observer():
     assert not observer._delta_memory
 
 
+def test_work_state_observer_compares_changed_attributes():
+    """Tests that the WorkStateObserver keeps the values of the work and only diffs the attributes which changed."""
+
+    class WorkWithContainers(LightningWork):
+        def __init__(self):
+            super().__init__()
+            self.list = [{"loss": 1.0}]
+            self.dict = {}
+
+        def run(self):
+            pass
+
+    work = WorkWithContainers()
+    delta_queue = _MockQueue()
+    observer = WorkStateObserver(work, delta_queue)
+    work._setattr_replacement = LightningWorkSetAttrProxy(
+        work=work, work_name="work_name", delta_queue=delta_queue, state_observer=observer
+    )
+    observer.run_once()
+    assert len(delta_queue) == 0
+
+    with mock.patch("lightning.app.utilities.proxies._sanitize_state", wraps=_sanitize_state) as sanitize_mock:
+        observer.run_once()
+    # the plain attributes were compared without being sanitized
+    assert all(name.startswith("_") for call in sanitize_mock.call_args_list for name in call.args[0])
+
+    work.list[0]["loss"] = 0.5
+    observer.run_once()
+    delta = delta_queue.get().delta.to_dict()
+    assert delta == {"values_changed": {"root['vars']['list'][0]['loss']": {"new_value": 0.5}}}
+
+    # the setattr proxy keeps the assigned value and only diffs the attribute being set
+    rows = []
+    work.dict = {"rows": rows}
+    assert work.dict["rows"] is rows
+    assert delta_queue.get().delta.to_dict() == {"dictionary_item_added": {"root['vars']['dict']['rows']": []}}
+
+    # a value mutated through a reference taken before it was assigned
+    rows.append(1)
+    observer.run_once()
+    assert observer._delta_memory == []
+    assert delta_queue.get().delta.to_dict() == {"iterable_item_added": {"root['vars']['dict']['rows'][0]": 1}}
+
+    # the values shared by several attributes stay shared
+    work.list = rows
+    delta_queue.get()
+    rows.append(2)
+    assert work.list is work.dict["rows"]
+    observer.run_once()
+    assert delta_queue.get().delta.to_dict() == {
+        "iterable_item_added": {"root['vars']['dict']['rows'][1]": 2, "root['vars']['list'][1]": 2}
+    }
+    assert len(delta_queue) == 0
+    assert observer._last_state == work.state
+
+    # a reassigned attribute is compared by equality again once its value was checked
+    work.list = list(range(10_000))
+    delta_queue.get()
+    observer.run_once()
+    assert "list" in observer._plain_vars
+    with mock.patch("lightning.app.utilities.proxies._sanitize_state", wraps=_sanitize_state) as sanitize_mock:
+        observer.run_once()
+    assert all("list" not in call.args[0] for call in sanitize_mock.call_args_list)
+    assert len(delta_queue) == 0
+
+
 class WorkState(LightningWork):
     def __init__(self):
         super().__init__(parallel=True)
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+from lightning.app.utilities.scheduler import SchedulerThread
+
+
+class _App:
+    def __init__(self):
+        self._schedules = {}
+        self.delta_queue = mock.MagicMock()
+
+
+def _add_schedule(app, scheduler, call_hash, name, cron_pattern, start_time):
+    app._schedules[call_hash] = {
+        "running": False,
+        "cron_pattern": cron_pattern,
+        "start_time": start_time.isoformat(),
+        "name": name,
+    }
+    scheduler.add_schedule(call_hash, app._schedules[call_hash])
+
+
+def test_scheduler_batches_the_due_schedules():
+    app = _App()
+    scheduler = SchedulerThread(app)
+    start_time = datetime.now() - timedelta(minutes=5, seconds=30)
+    _add_schedule(app, scheduler, "a", "root.a", "* * * * *", start_time)
+    _add_schedule(app, scheduler, "b", "root.a", "*/2 * * * *", start_time)
+    _add_schedule(app, scheduler, "c", "root.c", "* * * * *", start_time)
+    _add_schedule(app, scheduler, "d", "root.c", "@yearly", datetime.now())
+
+    scheduler.run_once()
+
+    app.delta_queue.batch_put.assert_called_once()
+    (component_deltas,) = app.delta_queue.batch_put.call_args.args
+    deltas = {component_delta.id: component_delta.delta.to_dict() for component_delta in component_deltas}
+    assert set(deltas) == {"root.a", "root.c"}
+    assert set(deltas["root.a"]["values_changed"]) == {
+        "root['calls']['scheduling']['a']['running']",
+        "root['calls']['scheduling']['b']['running']",
+    }
+    assert set(deltas["root.c"]["values_changed"]) == {"root['calls']['scheduling']['c']['running']"}
+
+    # the missed events are skipped, the next ones are in the future
+    assert all(next_event > datetime.now() for next_event, _ in scheduler._heap)
+    assert 0 < scheduler._time_to_next_event() <= 60
+    app.delta_queue.reset_mock()
+    scheduler.run_once()
+    app.delta_queue.batch_put.assert_not_called()
+
+
+def test_scheduler_wakes_up_for_new_schedules():
+    app = _App()
+    scheduler = SchedulerThread(app)
+    assert scheduler._time_to_next_event() is None
+    scheduler.start()
+    # a schedule which is already due wakes up the thread waiting without deadline
+    _add_schedule(app, scheduler, "a", "root.a", "* * * * *", datetime.now() - timedelta(minutes=2))
+    for _ in range(100):
+        if app.delta_queue.batch_put.called:
+            break
+        scheduler._exit_event.wait(0.05)
+    scheduler.join(timeout=5)
+    assert not scheduler.is_alive()
+    app.delta_queue.batch_put.assert_called_once()
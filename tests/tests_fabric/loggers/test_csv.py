@@ -94,3 +94,26 @@ def test_flush_n_steps(tmpdir):
     logger.save.assert_not_called()
     logger.log_metrics(metrics, step=1)
     logger.save.assert_called_once()
+
+
+def test_append_metrics_file(tmpdir):
+    """Test that the metrics are appended to the file and released, and that new keys are added to the header."""
+    logger = CSVLogger(tmpdir, flush_logs_every_n_steps=1)
+    path_csv = os.path.join(logger.log_dir, _ExperimentWriter.NAME_METRICS_FILE)
+    # a file left in the directory by a previous run is replaced
+    os.makedirs(logger.log_dir)
+    with open(path_csv, "w") as fp:
+        fp.write("old,step\n1,0\n")
+
+    logger.log_metrics({"a": 1}, step=0)
+    logger.log_metrics({"a": 2}, step=1)
+    assert logger.experiment.metrics == []
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["a,step", "1,0", "2,1"]
+
+    # the rows saved before a new key appears get an empty value for it
+    logger.log_metrics({"b": 3}, step=2)
+    logger.log_metrics({"a": 4, "b": 5}, step=3)
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["a,step,b", "1,0,", "2,1,", ",2,3", "4,3,5"]
+    assert os.listdir(logger.log_dir) == [_ExperimentWriter.NAME_METRICS_FILE]
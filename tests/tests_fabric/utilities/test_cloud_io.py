@@ -14,9 +14,11 @@
 import os
 
 import fsspec
+import pytest
+import torch
 from fsspec.implementations.local import LocalFileSystem
 
-from lightning.fabric.utilities.cloud_io import get_filesystem
+from lightning.fabric.utilities.cloud_io import _atomic_save, _load, get_filesystem
 
 
 def test_get_filesystem_custom_filesystem():
@@ -32,3 +34,41 @@ def test_get_filesystem_custom_filesystem():
 
 def test_get_filesystem_local_filesystem():
     assert isinstance(get_filesystem("tmpdir/tmp_file"), LocalFileSystem)
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise AttributeError("unpicklable")
+
+
+def test_atomic_save_local(tmpdir):
+    filepath = str(tmpdir / "model.ckpt")
+    _atomic_save({"weight": torch.ones(2)}, filepath)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(_load(filepath)["weight"], torch.ones(2))
+
+    # a failed save leaves the previous checkpoint in place and no temporary file
+    with pytest.raises(AttributeError, match="unpicklable"):
+        _atomic_save({"weight": torch.zeros(2), "other": _Unpicklable()}, filepath)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(_load(filepath)["weight"], torch.ones(2))
+
+
+def test_atomic_save_remote():
+    fs = fsspec.filesystem("memory")
+    _atomic_save({"weight": torch.ones(2)}, "memory://checkpoints/model.ckpt")
+    assert torch.equal(_load("memory://checkpoints/model.ckpt")["weight"], torch.ones(2))
+
+    # the file is only created once it was completely written
+    with pytest.raises(AttributeError, match="unpicklable"):
+        _atomic_save({"other": _Unpicklable()}, "memory://checkpoints/other.ckpt")
+    assert not fs.exists("/checkpoints/other.ckpt")
+
+    # the save doesn't join the transactions of the cached file system instance
+    with fs.transaction:
+        with fs.open("/checkpoints/pending.ckpt", "wb") as f:
+            f.write(b"pending")
+        with pytest.raises(AttributeError, match="unpicklable"):
+            _atomic_save({"other": _Unpicklable()}, "memory://checkpoints/other.ckpt")
+    assert fs.cat("/checkpoints/pending.ckpt") == b"pending"
+    fs.rm("/checkpoints", recursive=True)
@@ -0,0 +1,126 @@
+# Copyright The Lightning AI team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import fsspec
+import pytest
+import torch
+
+from lightning.fabric.plugins import DirectoryCheckpointIO
+from lightning.fabric.utilities.cloud_io import _load
+from lightning.fabric.utilities.tensor_directory import _is_tensor_directory
+
+
+def _checkpoint():
+    model = torch.nn.Sequential(torch.nn.Linear(3, 3), torch.nn.BatchNorm1d(3))
+    optimizer = torch.optim.Adam(model.parameters())
+    model(torch.randn(4, 3)).sum().backward()
+    optimizer.step()
+    return {
+        "state_dict": model.state_dict(),
+        "optimizer_states": [optimizer.state_dict()],
+        "epoch": 3,
+        "parameter": torch.nn.Parameter(torch.ones(2, dtype=torch.bfloat16)),
+        "empty": torch.empty(0, 2),
+    }
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_directory_checkpoint_io(tmpdir, mmap):
+    checkpoint = _checkpoint()
+    checkpoint_io = DirectoryCheckpointIO(mmap=mmap)
+    path = str(tmpdir / "model.ckpt")
+    checkpoint_io.save_checkpoint(checkpoint, path)
+    # the previous checkpoint is replaced
+    checkpoint_io.save_checkpoint(checkpoint, path)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert _is_tensor_directory(path)
+
+    loaded = checkpoint_io.load_checkpoint(path)
+    assert loaded.keys() == checkpoint.keys()
+    for key, tensor in checkpoint["state_dict"].items():
+        assert torch.equal(loaded["state_dict"][key], tensor)
+    # the metadata of the state dict is kept
+    assert loaded["state_dict"]._metadata == checkpoint["state_dict"]._metadata
+    torch.nn.Sequential(torch.nn.Linear(3, 3), torch.nn.BatchNorm1d(3)).load_state_dict(loaded["state_dict"])
+    exp_avg = loaded["optimizer_states"][0]["state"][0]["exp_avg"]
+    assert torch.equal(exp_avg, checkpoint["optimizer_states"][0]["state"][0]["exp_avg"])
+    assert loaded["epoch"] == 3
+    assert isinstance(loaded["parameter"], torch.nn.Parameter)
+    assert loaded["parameter"].dtype == torch.bfloat16
+    assert loaded["empty"].shape == (0, 2)
+
+    # the loaded tensors can be modified without changing the checkpoint
+    loaded["state_dict"]["0.weight"].add_(1)
+    assert torch.equal(_load(path)["state_dict"]["0.weight"], checkpoint["state_dict"]["0.weight"])
+
+
+def test_directory_checkpoint_io_partial_load(tmpdir):
+    checkpoint = _checkpoint()
+    # the views of the same tensor are saved once
+    checkpoint["state_dict"]["tied.weight"] = checkpoint["state_dict"]["0.weight"]
+    path = str(tmpdir / "model.ckpt")
+    checkpoint_io = DirectoryCheckpointIO()
+    checkpoint_io.save_checkpoint(checkpoint, path)
+    assert len(os.listdir(os.path.join(path, "tensors"))) == 7 + 12 + 2
+
+    loaded = checkpoint_io.load_checkpoint(path, keys=["state_dict", "epoch"])
+    assert list(loaded) == ["state_dict", "epoch"]
+    assert loaded["state_dict"]["tied.weight"] is loaded["state_dict"]["0.weight"]
+
+    # the checkpoint files can be loaded too
+    torch.save(checkpoint, str(tmpdir / "file.ckpt"))
+    assert list(checkpoint_io.load_checkpoint(str(tmpdir / "file.ckpt"), keys=["epoch"])) == ["epoch"]
+
+
+def test_directory_checkpoint_io_map_location(tmpdir):
+    path = str(tmpdir / "model.ckpt")
+    DirectoryCheckpointIO().save_checkpoint({"weight": torch.ones(2)}, path)
+    assert _load(path, map_location="meta")["weight"].is_meta
+    assert _load(path, map_location={"cpu": "meta"})["weight"].is_meta
+    assert _load(path, map_location=lambda storage, loc: storage)["weight"].device == torch.device("cpu")
+
+
+def test_directory_checkpoint_io_remote():
+    fs = fsspec.filesystem("memory")
+    checkpoint_io = DirectoryCheckpointIO()
+    checkpoint_io.save_checkpoint({"weight": torch.ones(2), "epoch": 1}, "memory://checkpoints/model.ckpt")
+    assert fs.exists("/checkpoints/model.ckpt/index.pt")
+    loaded = checkpoint_io.load_checkpoint("memory://checkpoints/model.ckpt")
+    assert torch.equal(loaded["weight"], torch.ones(2))
+    assert loaded["epoch"] == 1
+    checkpoint_io.remove_checkpoint("memory://checkpoints/model.ckpt")
+    assert not fs.exists("/checkpoints/model.ckpt")
+
+
+def test_directory_checkpoint_io_remote_overwrite(monkeypatch):
+    """Test that overwriting a remote checkpoint keeps the previous one loadable until the new index is written."""
+    fs = fsspec.filesystem("memory")
+    checkpoint_io = DirectoryCheckpointIO()
+    path = "memory://checkpoints/overwrite.ckpt"
+    checkpoint_io.save_checkpoint({"weight": torch.zeros(2)}, path)
+
+    def failing_save(*_, **__):
+        raise RuntimeError("interrupted")
+
+    monkeypatch.setattr(torch, "save", failing_save)
+    with pytest.raises(RuntimeError, match="interrupted"):
+        checkpoint_io.save_checkpoint({"weight": torch.ones(2)}, path)
+    monkeypatch.undo()
+    assert torch.equal(checkpoint_io.load_checkpoint(path)["weight"], torch.zeros(2))
+
+    checkpoint_io.save_checkpoint({"weight": torch.ones(2)}, path)
+    assert torch.equal(checkpoint_io.load_checkpoint(path)["weight"], torch.ones(2))
+    # the tensors of the previous checkpoints are removed
+    assert len(fs.ls("/checkpoints/overwrite.ckpt")) == 2
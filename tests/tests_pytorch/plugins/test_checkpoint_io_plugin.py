@@ -12,18 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 import torch
 
-from lightning.fabric.plugins import CheckpointIO, TorchCheckpointIO
+from lightning.fabric.plugins import CheckpointIO, DirectoryCheckpointIO, TorchCheckpointIO
 from lightning.fabric.utilities.types import _PATH
 from lightning.pytorch import Trainer
 from lightning.pytorch.callbacks import ModelCheckpoint
 from lightning.pytorch.demos.boring_classes import BoringModel
 from lightning.pytorch.plugins.io.async_plugin import AsyncCheckpointIO
+from lightning.pytorch.plugins.io.delta_plugin import DeltaCheckpointIO
 from lightning.pytorch.strategies import SingleDeviceStrategy
 
 
@@ -150,3 +154,247 @@ def test_multi_wrapped_checkpoint_io_initialization():
     assert isinstance(ckpt_io.checkpoint_io.checkpoint_io, TorchCheckpointIO)
     assert ckpt_io._base_checkpoint_io_configured is True
     assert ckpt_io.checkpoint_io._base_checkpoint_io_configured is True
+
+
+def test_async_checkpoint_io_snapshot():
+    """Test that the snapshot copies the tensors to staging buffers which are reused by the next saves."""
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    release = threading.Event()
+    saved = []
+    saved_metadata = []
+
+    def save_checkpoint(checkpoint, path, storage_options=None):
+        release.wait(5)
+        weight = checkpoint["state_dict"]["weight"]
+        saved.append((checkpoint["epoch"], weight.clone(), weight))
+        saved_metadata.append(getattr(checkpoint["state_dict"], "_metadata", None))
+
+    base_ckpt_io.save_checkpoint.side_effect = save_checkpoint
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io, snapshot=True, max_pending_saves=1)
+    weight = torch.zeros(3)
+    state_dict = OrderedDict(weight=weight)
+    state_dict._metadata = {"": {"version": 1}}
+    ckpt_io.save_checkpoint({"state_dict": state_dict, "epoch": 0}, "first.ckpt")
+    assert ckpt_io.num_pending_saves == 1
+    assert ckpt_io.last_snapshot_duration is not None
+
+    # the training updates the tensors while the checkpoint is saved
+    weight.add_(1)
+    release.set()
+    ckpt_io.save_checkpoint({"state_dict": state_dict, "epoch": 1}, "second.ckpt")
+    ckpt_io.teardown()
+    assert ckpt_io.num_pending_saves == 0
+    assert ckpt_io.last_save_duration is not None
+
+    (epoch_0, value_0, buffer_0), (epoch_1, value_1, buffer_1) = saved
+    assert (epoch_0, epoch_1) == (0, 1)
+    assert torch.equal(value_0, torch.zeros(3))
+    assert torch.equal(value_1, torch.ones(3))
+    # the second save waited for the first one and reused its staging buffer
+    assert buffer_0 is buffer_1
+    assert buffer_1 is not weight
+    # the module versions read by `load_state_dict` are kept
+    assert saved_metadata == [{"": {"version": 1}}] * 2
+
+
+def test_async_checkpoint_io_snapshot_pending_saves():
+    """Test that the snapshots are bounded by default and that a failed snapshot doesn't hold a pending save slot."""
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io, snapshot=True)
+    assert ckpt_io._pending_saves_slots is not None
+
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io, snapshot=True, max_pending_saves=1)
+    with patch("lightning.pytorch.plugins.io.async_plugin._snapshot", side_effect=RuntimeError("out of memory")):
+        with pytest.raises(RuntimeError, match="out of memory"):
+            ckpt_io.save_checkpoint({"weight": torch.zeros(3)}, "first.ckpt")
+    assert ckpt_io.num_pending_saves == 0
+    # the slot was released, so this save doesn't block
+    ckpt_io.save_checkpoint({"weight": torch.zeros(3)}, "second.ckpt")
+    ckpt_io.teardown()
+    assert base_ckpt_io.save_checkpoint.call_count == 1
+
+
+def test_async_checkpoint_io_max_pending_saves():
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    release = threading.Event()
+    base_ckpt_io.save_checkpoint.side_effect = lambda *_, **__: release.wait(5)
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io, max_pending_saves=2)
+    ckpt_io.save_checkpoint({}, "first.ckpt")
+    ckpt_io.save_checkpoint({}, "second.ckpt")
+    assert ckpt_io.num_pending_saves == 2
+
+    # the third save blocks until a pending save completes
+    third_save = threading.Thread(target=ckpt_io.save_checkpoint, args=({}, "third.ckpt"))
+    third_save.start()
+    third_save.join(0.2)
+    assert third_save.is_alive()
+    release.set()
+    third_save.join(5)
+    assert not third_save.is_alive()
+    ckpt_io.teardown()
+    assert base_ckpt_io.save_checkpoint.call_count == 3
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        AsyncCheckpointIO(max_pending_saves=0)
+
+
+def test_async_checkpoint_io_raises_save_errors():
+    base_ckpt_io = Mock(spec=CheckpointIO)
+    base_ckpt_io.save_checkpoint.side_effect = RuntimeError("disk full")
+    ckpt_io = AsyncCheckpointIO(base_ckpt_io)
+    ckpt_io.save_checkpoint({}, "first.ckpt")
+    ckpt_io._executor.submit(lambda: None).result()
+    with pytest.raises(RuntimeError, match="disk full"):
+        ckpt_io.save_checkpoint({}, "second.ckpt")
+    assert base_ckpt_io.save_checkpoint.call_count == 1
+
+
+def test_directory_checkpoint_io(tmpdir):
+    """Test that the checkpoints saved as directories are removed, resumed from and loaded like the files."""
+    ck = ModelCheckpoint(dirpath=tmpdir, save_top_k=1, monitor="step", mode="max")
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[DirectoryCheckpointIO()],
+        callbacks=ck,
+        max_epochs=2,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    trainer.fit(BoringModel())
+    ckpt_files = {fn.name for fn in Path(tmpdir).glob("*.ckpt")}
+    assert ckpt_files == {"epoch=1-step=2.ckpt"}
+    assert os.path.isdir(ck.best_model_path)
+
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=3, limit_train_batches=1, limit_val_batches=0)
+    trainer.fit(BoringModel(), ckpt_path=ck.best_model_path)
+    assert trainer.global_step == 3
+
+    model = BoringModel.load_from_checkpoint(ck.best_model_path)
+    state_dict = DirectoryCheckpointIO().load_checkpoint(ck.best_model_path, keys=["state_dict"])["state_dict"]
+    assert all(torch.equal(model.state_dict()[key], tensor) for key, tensor in state_dict.items())
+
+
+def _saved_tensors(path):
+    return [value for value in torch.load(str(path))["state_dict"].values() if isinstance(value, torch.Tensor)]
+
+
+def test_delta_checkpoint_io(tmpdir):
+    """Test that only the tensors which changed since the base are saved, and that the bases are consolidated and
+    removed."""
+    ckpt_io = DeltaCheckpointIO(TorchCheckpointIO(), consolidate_every_n_saves=2)
+    frozen, head = torch.ones(3), torch.zeros(3)
+    step = torch.tensor(1.0)
+
+    def _save(name):
+        state_dict = {"frozen": frozen, "head": head}
+        ckpt_io.save_checkpoint({"state_dict": state_dict, "steps": [step, step.clone()]}, str(tmpdir / name))
+
+    _save("0.ckpt")
+    (base_0,) = [f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]
+    assert _saved_tensors(tmpdir / "0.ckpt") == []
+    head.add_(2)
+    _save("1.ckpt")
+    (saved,) = _saved_tensors(tmpdir / "1.ckpt")
+    assert torch.equal(saved, head)
+
+    # the checkpoints are restored with the tensors of their base
+    checkpoint = ckpt_io.load_checkpoint(str(tmpdir / "1.ckpt"))
+    assert "delta_checkpoint" not in checkpoint
+    assert torch.equal(checkpoint["state_dict"]["frozen"], frozen)
+    assert torch.equal(checkpoint["state_dict"]["head"], head)
+    # the tensors with the same content aren't shared
+    step_0, step_1 = checkpoint["steps"]
+    assert torch.equal(step_0, step) and step_0 is not step_1
+
+    # a new base is saved every 2 checkpoints, the previous one is removed with its checkpoints
+    _save("2.ckpt")
+    bases = [f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]
+    assert len(bases) == 2
+    ckpt_io.remove_checkpoint(str(tmpdir / "0.ckpt"))
+    assert len([f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]) == 2
+    ckpt_io.remove_checkpoint(str(tmpdir / "1.ckpt"))
+    assert base_0 not in os.listdir(tmpdir)
+    assert torch.equal(ckpt_io.load_checkpoint(str(tmpdir / "2.ckpt"))["state_dict"]["head"], head)
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        DeltaCheckpointIO(consolidate_every_n_saves=0)
+
+
+def test_delta_checkpoint_io_directories(tmpdir):
+    """Test that the checkpoints saved in different directories reference a base in their own directory."""
+    ckpt_io = DeltaCheckpointIO(TorchCheckpointIO())
+    weight = torch.ones(3)
+    ckpt_io.save_checkpoint({"weight": weight}, str(tmpdir / "a" / "0.ckpt"))
+    ckpt_io.save_checkpoint({"weight": weight}, str(tmpdir / "b" / "0.ckpt"))
+    for dirname in ("a", "b"):
+        assert len([f for f in os.listdir(tmpdir / dirname) if f.startswith(".delta-base-")]) == 1
+        assert torch.equal(ckpt_io.load_checkpoint(str(tmpdir / dirname / "0.ckpt"))["weight"], weight)
+
+
+def test_delta_checkpoint_io_previous_run(tmpdir):
+    """Test that the bases saved by a previous run are removed with their checkpoints."""
+    ckpt_io = DeltaCheckpointIO(TorchCheckpointIO())
+    ckpt_io.save_checkpoint({"weight": torch.ones(3)}, str(tmpdir / "0.ckpt"))
+    (base_0,) = [f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]
+    torch.save({"tensors": {}}, str(tmpdir / ".delta-base-unreferenced.pt"))
+
+    # the bases which no checkpoint references anymore are removed when the directory is first used, without loading
+    # the checkpoints to find their base
+    torch_io = TorchCheckpointIO()
+    torch_io.load_checkpoint = Mock(wraps=torch_io.load_checkpoint)
+    ckpt_io = DeltaCheckpointIO(torch_io)
+    ckpt_io.save_checkpoint({"weight": torch.zeros(3)}, str(tmpdir / "1.ckpt"))
+    torch_io.load_checkpoint.assert_not_called()
+    assert ".delta-base-unreferenced.pt" not in os.listdir(tmpdir)
+    assert base_0 in os.listdir(tmpdir)
+    ckpt_io.remove_checkpoint(str(tmpdir / "0.ckpt"))
+    assert base_0 not in os.listdir(tmpdir)
+    (base_1,) = [f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]
+
+    # the bases of the checkpoints removed without the plugin are removed too
+    os.remove(tmpdir / "1.ckpt")
+    ckpt_io = DeltaCheckpointIO(TorchCheckpointIO())
+    ckpt_io.save_checkpoint({"weight": torch.zeros(3)}, str(tmpdir / "2.ckpt"))
+    assert base_1 not in os.listdir(tmpdir)
+    assert torch.equal(ckpt_io.load_checkpoint(str(tmpdir / "2.ckpt"))["weight"], torch.zeros(3))
+
+
+def test_delta_checkpoint_io_trainer(tmpdir):
+    """Test that the delta checkpoints are resumed from and loaded without the plugin."""
+
+    class FrozenBackboneModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.backbone = torch.nn.Linear(32, 32)
+            self.backbone.requires_grad_(False)
+
+        def forward(self, x):
+            return self.layer(self.backbone(x))
+
+    ck = ModelCheckpoint(dirpath=tmpdir, save_top_k=1, monitor="step", mode="max")
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[DeltaCheckpointIO(consolidate_every_n_saves=2)],
+        callbacks=ck,
+        max_epochs=4,
+        limit_train_batches=1,
+        limit_val_batches=0,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    model = FrozenBackboneModel()
+    trainer.fit(model)
+    assert {fn.name for fn in Path(tmpdir).glob("*.ckpt")} == {"epoch=3-step=4.ckpt"}
+    # the base of the removed checkpoints was removed
+    assert len([f for f in os.listdir(tmpdir) if f.startswith(".delta-base-")]) == 1
+    # the frozen weights reference the base
+    assert not isinstance(torch.load(ck.best_model_path)["state_dict"]["backbone.weight"], torch.Tensor)
+
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=5, limit_train_batches=1, limit_val_batches=0)
+    trainer.fit(FrozenBackboneModel(), ckpt_path=ck.best_model_path)
+    assert trainer.global_step == 5
+
+    loaded = FrozenBackboneModel.load_from_checkpoint(ck.best_model_path)
+    assert torch.equal(loaded.backbone.weight, model.backbone.weight)